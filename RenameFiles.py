@@ -5,13 +5,17 @@ Enhanced GUI version with interactive preview and drag-and-drop ordering
 Refactored for better maintainability and organization
 """
 
-# Simplified: assume running as script from project root with package modules
-try:
-    from modules.main_application import main as app_main
-except ImportError as e:
-    print('Import error starting application:', e)
-    raise
+import sys
+
 
 if __name__ == '__main__':
+    # Simplified: assume running as script from project root with package modules.
+    # Imported here so that merely importing this launcher doesn't load Qt.
+    try:
+        from modules.main_application import main as app_main
+    except ImportError as e:
+        print('Import error starting application:', e)
+        raise
+
     print('🖼️ Starting GUI...')
-    app_main()
+    sys.exit(app_main())
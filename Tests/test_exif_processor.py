@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Unit tests for modules/exif_processor.py
+"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.exif_processor import _parse_exif_datetime
+
+
+# ---------------------------------------------------------------------------
+# EXIF datetime parsing
+# ---------------------------------------------------------------------------
+class TestParseExifDatetime:
+    """The sliced fast path agrees with strptime."""
+
+    @pytest.mark.parametrize("value", [
+        "2024:06:15 10:00:00",
+        "2024:06:15",
+        "2024:6:5 1:02:03",
+    ])
+    def test_matches_strptime(self, value):
+        fmt = '%Y:%m:%d %H:%M:%S' if ' ' in value else '%Y:%m:%d'
+        assert _parse_exif_datetime(value) == datetime.datetime.strptime(value, fmt)
+
+    @pytest.mark.parametrize("value", ["2024:13:15 10:00:00", "2024:06:15 10:0a:00", "garbage"])
+    def test_invalid_raises(self, value):
+        with pytest.raises(ValueError):
+            _parse_exif_datetime(value)
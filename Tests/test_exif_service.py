@@ -6,6 +6,7 @@ Tests the ExifService wrapper with mocked ExifTool calls,
 verifying caching, cleanup, selective extraction, and error handling.
 """
 
+import json
 import os
 import sys
 import pytest
@@ -93,9 +94,9 @@ class TestExifServiceCache:
         test_file = tmp_path / "photo.jpg"
         test_file.write_bytes(b"\xff\xd8")  # minimal content
 
-        # Build the same cache key the service uses: (path, mtime, method)
-        mtime = os.path.getmtime(str(test_file))
-        cache_key = (str(test_file), mtime, "exiftool")
+        # Build the same cache key the service uses: (path, size, mtime, method)
+        st = os.stat(str(test_file))
+        cache_key = (str(test_file), st.st_size, st.st_mtime, "exiftool")
         service._cache[cache_key] = ("20240615", "Canon", "RF50mm")
 
         with patch.object(service, "_extract_exif_fields_with_retry") as mock_extract:
@@ -109,6 +110,194 @@ class TestExifServiceCache:
         assert camera == "Canon"
         assert lens == "RF50mm"
 
+    def test_raw_exif_memoized_until_cleared(self, tmp_path):
+        """Raw metadata is read once per unchanged file, until clear_cache()."""
+        service = ExifService()
+        service.current_method = "exiftool"
+        test_file = tmp_path / "photo.jpg"
+        test_file.write_bytes(b"\xff\xd8")
+        meta = {"EXIF:Model": "Canon EOS R5", "EXIF:ShutterCount": 42}
+
+        with patch.object(service, "_get_exiftool_metadata_shared", return_value=meta) as mock_read:
+            assert service.extract_raw_exif(str(test_file)) == meta
+            assert service.extract_raw_exif(str(test_file)) == meta
+            # A tag-limited request is answered from the full read
+            assert service.extract_raw_exif(str(test_file), tags=("ShutterCount",)) == meta
+            assert mock_read.call_count == 1
+
+            service.clear_cache()
+            service.extract_raw_exif(str(test_file))
+            assert mock_read.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Cross-run cache persistence
+# ---------------------------------------------------------------------------
+class TestExifServicePersistentCache:
+    """Test saving/loading the EXIF cache between runs."""
+
+    def test_round_trip_skips_extraction(self, tmp_path):
+        test_file = tmp_path / "photo.jpg"
+        test_file.write_bytes(b"\xff\xd8")
+        cache_file = str(tmp_path / "exif_cache.json")
+
+        first = ExifService()
+        with patch.object(first, "_extract_exif_fields_with_retry") as mock_extract:
+            mock_extract.return_value = ("20240615", "Canon", "RF50mm")
+            first.get_cached_exif_data(str(test_file), method="exiftool")
+        assert first.save_persistent_cache(cache_file) == 1
+
+        second = ExifService()
+        assert second.load_persistent_cache(cache_file) == 1
+        with patch.object(second, "_extract_exif_fields_with_retry") as mock_extract:
+            result = second.get_cached_exif_data(str(test_file), method="exiftool")
+            mock_extract.assert_not_called()
+        assert result == ("20240615", "Canon", "RF50mm")
+
+    def test_size_change_invalidates_entry(self, tmp_path):
+        test_file = tmp_path / "photo.jpg"
+        test_file.write_bytes(b"\xff\xd8")
+        cache_file = str(tmp_path / "exif_cache.json")
+
+        first = ExifService()
+        with patch.object(first, "_extract_exif_fields_with_retry") as mock_extract:
+            mock_extract.return_value = ("20240615", "Canon", "RF50mm")
+            first.get_cached_exif_data(str(test_file), method="exiftool")
+        first.save_persistent_cache(cache_file)
+
+        # Same mtime, different size
+        st = os.stat(str(test_file))
+        test_file.write_bytes(b"\xff\xd8\xff\xd9")
+        os.utime(str(test_file), ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        second = ExifService()
+        second.load_persistent_cache(cache_file)
+        with patch.object(second, "_extract_exif_fields_with_retry") as mock_extract:
+            mock_extract.return_value = ("20250101", "Sony", "FE50mm")
+            result = second.get_cached_exif_data(str(test_file), method="exiftool")
+            mock_extract.assert_called_once()
+        assert result == ("20250101", "Sony", "FE50mm")
+
+    def test_clear_cache_keeps_persisted_unless_requested(self):
+        service = ExifService()
+        service._persisted[("a.jpg", 1, 1.0, "exiftool")] = (None, None, None)
+        service._batch_cache[("a.jpg", 1, 1.0)] = {"Model": "X"}
+        service.clear_cache()
+        assert len(service._persisted) == 1
+        assert len(service._batch_cache) == 1
+        service.clear_cache(include_persistent=True)
+        assert len(service._persisted) == 0
+        assert len(service._batch_cache) == 0
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        cache_file = tmp_path / "exif_cache.json"
+        cache_file.write_text("{not json")
+        service = ExifService()
+        assert service.load_persistent_cache(str(cache_file)) == 0
+
+    @staticmethod
+    def _key(path):
+        st = os.stat(path)
+        return (path, st.st_size, st.st_mtime, "exiftool")
+
+    def test_save_drops_stale_and_failed_entries(self, tmp_path):
+        fresh = tmp_path / "fresh.jpg"
+        changed = tmp_path / "changed.jpg"
+        failed = tmp_path / "failed.jpg"
+        for f in (fresh, changed, failed):
+            f.write_bytes(b"\xff\xd8")
+        cache_file = str(tmp_path / "exif_cache.json")
+
+        service = ExifService()
+        service._cache[self._key(str(changed))] = ("20240615", "Canon", None)
+        changed.write_bytes(b"\xff\xd8\xff\xd9")
+        service._cache[self._key(str(failed))] = (None, None, None)
+        service._cache[self._key(str(fresh))] = ("20240615", "Canon", None)
+        service._cache[(str(tmp_path / "gone.jpg"), 2, 1.0, "exiftool")] = ("20240615", None, None)
+
+        assert service.save_persistent_cache(cache_file) == 1
+        with open(cache_file, encoding="utf-8") as f:
+            assert [row[0] for row in json.load(f)] == [str(fresh)]
+
+    def test_save_does_not_stat_entries_from_earlier_runs(self, tmp_path):
+        used = tmp_path / "used.jpg"
+        used.write_bytes(b"\xff\xd8")
+        cache_file = str(tmp_path / "exif_cache.json")
+
+        service = ExifService()
+        service._persisted[("/mnt/nas/old.jpg", 2, 1.0, "exiftool")] = ("20230101", None, None)
+        service._cache[self._key(str(used))] = ("20240615", "Canon", None)
+
+        with patch("modules.exif_service_new.os.stat", wraps=os.stat) as mock_stat:
+            assert service.save_persistent_cache(cache_file) == 2
+        mock_stat.assert_called_once_with(str(used))
+
+    def test_async_save_writes_the_file(self, tmp_path):
+        test_file = tmp_path / "photo.jpg"
+        test_file.write_bytes(b"\xff\xd8")
+        cache_file = str(tmp_path / "exif_cache.json")
+        service = ExifService()
+        service._cache[self._key(str(test_file))] = ("20240615", "Canon", None)
+
+        service.save_persistent_cache_async(cache_file)
+        service._persist_saver.join()
+        assert not service._persist_saver.daemon
+        with open(cache_file, encoding="utf-8") as f:
+            assert [row[0] for row in json.load(f)] == [str(test_file)]
+
+    def test_save_keeps_most_recently_used_entries(self, tmp_path):
+        files = []
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            f = tmp_path / name
+            f.write_bytes(b"\xff\xd8")
+            files.append(str(f))
+        cache_file = str(tmp_path / "exif_cache.json")
+
+        service = ExifService()
+        service._persisted[self._key(files[0])] = ("20240101", None, None)
+        service._persisted[self._key(files[1])] = ("20240102", None, None)
+        # a.jpg used again this session, so b.jpg is the oldest
+        service._cache[self._key(files[0])] = ("20240101", None, None)
+        service._cache[self._key(files[2])] = ("20240103", None, None)
+
+        with patch.object(ExifService, "PERSISTENT_CACHE_MAX_ENTRIES", 2):
+            assert service.save_persistent_cache(cache_file) == 2
+        with open(cache_file, encoding="utf-8") as f:
+            assert [row[0] for row in json.load(f)] == [files[0], files[2]]
+
+    def test_async_load_finishes_before_save(self, tmp_path):
+        test_file = tmp_path / "photo.jpg"
+        test_file.write_bytes(b"\xff\xd8")
+        cache_file = str(tmp_path / "exif_cache.json")
+        first = ExifService()
+        first._cache[self._key(str(test_file))] = ("20240615", "Canon", None)
+        first.save_persistent_cache(cache_file)
+
+        second = ExifService()
+        second.load_persistent_cache_async(cache_file)
+        assert second.save_persistent_cache(cache_file) == 1
+        assert len(second._persisted) == 1
+
+    def test_load_discarded_when_cache_invalidated_meanwhile(self, tmp_path):
+        test_file = tmp_path / "photo.jpg"
+        test_file.write_bytes(b"\xff\xd8")
+        cache_file = str(tmp_path / "exif_cache.json")
+        first = ExifService()
+        first._cache[self._key(str(test_file))] = ("20240615", "Canon", None)
+        first.save_persistent_cache(cache_file)
+
+        second = ExifService()
+        real_load = json.load
+
+        def _load_then_invalidate(f):
+            rows = real_load(f)
+            second.clear_cache(include_persistent=True)
+            return rows
+
+        with patch("modules.exif_service_new.json.load", side_effect=_load_then_invalidate):
+            assert second.load_persistent_cache(cache_file) == 0
+        assert second._persisted == {}
+
 
 # ---------------------------------------------------------------------------
 # Mocked EXIF extraction
@@ -153,6 +342,26 @@ class TestExifServiceExtraction:
         assert camera is None
         assert lens is None
 
+    @patch("modules.exif_service_new.EXIFTOOL_AVAILABLE", True)
+    def test_accessors_share_one_read(self, tmp_path):
+        """Selective and full accessors must share a single tag-limited read."""
+        test_file = tmp_path / "photo.jpg"
+        test_file.touch()
+        meta = {
+            "EXIF:DateTimeOriginal": "2024:06:15 10:00:00",
+            "EXIF:Model": "Canon EOS R5",
+            "EXIF:LensModel": "RF24-70mm",
+        }
+
+        service = ExifService()
+        with patch.object(service, "_get_exiftool_metadata_shared", return_value=meta) as mock_read:
+            service.get_selective_cached_exif_data(str(test_file), method="exiftool")
+            result = service.get_cached_exif_data(str(test_file), method="exiftool")
+
+        mock_read.assert_called_once()
+        assert mock_read.call_args.kwargs["tags"] == ExifService.FIELD_TAGS
+        assert result == ("20240615", "Canon-EOS-R5", "RF24-70mm")
+
     @patch("modules.exif_service_new.EXIFTOOL_AVAILABLE", True)
     def test_extraction_failure_returns_none_tuple(self, tmp_path):
         test_file = tmp_path / "corrupt.jpg"
@@ -24,6 +24,8 @@ from modules.exif_undo_manager import (
     has_original_filename,
     get_rename_info,
     _read_existing_user_comment,
+    _exiftool_exists,
+    _KNOWN_EXIFTOOL_PATHS,
     ORIGINAL_NAME_PREFIX,
     RENAME_DATE_PREFIX,
     EXIF_USER_COMMENT_FIELD,
@@ -397,6 +399,30 @@ class TestReadExistingUserComment:
         assert result is None
 
 
+# ---------------------------------------------------------------------------
+# _exiftool_exists
+# ---------------------------------------------------------------------------
+class TestExiftoolExists:
+
+    def test_found_path_is_only_checked_once(self, tmp_path):
+        exiftool = str(tmp_path / "exiftool")
+        _KNOWN_EXIFTOOL_PATHS.discard(exiftool)
+        with patch("modules.exif_undo_manager.os.path.exists", return_value=True) as mock_exists:
+            assert _exiftool_exists(exiftool) is True
+            assert _exiftool_exists(exiftool) is True
+        mock_exists.assert_called_once_with(exiftool)
+        _KNOWN_EXIFTOOL_PATHS.discard(exiftool)
+
+    def test_missing_path_is_rechecked(self, tmp_path):
+        exiftool = str(tmp_path / "exiftool")
+        assert _exiftool_exists(exiftool) is False
+        assert _exiftool_exists("") is False
+        assert _exiftool_exists(None) is False
+        open(exiftool, "w").close()
+        assert _exiftool_exists(exiftool) is True
+        _KNOWN_EXIFTOOL_PATHS.discard(exiftool)
+
+
 # ---------------------------------------------------------------------------
 # Constants consistency
 # ---------------------------------------------------------------------------
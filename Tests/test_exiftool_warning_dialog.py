@@ -130,3 +130,27 @@ class TestPlatformInstructions:
         assert d.isEnabled()
         d.close()
         d.deleteLater()
+
+
+# ---------------------------------------------------------------------------
+# show_if_needed
+# ---------------------------------------------------------------------------
+class TestShowIfNeeded:
+
+    def test_suppressed_does_not_construct_dialog(self, qapp):
+        from modules.dialogs.exiftool_warning_dialog import ExifToolWarningDialog
+        settings = MagicMock()
+        settings.get_show_exiftool_warning.return_value = False
+        with patch.object(ExifToolWarningDialog, "__init__") as mock_init:
+            ExifToolWarningDialog.show_if_needed(None, settings)
+            mock_init.assert_not_called()
+        settings.set_show_exiftool_warning.assert_not_called()
+
+    def test_opt_out_is_saved(self, qapp):
+        from modules.dialogs.exiftool_warning_dialog import ExifToolWarningDialog
+        settings = MagicMock()
+        settings.get_show_exiftool_warning.return_value = True
+        with patch.object(ExifToolWarningDialog, "exec"), \
+             patch.object(ExifToolWarningDialog, "should_show_again", return_value=False):
+            ExifToolWarningDialog.show_if_needed(None, settings)
+        settings.set_show_exiftool_warning.assert_called_once_with(False)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Unit tests for modules/ui/file_list_manager.py
+
+Covers the background EXIF prefetch task and bulk population of the file list.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ---------------------------------------------------------------------------
+# EXIF prefetch runs on a QThreadPool worker
+# ---------------------------------------------------------------------------
+class TestExifPrefetchTask:
+    """The prefetch task warms the EXIF caches and reports back via a signal."""
+
+    def test_run_prefetches_and_emits_results(self):
+        from modules.exif_service_new import ExifService
+        from modules.ui.file_list_manager import ExifPrefetchTask
+
+        service = MagicMock()
+        service.batch_get_raw_metadata.return_value = {"a.jpg": {"Model": "X"}}
+        task = ExifPrefetchTask(service, ["a.jpg", "b.mp4"], detection_file="a.jpg")
+
+        received = []
+        task.signals.finished.connect(received.append)
+        task.run()
+
+        service.batch_get_raw_metadata.assert_called_once_with(["a.jpg", "b.mp4"])
+        service.extract_raw_exif.assert_called_once_with(
+            "a.jpg", tags=ExifService.SHOOTING_SETTING_TAGS
+        )
+        assert received == [{"a.jpg": {"Model": "X"}}]
+
+    def test_run_emits_even_when_exiftool_fails(self):
+        from modules.ui.file_list_manager import ExifPrefetchTask
+
+        service = MagicMock()
+        service.batch_get_raw_metadata.side_effect = RuntimeError("exiftool died")
+        task = ExifPrefetchTask(service, ["a.jpg"])
+
+        received = []
+        task.signals.finished.connect(received.append)
+        task.run()
+
+        assert received == [{}]
+
+
+# ---------------------------------------------------------------------------
+# Bulk file-list population
+# ---------------------------------------------------------------------------
+class TestFileListPopulation:
+    """Adding files fills the list in one guarded pass."""
+
+    @pytest.fixture()
+    def manager(self, qapp):
+        from PyQt6.QtWidgets import QListWidget
+        from modules.ui.file_list_manager import FileListManager
+
+        parent = SimpleNamespace(files=[], file_list=QListWidget())
+        return FileListManager(parent)
+
+    def test_items_keep_path_and_list_stays_live(self, manager):
+        from PyQt6.QtCore import Qt
+
+        paths = [f"/photos/IMG_{i:04d}.JPG" for i in range(50)]
+        manager.append_file_items(paths)
+
+        file_list = manager.parent.file_list
+        assert file_list.count() == 50
+        assert file_list.item(7).text() == "IMG_0007.JPG"
+        assert file_list.item(7).data(Qt.ItemDataRole.UserRole) == paths[7]
+        assert file_list.updatesEnabled()
+        assert not file_list.signalsBlocked()
+
+    def test_adding_files_prefetches_only_new_ones(self, tmp_path):
+        from modules.ui.file_list_manager import FileListManager
+
+        paths = [str(tmp_path / f"IMG_{i}.JPG") for i in range(3)]
+        for path in paths:
+            open(path, "wb").close()
+        parent = MagicMock()
+        parent.files = []
+        parent.exif_method = "exiftool"
+        manager = FileListManager(parent)
+
+        with patch("modules.ui.file_list_manager.ExifPrefetchTask") as task_cls, \
+                patch("modules.ui.file_list_manager.QThreadPool"), \
+                patch.object(manager, "clear_file_list"), \
+                patch.object(manager, "_start_background_benchmark"):
+            manager.add_files_to_list(paths[:2])
+            manager.add_files_to_list(paths[1:])
+
+        assert [c.args[1] for c in task_cls.call_args_list] == [paths[:2], paths[2:]]
+        parent.exif_service.clear_cache.assert_not_called()
@@ -22,6 +22,10 @@ from modules.file_utilities import (
     is_image_file,
     is_video_file,
     is_media_file,
+    split_media_files,
+    pick_preview_file,
+    MEDIA_FILE_DIALOG_FILTER,
+    VIDEO_EXTENSIONS,
     natural_sort_key,
     sanitize_filename,
     sanitize_final_filename,
@@ -108,10 +112,40 @@ class TestIsMediaFile:
         ("document.txt", False),
         ("data.csv", False),
         ("script.py", False),
+        (".jpg", False),
+        ("album.jpg/notes", False),
+        ("/photos/2024.trip/IMG_1.NEF", True),
     ])
     def test_media_detection(self, filename: str, expected: bool):
         assert is_media_file(filename) is expected
 
+    def test_repeat_lookup_is_memoized(self):
+        is_media_file("/photos/memo_check/IMG_0001.JPG")
+        hits = is_media_file.cache_info().hits
+        assert is_media_file("/photos/memo_check/IMG_0001.JPG") is True
+        assert is_media_file.cache_info().hits == hits + 1
+
+    def test_split_media_files_keeps_order(self):
+        files = ["b.CR2", "notes.txt", "a.mp4", "c.jpg", "x.pdf"]
+        assert split_media_files(files) == (["b.CR2", "a.mp4", "c.jpg"], ["notes.txt", "x.pdf"])
+
+    @pytest.mark.parametrize("files, expected", [
+        (["a.CR2", "b.mp4", "c.JPEG", "d.jpg"], "c.JPEG"),
+        (["notes.txt", "a.CR2", "b.mp4"], "a.CR2"),
+        (["notes.txt", "x.pdf"], "notes.txt"),
+        ([], None),
+    ])
+    def test_pick_preview_file(self, files, expected):
+        assert pick_preview_file(files) == expected
+
+    def test_dialog_filter_lists_every_extension(self):
+        media, images, videos, everything = MEDIA_FILE_DIALOG_FILTER.split(";;")
+        patterns = media[len("Media Files ("):-1].split()
+        assert patterns == [f"*{ext}" for ext in FileConstants.MEDIA_EXTENSIONS]
+        assert images.startswith("Image Files (*.jpg ")
+        assert videos == "Video Files ({})".format(" ".join(f"*{e}" for e in VIDEO_EXTENSIONS))
+        assert everything == "All Files (*)"
+
 
 # ---------------------------------------------------------------------------
 # Natural sort key
@@ -352,6 +386,30 @@ class TestScanDirectory:
         assert "readme.txt" not in basenames
         assert "notes.md" not in basenames
 
+    @pytest.mark.skipif(not hasattr(os, "symlink") or sys.platform == "win32",
+                        reason="symlinks need privileges on Windows")
+    def test_recursive_scan_skips_symlinked_dirs(self, tmp_path):
+        self._create_test_tree(tmp_path)
+        os.symlink(tmp_path, tmp_path / "subdir" / "loop")
+        results = scan_directory_recursive(str(tmp_path))
+        basenames = [os.path.basename(f) for f in results]
+        assert basenames.count("photo1.jpg") == 1
+        assert basenames.count("photo3.nef") == 1
+
+    def test_recursive_scan_of_deep_tree(self, tmp_path):
+        """The concurrent walk finds every nested file exactly once, sorted."""
+        expected = []
+        for a in range(3):
+            for b in range(4):
+                d = tmp_path / f"a{a}" / f"b{b}"
+                d.mkdir(parents=True)
+                for n in (2, 10):
+                    (d / f"IMG_{n}.jpg").touch()
+                    expected.append(str(d / f"IMG_{n}.jpg"))
+                (d / "skip.txt").touch()
+        results = scan_directory_recursive(str(tmp_path))
+        assert results == expected
+
     def test_empty_directory(self, tmp_path):
         results = scan_directory(str(tmp_path), include_subdirs=False)
         assert results == []
@@ -375,6 +433,9 @@ class TestCheckFileAccess:
     def test_nonexistent_file(self):
         assert check_file_access("/nonexistent/file.jpg") is False
 
+    def test_directory_is_not_accessible_file(self, tmp_path):
+        assert check_file_access(str(tmp_path)) is False
+
 
 # ---------------------------------------------------------------------------
 # FileConstants
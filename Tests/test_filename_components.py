@@ -17,7 +17,9 @@ from typing import Optional
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.filename_components import (
+    FILENAME_DATE_PATTERN,
     build_ordered_components,
+    timestamp_to_date_str,
     _format_date,
     _sanitize_component,
     _format_metadata,
@@ -66,6 +68,33 @@ class TestFormatDate:
         assert result == "2024-06-15"
 
 
+class TestFilenameDatePattern:
+    """YYYYMMDD detection in existing file names."""
+
+    @pytest.mark.parametrize("name, expected", [
+        ("20250725_DSC0001.MP4", ("2025", "07", "25")),
+        ("IMG_20241231_235959.jpg", ("2024", "12", "31")),
+        # An impossible month/day is skipped in favour of a real date
+        ("DSC20251399_20250101.jpg", ("2025", "01", "01")),
+    ])
+    def test_matches_valid_dates(self, name, expected):
+        assert FILENAME_DATE_PATTERN.search(name).groups() == expected
+
+    @pytest.mark.parametrize("name", ["DSC20251399.jpg", "20250000.jpg", "20241232.jpg"])
+    def test_rejects_invalid_dates(self, name):
+        assert FILENAME_DATE_PATTERN.search(name) is None
+
+
+class TestTimestampToDateStr:
+    """mtime fallback dates match the datetime-based formatting."""
+
+    @pytest.mark.parametrize("ts", [0, 1721900000, 1735689599.5])
+    def test_matches_strftime(self, ts):
+        import datetime
+        expected = datetime.datetime.fromtimestamp(ts).strftime('%Y%m%d')
+        assert timestamp_to_date_str(ts) == expected
+
+
 # ---------------------------------------------------------------------------
 # Component sanitization
 # ---------------------------------------------------------------------------
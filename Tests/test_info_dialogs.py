@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Unit tests for modules/handlers/info_dialogs.py
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ---------------------------------------------------------------------------
+# Help dialogs are built once per parent and reused
+# ---------------------------------------------------------------------------
+class TestHelpDialogCache:
+    """Repeated help clicks reuse the same dialog instead of rebuilding it."""
+
+    def test_dialog_is_reused(self, qapp):
+        from PyQt6.QtWidgets import QDialog, QWidget
+        from modules.handlers import show_separator_info, show_additional_info
+
+        parent = QWidget()
+        shown = []
+        with patch.object(QDialog, "exec", lambda self: shown.append(self)):
+            show_separator_info(parent)
+            show_separator_info(parent)
+            show_additional_info(parent)
+
+        assert shown[0] is shown[1]
+        assert shown[2] is not shown[0]
+        assert shown[2].windowTitle() == "Additional Field Help"
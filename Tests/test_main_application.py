@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Unit tests for modules/main_application.py
+
+Covers the detection label styling and rename error reporting.
+"""
+
+import os
+import sys
+import types
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ---------------------------------------------------------------------------
+# Detection labels only restyle when their state changes
+# ---------------------------------------------------------------------------
+class TestDetectionLabelStyle:
+    """_set_label skips setStyleSheet when the style is already applied."""
+
+    def test_unchanged_style_is_not_reapplied(self, qapp):
+        from PyQt6.QtWidgets import QLabel
+        from modules.main_application import _set_label, _LABEL_OK, _LABEL_WARN
+
+        label = QLabel()
+        _set_label(label, "(Canon)", _LABEL_OK)
+
+        with patch.object(label, "setStyleSheet", wraps=label.setStyleSheet) as spy:
+            _set_label(label, "(Canon)", _LABEL_OK)
+            _set_label(label, "(not detected)", _LABEL_WARN)
+
+        assert spy.call_count == 1
+        assert label.text() == "(not detected)"
+        assert label.styleSheet() == _LABEL_WARN
+
+
+# ---------------------------------------------------------------------------
+# Rename errors show in the status bar before the modal dialog opens
+# ---------------------------------------------------------------------------
+class TestRenameErrorReporting:
+    """on_rename_error opens the error box without a nested event loop."""
+
+    def test_dialog_is_not_executed(self, qapp):
+        from PyQt6.QtWidgets import QLabel
+        from modules.main_application import FileRenamerApp
+
+        window = types.SimpleNamespace(
+            _ui_set_busy=MagicMock(),
+            rename_error_label=QLabel(),
+            status=MagicMock(),
+        )
+        with patch("modules.main_application.QMessageBox") as box_cls:
+            FileRenamerApp.on_rename_error(window, "disk full")
+
+        assert window.rename_error_label.text() == "⚠ Rename operation failed: disk full"
+        window._ui_set_busy.assert_called_once_with(False)
+        window.status.showMessage.assert_not_called()
+        box = box_cls.return_value
+        box.open.assert_called_once_with()
+        box.exec.assert_not_called()
+        box_cls.critical.assert_not_called()
+        assert box_cls.call_args.args[2].endswith("disk full")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Unit tests for modules/performance_benchmark.py
+
+ExifTool is mocked; the tests check what the benchmark times, not how
+fast the machine is.
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.exif_service_new import ExifService
+from modules.performance_benchmark import PerformanceBenchmark
+
+
+class TestBenchmarkExifReads:
+    """Every EXIF scenario must really read each sample file."""
+
+    def test_shared_service_memo_is_bypassed(self, tmp_path):
+        exiftool = tmp_path / "exiftool"
+        exiftool.touch()
+        samples = []
+        for i in range(3):
+            sample = tmp_path / f"DSC{i:05d}.jpg"
+            sample.write_bytes(b"jpeg")
+            samples.append(str(sample))
+
+        service = ExifService(str(exiftool))
+        service.current_method = "exiftool"
+        benchmark = PerformanceBenchmark(str(exiftool), exif_service=service)
+        with patch.object(service, "_get_exiftool_metadata_shared",
+                          return_value={"EXIF:DateTimeOriginal": "2024:06:15 10:00:00"}) as read, \
+                patch("modules.exif_undo_manager.write_original_filename_to_exif"):
+            benchmark.run_benchmark(samples)
+
+        # Five scenarios read EXIF, three files each
+        assert read.call_count == 15
+        assert not service._raw_cache
+        assert benchmark.is_ready()
@@ -48,6 +48,10 @@ class TestRawMetadataParsers:
         meta = {"CreateDate": "2025:01:01 12:00:00"}
         assert ExifService.parse_date_from_raw(meta) == "20250101"
 
+    def test_parse_date_non_standard_layout(self):
+        meta = {"CreateDate": "2025-01-01 12:00:00"}
+        assert ExifService.parse_date_from_raw(meta) == "2025-01-01"
+
     def test_parse_camera(self):
         assert ExifService.parse_camera_from_raw(self.SAMPLE_META) == "Canon-EOS-R5"
 
@@ -124,6 +128,7 @@ class TestBatchGetRawMetadata:
         svc._cache = {}
         svc._cache_lock = __import__("threading").Lock()
         svc._cache_max_size = 10000
+        svc._batch_cache = __import__("collections").OrderedDict()
         svc._exiftool_instance = None
         svc._exiftool_lock = __import__("threading").Lock()
         svc._exiftool_path = "/fake/exiftool"
@@ -147,7 +152,7 @@ class TestBatchGetRawMetadata:
 
         fake_instance = MagicMock()
         fake_meta = [{"EXIF:ISO": str(100 + i)} for i in range(3)]
-        fake_instance.get_metadata.return_value = fake_meta
+        fake_instance.get_tags.return_value = fake_meta
 
         svc._exiftool_instance = fake_instance
 
@@ -155,7 +160,7 @@ class TestBatchGetRawMetadata:
             result = svc.batch_get_raw_metadata(files, chunk_size=50)
 
         # Single call with all 3 files
-        assert fake_instance.get_metadata.call_count == 1
+        assert fake_instance.get_tags.call_count == 1
         assert len(result) == 3
         for fp in files:
             assert fp in result
@@ -172,7 +177,7 @@ class TestBatchGetRawMetadata:
 
         fake_instance = MagicMock()
         # Return one metadata dict per requested file
-        fake_instance.get_metadata.side_effect = lambda paths: [
+        fake_instance.get_tags.side_effect = lambda paths, tags, params=None: [
             {"EXIF:ISO": "100"} for _ in paths
         ]
 
@@ -182,9 +187,71 @@ class TestBatchGetRawMetadata:
             result = svc.batch_get_raw_metadata(files, chunk_size=2)
 
         # 5 files / chunk_size=2 → 3 calls (2+2+1)
-        assert fake_instance.get_metadata.call_count == 3
+        assert fake_instance.get_tags.call_count == 3
         assert len(result) == 5
 
+    def test_batch_requests_only_needed_tags(self, tmp_path):
+        """Batch calls should restrict ExifTool to BATCH_TAGS with -fast2."""
+        p = tmp_path / "img.jpg"
+        p.touch()
+
+        svc = self._make_service()
+        fake_instance = MagicMock()
+        fake_instance.get_tags.return_value = [{"EXIF:Model": "X"}]
+        svc._exiftool_instance = fake_instance
+
+        with patch.object(svc, "_ensure_exiftool_running"):
+            svc.batch_get_raw_metadata([str(p)])
+
+        args, kwargs = fake_instance.get_tags.call_args
+        assert set(args[1]) == set(ExifService.BATCH_TAGS)
+        assert "-fast2" in kwargs["params"]
+        fake_instance.get_metadata.assert_not_called()
+
+    def test_parallel_workers_use_own_instances(self, tmp_path):
+        """max_workers > 1 should spread chunks over separate ExifTool helpers."""
+        files = []
+        for i in range(6):
+            p = tmp_path / f"img_{i}.jpg"
+            p.touch()
+            files.append(str(p))
+
+        svc = self._make_service()
+        shared = MagicMock()
+        svc._exiftool_instance = shared
+
+        with patch("modules.exif_service_new.exiftool") as mock_et_mod:
+            helper = mock_et_mod.ExifToolHelper.return_value
+            helper.get_tags.side_effect = lambda paths, tags, params=None: [
+                {"SourceFile": p} for p in paths
+            ]
+            result = svc.batch_get_raw_metadata(files, chunk_size=2, max_workers=2)
+
+        assert len(result) == 6
+        assert helper.get_tags.call_count == 3
+        shared.get_tags.assert_not_called()
+        # Every helper started for the call is shut down again
+        assert helper.__exit__.call_count == helper.__enter__.call_count
+
+    def test_repeat_batch_served_from_cache(self, tmp_path):
+        """Unchanged files are not sent to ExifTool a second time."""
+        p = tmp_path / "img.jpg"
+        p.touch()
+
+        svc = self._make_service()
+        fake_instance = MagicMock()
+        fake_instance.get_tags.return_value = [{"EXIF:Model": "X"}]
+        svc._exiftool_instance = fake_instance
+
+        with patch.object(svc, "_ensure_exiftool_running"):
+            first = svc.batch_get_raw_metadata([str(p)])
+            second = svc.batch_get_raw_metadata([str(p)])
+
+        assert fake_instance.get_tags.call_count == 1
+        assert first == second == {str(p): {"EXIF:Model": "X"}}
+        # The parsed fields land in the per-file cache as well
+        assert svc._cache[svc._cache_key(str(p), "exiftool")][1] == "X"
+
     def test_batch_nonexistent_files_return_empty(self, tmp_path):
         svc = self._make_service()
         result = svc.batch_get_raw_metadata([str(tmp_path / "nope.jpg")])
@@ -274,6 +341,16 @@ class TestExtractImageNumber:
         num = extract_image_number(str(p), "exiftool", "/fake/exiftool", exif_service=mock_service)
         assert num == "9999"
 
+    def test_requests_only_image_number_tags(self, tmp_path):
+        from modules.handlers.exif_handler import extract_image_number, IMAGE_NUMBER_TAGS
+        p = tmp_path / "IMG_0001.JPG"
+        p.touch()
+        mock_service = MagicMock()
+        mock_service.extract_raw_exif = MagicMock(return_value={"File:SequenceNumber": "3"})
+        num = extract_image_number(str(p), "exiftool", "/fake/exiftool", exif_service=mock_service)
+        assert num == "3"
+        mock_service.extract_raw_exif.assert_called_once_with(str(p), tags=IMAGE_NUMBER_TAGS)
+
     def test_returns_none_for_non_exiftool_method(self, tmp_path):
         """Non-exiftool methods should return None (Pillow removed)."""
         from modules.handlers.exif_handler import extract_image_number
@@ -377,6 +454,34 @@ class TestRenameEngineExifServicePath:
                 assert "all_metadata" in data
                 assert "date_str" in data
 
+    def test_pre_extract_batches_siblings_when_read_per_file(self, tmp_path):
+        """RAW+JPEG siblings join the batch so the plan loop needs no per-file calls."""
+        files = []
+        for ext in (".jpg", ".arw"):
+            p = tmp_path / f"DSC10000{ext}"
+            p.touch()
+            files.append(str(p))
+
+        mock_service = MagicMock()
+        mock_service.batch_get_raw_metadata.return_value = {
+            f: {"EXIF:DateTimeOriginal": "2024:06:15 10:00:00"} for f in files
+        }
+
+        worker = self._make_worker(files, exif_service=mock_service)
+        groups = worker._create_file_groups()
+        assert len(groups) == 1
+        cache = worker._pre_extract_exif_cache(groups)
+
+        batched = mock_service.batch_get_raw_metadata.call_args[0][0]
+        assert sorted(batched) == sorted(files)
+        assert set(cache) == set(files)
+
+        # Without date/camera/lens only each group's first file is needed
+        mock_service.reset_mock()
+        worker = self._make_worker(files, exif_service=mock_service, use_date=False)
+        worker._pre_extract_exif_cache(worker._create_file_groups())
+        assert len(mock_service.batch_get_raw_metadata.call_args[0][0]) == 1
+
     def test_no_cache_clear_at_start(self, tmp_path):
         """optimized_rename_files should NOT clear ExifService cache."""
         p = tmp_path / "DSC10000.jpg"
@@ -445,3 +550,18 @@ class TestFindExiftoolPath:
         # Should either find a path or return None (not crash)
         if path:
             assert "exiftool" in path.lower() or path == "exiftool"
+
+    def test_search_is_memoized(self):
+        """Repeated lookups must not repeat the filesystem search."""
+        from modules.exif_processor import find_exiftool_path
+
+        find_exiftool_path.cache_clear()
+        try:
+            with patch("modules.exif_processor.glob.glob", return_value=[]) as mock_glob, \
+                 patch("modules.exif_processor.shutil.which", return_value=None), \
+                 patch("modules.exif_processor.os.name", "posix"):
+                assert find_exiftool_path() is None
+                assert find_exiftool_path() is None
+            assert mock_glob.call_count == 1
+        finally:
+            find_exiftool_path.cache_clear()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Unit tests for modules/ui/preview_generator.py
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ---------------------------------------------------------------------------
+# Preview rebuild is skipped when its inputs are unchanged
+# ---------------------------------------------------------------------------
+class TestPreviewShortCircuit:
+    """PreviewGenerator.update_preview only re-renders on a changed state."""
+
+    def _parent(self):
+        parent = MagicMock()
+        parent.camera_prefix_entry.text.return_value = "A7R3"
+        parent.additional_entry.text.return_value = ""
+        parent.checkbox_camera.isChecked.return_value = False
+        parent.checkbox_lens.isChecked.return_value = False
+        parent.checkbox_date.isChecked.return_value = True
+        parent.date_format_combo.currentText.return_value = "YYYY-MM-DD"
+        parent.separator_combo.currentText.return_value = "-"
+        parent.custom_order = ["Date", "Prefix", "Number"]
+        parent.files = []
+        parent.exif_method = None
+        parent.selected_metadata = {}
+        return parent
+
+    def test_unchanged_state_is_not_rerendered(self):
+        from modules.ui.preview_generator import PreviewGenerator
+
+        parent = self._parent()
+        generator = PreviewGenerator(parent)
+        generator.update_preview()
+        generator.update_preview()
+        assert parent.interactive_preview.set_components.call_count == 1
+
+        parent.separator_combo.currentText.return_value = "_"
+        generator.update_preview()
+        assert parent.interactive_preview.set_components.call_count == 2
+
+        generator.invalidate_exif_cache()
+        generator.update_preview()
+        assert parent.interactive_preview.set_components.call_count == 3
@@ -353,6 +353,29 @@ class TestRenameSmallScale:
                 f"Camera not found in '{sample}'"
             )
 
+    def test_existing_target_gets_suffix(self, tmp_path):
+        """A file already occupying the planned name must not be overwritten."""
+        probe_dir = tmp_path / "probe"
+        probe_dir.mkdir()
+        with _mock_all_exif() as service:
+            worker = _make_worker(_create_pairs(probe_dir, count=1), exif_service=service)
+            probe_renamed, _, _, _ = worker.optimized_rename_files()
+        taken = os.path.basename(probe_renamed[0])
+
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        files = _create_pairs(work_dir, count=1)
+        (work_dir / taken).write_text("keep me")
+
+        with _mock_all_exif() as service:
+            worker = _make_worker(files, exif_service=service)
+            renamed, errors, _, _mapping = worker.optimized_rename_files()
+
+        assert errors == []
+        assert (work_dir / taken).read_text() == "keep me"
+        stem, ext = os.path.splitext(taken)
+        assert str(work_dir / f"{stem}(1){ext}") in renamed
+
     def test_no_errors_on_empty_file_list(self):
         """An empty file list should produce no errors and no renames."""
         worker = _make_worker([])
@@ -397,6 +420,19 @@ class TestRenameScalability:
         assert error_rate < 0.05, f"Error rate {error_rate:.1%} too high"
         assert len(renamed) > 0
 
+    def test_large_batches_use_extra_exiftool_processes(self, tmp_path):
+        files = [str(tmp_path / f"DSC{i:05d}.jpg") for i in range(RenameWorkerThread.PARALLEL_EXIF_MIN_FILES)]
+        for f in files:
+            Path(f).touch()
+
+        with _mock_all_exif() as service:
+            worker = _make_worker(files, exif_service=service)
+            worker.optimized_rename_files()
+
+        _, kwargs = service.batch_get_raw_metadata.call_args
+        assert kwargs["max_workers"] == RenameWorkerThread.EXIF_WORKERS
+        assert worker._exif_workers(10) == 1
+
 
 # ---------------------------------------------------------------------------
 # Counter logic
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Unit tests for modules/ui_components.py
+
+Covers the clickable info label and the interactive preview redraw.
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ---------------------------------------------------------------------------
+# Info icons emit a real signal instead of patching mousePressEvent
+# ---------------------------------------------------------------------------
+class TestClickableLabel:
+    """ClickableLabel reports left clicks through its ``clicked`` signal."""
+
+    def test_left_click_emits_clicked(self, qapp):
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtTest import QTest
+        from modules.ui_components import ClickableLabel
+
+        label = ClickableLabel()
+        clicks = []
+        label.clicked.connect(lambda: clicks.append(True))
+
+        QTest.mouseClick(label, Qt.MouseButton.LeftButton)
+        QTest.mouseClick(label, Qt.MouseButton.RightButton)
+
+        assert clicks == [True]
+
+
+# ---------------------------------------------------------------------------
+# Interactive preview only redraws on a content change
+# ---------------------------------------------------------------------------
+class TestInteractivePreviewRedraw:
+    """InteractivePreviewWidget only rebuilds its items when content changes."""
+
+    def test_unchanged_components_and_separator_skip_redraw(self, qapp):
+        from modules.ui_components import InteractivePreviewWidget
+
+        widget = InteractivePreviewWidget()
+        assert widget.count() == 1  # empty-state placeholder
+
+        widget.set_components(["2024-06-15", "A7R3", "001"])
+        with patch.object(widget, "update_display", wraps=widget.update_display) as spy:
+            widget.set_separator("-")
+            widget.set_components(["2024-06-15", "A7R3", "001"])
+            assert spy.call_count == 0
+            widget.set_separator("_")
+            widget.set_components(["A7R3", "2024-06-15", "001"])
+            assert spy.call_count == 2
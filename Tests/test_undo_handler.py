@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Unit tests for modules/handlers/undo_handler.py
+
+Covers the filename restore (folder listings, worker thread) and how a
+running restore keeps the rest of the UI out of the way.
+"""
+
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ---------------------------------------------------------------------------
+# Filename restore with per-folder listings
+# ---------------------------------------------------------------------------
+class TestRestoreFilenames:
+    """_restore_filenames checks existence from one listing per folder."""
+
+    def _handler(self, files):
+        from modules.handlers.undo_handler import UndoHandler
+
+        app = MagicMock()
+        app.files = list(files)
+        app.file_list.count.return_value = 0
+        return UndoHandler(app)
+
+    def test_restores_and_refuses_to_overwrite(self, tmp_path):
+        renamed_a = tmp_path / "2024-06-15_001.jpg"
+        renamed_b = tmp_path / "2024-06-15_002.jpg"
+        renamed_a.write_text("a")
+        renamed_b.write_text("b")
+        (tmp_path / "taken.jpg").write_text("other")
+        missing = tmp_path / "gone.jpg"
+
+        handler = self._handler([str(renamed_a), str(renamed_b)])
+        with patch("modules.handlers.undo_handler.os.path.exists") as mock_exists:
+            restored, errors = handler._restore_filenames([
+                (str(renamed_a), "DSC0001.jpg"),
+                (str(renamed_b), "taken.jpg"),
+                (str(missing), "DSC0003.jpg"),
+                # Name just freed up by the first restore's source
+                (str(tmp_path / "DSC0001.jpg"), "2024-06-15_001.jpg"),
+            ])
+        mock_exists.assert_not_called()
+
+        assert (tmp_path / "taken.jpg").read_text() == "other"
+        assert renamed_b.read_text() == "b"
+        assert (tmp_path / "2024-06-15_001.jpg").read_text() == "a"
+        assert restored == [str(tmp_path / "DSC0001.jpg"), str(tmp_path / "2024-06-15_001.jpg")]
+        assert len(errors) == 2
+
+    def test_case_variant_is_checked_on_disk(self, tmp_path):
+        from modules.handlers.undo_handler import _DirectoryListings
+
+        (tmp_path / "IMG_0001.JPG").touch()
+        listings = _DirectoryListings()
+        variant = str(tmp_path / "img_0001.jpg")
+        with patch("modules.handlers.undo_handler.os.path.exists", return_value=True) as mock_exists:
+            assert listings.exists(variant) is True
+        mock_exists.assert_called_once_with(variant)
+        assert listings.exists(str(tmp_path / "IMG_0002.JPG")) is False
+
+    def test_worker_thread_reports_results(self, tmp_path):
+        from modules.handlers.undo_handler import UndoWorkerThread
+
+        renamed = tmp_path / "2024-06-15_001.jpg"
+        renamed.write_text("a")
+        worker = UndoWorkerThread([(str(renamed), "DSC0001.jpg")])
+        progress, results = [], []
+        worker.progress_update.connect(progress.append)
+        worker.finished.connect(lambda *args: results.append(args))
+        worker.run()
+
+        target = str(tmp_path / "DSC0001.jpg")
+        assert progress == ["Restoring 1/1"]
+        assert results == [([target], [], {os.path.normpath(str(renamed)): target})]
+        assert (tmp_path / "DSC0001.jpg").read_text() == "a"
+
+
+# ---------------------------------------------------------------------------
+# undo_rename_action with the worker thread
+# ---------------------------------------------------------------------------
+class TestUndoWorkerLifecycle:
+    """A running restore marks the app busy and blocks a second undo."""
+
+    @pytest.fixture
+    def app(self, qapp):
+        from PyQt6.QtWidgets import QWidget
+
+        class _App(QWidget):
+            pass
+
+        app = _App()
+        app._busy = False
+
+        def _ui_set_busy(busy):
+            app._busy = busy
+
+        app._ui_set_busy = MagicMock(side_effect=_ui_set_busy)
+        app.undo_button = MagicMock()
+        app.update_status = MagicMock()
+        app.update_preview = MagicMock()
+        app.status = MagicMock()
+        app.file_list = MagicMock()
+        app.file_list.count.return_value = 0
+        app.files = []
+        yield app
+        app.deleteLater()
+
+    def test_busy_until_finished_and_second_click_ignored(self, app, tmp_path, qapp):
+        from PyQt6.QtWidgets import QMessageBox
+        from modules.handlers import undo_handler
+        from modules.handlers.undo_handler import UndoHandler
+
+        renamed = tmp_path / "2024-06-15_001.jpg"
+        renamed.write_text("a")
+        app.files = [str(renamed)]
+        handler = UndoHandler(app)
+        release = threading.Event()
+        real_restore = undo_handler._restore_filenames_on_disk
+
+        def _slow_restore(files, progress_callback=None):
+            release.wait(5)
+            return real_restore(files, progress_callback)
+
+        with patch.object(handler, "_check_undo_availability",
+                          return_value=([(str(renamed), "DSC0001.jpg")], False, False)), \
+                patch.object(handler, "_restore_all_timestamps", return_value=[]), \
+                patch.object(undo_handler, "_restore_filenames_on_disk", side_effect=_slow_restore), \
+                patch.object(undo_handler.QMessageBox, "question",
+                             return_value=QMessageBox.StandardButton.Yes) as question, \
+                patch.object(undo_handler.QMessageBox, "information"):
+            handler.undo_rename_action()
+            worker = handler._undo_worker
+            assert handler.is_running()
+            assert app._busy is True
+
+            # A second click while the worker runs does nothing
+            handler.undo_rename_action()
+            assert handler._undo_worker is worker
+            assert question.call_count == 1
+
+            release.set()
+            assert worker.wait(5000)
+            qapp.processEvents()
+
+        assert not handler.is_running()
+        assert app._busy is False
+        assert app.files == [str(tmp_path / "DSC0001.jpg")]
+        assert app.original_filenames == {}
+
+    def test_window_refuses_to_close_while_busy(self, app):
+        from modules.main_application import FileRenamerApp
+
+        app._busy = True
+        app.exif_service = MagicMock()
+        event = MagicMock()
+        FileRenamerApp.closeEvent(app, event)
+
+        event.ignore.assert_called_once_with()
+        app.exif_service.cleanup.assert_not_called()
+
+    def test_drop_is_ignored_while_busy(self, app):
+        from modules.ui.file_list_manager import FileListManager
+
+        app._busy = True
+        manager = FileListManager(app)
+        event = MagicMock()
+        with patch.object(manager, "add_files_to_list") as add:
+            manager.handle_drop(event)
+
+        event.ignore.assert_called_once_with()
+        event.mimeData.assert_not_called()
+        add.assert_not_called()
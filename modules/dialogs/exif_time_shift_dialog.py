@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 import os
+import subprocess
 from datetime import datetime, timedelta
 
 from ..logger_util import get_logger
@@ -36,7 +37,6 @@ class TimeShiftWorker(QThread):
         """Apply time shift to all files and create EXIF backup"""
         from ..exif_processor import get_exiftool_metadata_shared
         from ..backup_journal import PersistedBackupDict
-        import subprocess
         
         success_count = 0
         errors = []
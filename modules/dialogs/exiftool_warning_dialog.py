@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 import webbrowser
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
@@ -22,6 +23,37 @@ class ExifToolWarningDialog(QDialog):
 
     DOWNLOAD_URL = "https://exiftool.org/install.html"
 
+    _INFO_HTML = (
+        "<b>What is ExifTool?</b><br>"
+        "ExifTool is a powerful library for reading and writing metadata "
+        "in image and video files.<br><br>"
+        "<b>Why ExifTool is recommended:</b><br>"
+        "• <b>Complete RAW support:</b> Works with all camera RAW formats<br>"
+        "• <b>Video metadata:</b> Extracts date, camera, and technical data from videos<br>"
+        "• <b>More metadata:</b> Extracts camera, lens, and date information more reliably<br>"
+    )
+
+    # Platform never changes within a process - built on first use
+    _install_html: str | None = None
+
+    @classmethod
+    def show_if_needed(cls, parent: "QWidget | None", settings_manager) -> None:
+        """Show the dialog unless the user opted out, and store their choice.
+
+        The "don't show again" setting is checked before anything is built,
+        so suppressed startups never pay for constructing the dialog.
+
+        Args:
+            parent: Parent widget for the dialog.
+            settings_manager: SettingsManager holding the opt-out flag.
+        """
+        if not settings_manager.get_show_exiftool_warning():
+            return
+        dialog = cls(parent)
+        dialog.exec()
+        if not dialog.should_show_again():
+            settings_manager.set_show_exiftool_warning(False)
+
     def __init__(self, parent: "QWidget | None" = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("ExifTool Not Found — Installation Recommended")
@@ -57,21 +89,15 @@ class ExifToolWarningDialog(QDialog):
         layout.addWidget(status_label)
 
         # --- Explanation ---
-        info_text = QLabel(
-            "<b>What is ExifTool?</b><br>"
-            "ExifTool is a powerful library for reading and writing metadata "
-            "in image and video files.<br><br>"
-            "<b>Why ExifTool is recommended:</b><br>"
-            "• <b>Complete RAW support:</b> Works with all camera RAW formats<br>"
-            "• <b>Video metadata:</b> Extracts date, camera, and technical data from videos<br>"
-            "• <b>More metadata:</b> Extracts camera, lens, and date information more reliably<br>"
-        )
+        info_text = QLabel(self._INFO_HTML)
         info_text.setWordWrap(True)
         info_text.setStyleSheet("font-size: 11px; line-height: 1.4;")
         layout.addWidget(info_text)
 
         # --- Platform-specific install instructions ---
-        install_html = self._build_install_instructions()
+        if ExifToolWarningDialog._install_html is None:
+            ExifToolWarningDialog._install_html = self._build_install_instructions()
+        install_html = ExifToolWarningDialog._install_html
         install_label = QLabel(install_html)
         install_label.setWordWrap(True)
         install_label.setOpenExternalLinks(True)
@@ -152,6 +178,12 @@ class ExifToolWarningDialog(QDialog):
         return "".join(lines)
 
     def _open_download_page(self) -> None:
-        """Open the ExifTool download page in the default browser."""
-        webbrowser.open(self.DOWNLOAD_URL)
+        """Open the ExifTool download page in the default browser.
+
+        ``webbrowser.open`` can block while it launches a browser process,
+        so it runs on a daemon thread and the dialog closes immediately.
+        """
+        threading.Thread(
+            target=webbrowser.open, args=(self.DOWNLOAD_URL,), daemon=True
+        ).start()
         self.accept()
@@ -8,9 +8,11 @@ from __future__ import annotations
 import os
 import re
 import time
+import datetime
 import subprocess
 import glob
 import shutil
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from .logger_util import get_logger
@@ -23,6 +25,46 @@ try:
 except ImportError:
     EXIFTOOL_AVAILABLE = False
 
+# Date fields used for timestamp sync, in priority order
+_DATETIME_FIELDS = (
+    'EXIF:DateTimeOriginal', 'EXIF:DateTime', 'EXIF:CreateDate',
+    'DateTimeOriginal', 'DateTime', 'CreateDate',
+)
+# Bare tag names to request from ExifTool for the fields above
+_DATETIME_TAGS = ('DateTimeOriginal', 'DateTime', 'CreateDate')
+# Per-file loops report progress every this many files (the callback usually
+# ends in a cross-thread signal and a status-bar repaint)
+_PROGRESS_EVERY = 25
+
+
+def _first_exif_datetime(meta: dict):
+    """Return the first non-empty value of :data:`_DATETIME_FIELDS` in *meta*."""
+    for field in _DATETIME_FIELDS:
+        value = meta.get(field)
+        if value:
+            return value
+    return None
+
+
+def _parse_exif_datetime(value) -> datetime.datetime:
+    """Parse an EXIF ``YYYY:MM:DD HH:MM:SS`` (or ``YYYY:MM:DD``) value.
+
+    The fixed EXIF layout is sliced directly; anything else goes through
+    ``strptime``, which raises ``ValueError`` for unparseable values.
+    """
+    value = str(value)
+    if (len(value) == 19 and value[4] == ':' and value[7] == ':' and value[10] == ' '
+            and value[13] == ':' and value[16] == ':'):
+        digits = value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]
+        if digits.isdigit():
+            return datetime.datetime(
+                int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                int(digits[8:10]), int(digits[10:12]), int(digits[12:14]),
+            )
+    if ' ' in value:
+        return datetime.datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
+    return datetime.datetime.strptime(value, '%Y:%m:%d')
+
 # ---------------------------------------------------------------------------
 # Module-level ExifService reference for backward-compatible delegate functions.
 # Call set_default_exif_service() once during application startup.
@@ -102,9 +144,15 @@ def cleanup_global_exiftool() -> None:
     if _default_exif_service:
         _default_exif_service.cleanup()
 
+@lru_cache(maxsize=1)
 def find_exiftool_path():
     """
     Find the ExifTool executable path automatically
+
+    The result is memoized for the lifetime of the process because the search
+    globs folders and runs ``exiftool -ver``; call
+    ``find_exiftool_path.cache_clear()`` to force a fresh search (e.g. after
+    the user installs ExifTool).
     
     Returns:
         str: Path to ExifTool executable or None if not found
@@ -286,12 +334,7 @@ def sync_exif_date_to_file_date(file_path, exiftool_path=None, backup_timestamps
         elif preexif_dt is not None:
             # Pre-fetched raw EXIF datetime string (already from allowed fields)
             try:
-                import datetime as _dt
-                value = str(preexif_dt)
-                if ' ' in value:
-                    dt = _dt.datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
-                else:
-                    dt = _dt.datetime.strptime(value, '%Y:%m:%d')
+                dt = _parse_exif_datetime(preexif_dt)
             except Exception:
                 return False, "Invalid pre-extracted EXIF date", original_times
         else:
@@ -299,22 +342,13 @@ def sync_exif_date_to_file_date(file_path, exiftool_path=None, backup_timestamps
             try:
                 if not EXIFTOOL_AVAILABLE:
                     return False, "EXIF extraction not available", original_times
-                helper_exec = exiftool_path if exiftool_path else None
-                with exiftool.ExifToolHelper(executable=helper_exec) as et:
-                    meta = et.get_metadata(file_path)[0]
-                exif_date = None
-                for field in ['EXIF:DateTimeOriginal','EXIF:DateTime','EXIF:CreateDate','DateTimeOriginal','DateTime','CreateDate']:
-                    if field in meta and meta[field]:
-                        exif_date = meta[field]
-                        break
+                # Shared stay_open ExifService process when registered,
+                # instead of spawning a fresh ExifTool per file
+                meta = get_exiftool_metadata_shared(file_path, exiftool_path)
+                exif_date = _first_exif_datetime(meta)
                 if not exif_date:
                     return False, "No EXIF date found in file", original_times
-                import datetime as _dt
-                value = str(exif_date)
-                if ' ' in value:
-                    dt = _dt.datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
-                else:
-                    dt = _dt.datetime.strptime(value, '%Y:%m:%d')
+                dt = _parse_exif_datetime(exif_date)
             except Exception as e:
                 return False, f"Error accessing EXIF data: {e}", original_times
         if not dt:
@@ -373,8 +407,6 @@ def _set_file_timestamp_method3(file_path, dt):
     try:
         if os.name != 'nt':  # Not Windows
             return False
-            
-        import subprocess
         
         # Format date for PowerShell (ISO 8601)
         ps_date = dt.strftime('%Y-%m-%dT%H:%M:%S')
@@ -514,12 +546,7 @@ def batch_sync_exif_dates(file_paths, exiftool_path=None, progress_callback=None
                 raw_batch = _default_exif_service.batch_get_raw_metadata(file_paths, chunk_size=100)
                 for fpath, meta in raw_batch.items():
                     if meta:
-                        dt_value = None
-                        for field in ['EXIF:DateTimeOriginal', 'EXIF:DateTime', 'EXIF:CreateDate',
-                                      'DateTimeOriginal', 'DateTime', 'CreateDate']:
-                            if field in meta and meta[field]:
-                                dt_value = meta[field]
-                                break
+                        dt_value = _first_exif_datetime(meta)
                         if dt_value:
                             prefetch_map[fpath] = dt_value
             else:
@@ -529,17 +556,12 @@ def batch_sync_exif_dates(file_paths, exiftool_path=None, progress_callback=None
                     CHUNK = 100
                     for start in range(0, len(file_paths), CHUNK):
                         subset = file_paths[start:start + CHUNK]
-                        metas = et.get_metadata(subset)
+                        metas = et.get_tags(subset, list(_DATETIME_TAGS))
                         for meta in metas:
                             fpath = meta.get('SourceFile')
                             if not fpath:
                                 continue
-                            dt_value = None
-                            for field in ['EXIF:DateTimeOriginal', 'EXIF:DateTime', 'EXIF:CreateDate',
-                                          'DateTimeOriginal', 'DateTime', 'CreateDate']:
-                                if field in meta and meta[field]:
-                                    dt_value = meta[field]
-                                    break
+                            dt_value = _first_exif_datetime(meta)
                             if dt_value:
                                 prefetch_map[fpath] = dt_value
             if progress_callback:
@@ -550,7 +572,7 @@ def batch_sync_exif_dates(file_paths, exiftool_path=None, progress_callback=None
             prefetch_map = {}
 
     for i, file_path in enumerate(file_paths):
-        if progress_callback:
+        if progress_callback and i % _PROGRESS_EVERY == 0:
             progress_callback(f"Processing {i+1}/{len(file_paths)}: {os.path.basename(file_path)}")
 
         pre_dt = prefetch_map.get(file_path)
@@ -582,7 +604,7 @@ def batch_restore_timestamps(backup_data, progress_callback=None):
     file_paths = list(backup_data.keys())
     
     for i, file_path in enumerate(file_paths):
-        if progress_callback:
+        if progress_callback and i % _PROGRESS_EVERY == 0:
             progress_callback(f"Restoring {i+1}/{len(file_paths)}: {os.path.basename(file_path)}")
         
         original_times = backup_data[file_path]
@@ -608,8 +630,6 @@ def restore_exif_timestamps(file_path, original_exif, exiftool_path):
     Returns:
         tuple: (success: bool, message: str)
     """
-    import subprocess
-    
     try:
         if not os.path.exists(file_path):
             return False, f"File not found: {file_path}"
@@ -671,7 +691,7 @@ def batch_restore_exif_timestamps(backup_data, exiftool_path, progress_callback=
     file_paths = list(backup_data.keys())
     
     for i, file_path in enumerate(file_paths):
-        if progress_callback:
+        if progress_callback and i % _PROGRESS_EVERY == 0:
             progress_callback(f"Restoring EXIF {i+1}/{len(file_paths)}: {os.path.basename(file_path)}")
         
         original_exif = backup_data[file_path]
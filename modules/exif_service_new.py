@@ -6,10 +6,12 @@ Replaces global variables with instance variables for better thread safety and t
 from __future__ import annotations
 
 import os
+import json
 import time
 import threading
 import subprocess
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from .logger_util import get_logger
 log = get_logger()
@@ -21,6 +23,20 @@ try:
 except ImportError:
     EXIFTOOL_AVAILABLE = False
 
+# Shared table for the space->dash cleanup of camera/lens names
+_SPACE_TO_DASH = str.maketrans(" ", "-")
+
+
+def _compact_exif_date(date: str) -> str:
+    """Turn an EXIF ``YYYY:MM:DD HH:MM:SS`` value into ``YYYYMMDD``.
+
+    Slices the fixed EXIF layout directly; anything else falls back to
+    dropping the time part and the colons.
+    """
+    if len(date) >= 10 and date[4] == ":" and date[7] == ":":
+        return date[0:4] + date[5:7] + date[8:10]
+    return date.split(" ")[0].replace(":", "")
+
 
 class ExifService:
     """
@@ -39,6 +55,24 @@ class ExifService:
         self._cache: OrderedDict = OrderedDict()
         self._cache_lock = threading.Lock()
         self._cache_max_size = 10000  # Prevent unbounded memory growth
+        # Entries loaded from the on-disk cache of a previous run (see
+        # load_persistent_cache). Kept apart from _cache so that clearing
+        # the session cache on file load doesn't throw away the disk cache.
+        self._persisted: dict = {}
+        # Background load/save started by the *_persistent_cache_async
+        # methods, and a counter bumped whenever _persisted is discarded so
+        # a load that was already running doesn't bring stale entries back.
+        self._persist_loader: threading.Thread | None = None
+        self._persist_saver: threading.Thread | None = None
+        self._persist_generation = 0
+        # Raw metadata dicts for the UI (quick info, metadata dialog,
+        # shooting-setting detection), keyed like _cache plus the tag subset.
+        # Raw dicts are large, so this is kept much smaller than _cache.
+        self._raw_cache: OrderedDict = OrderedDict()
+        self._raw_cache_max_size = 256
+        # BATCH_TAGS-only dicts from batch_get_raw_metadata, keyed by
+        # (path, size, mtime). Small per entry, so bounded like _cache.
+        self._batch_cache: OrderedDict = OrderedDict()
         self._exiftool_instance = None
         self._exiftool_lock = threading.Lock()  # Thread safety for ExifTool instance
         self._exiftool_path = exiftool_path or self._find_exiftool_path()
@@ -58,27 +92,231 @@ class ExifService:
         from .exif_processor import find_exiftool_path
         return find_exiftool_path()
     
-    def clear_cache(self) -> None:
-        """Clear the EXIF cache for fresh processing."""
+    def clear_cache(self, include_persistent: bool = False) -> None:
+        """Clear the EXIF cache for fresh processing.
+
+        Args:
+            include_persistent: Also drop entries loaded from the on-disk
+                cache and the batch memo. Needed after EXIF data was
+                rewritten in place (time shift, EXIF restore), which can
+                leave size and mtime intact. Otherwise both are kept, as
+                their (path, size, mtime) keys already miss for changed files.
+        """
         with self._cache_lock:
             self._cache.clear()
+            self._raw_cache.clear()
+            if include_persistent:
+                self._batch_cache.clear()
+                self._persisted.clear()
+                self._persist_generation += 1
+
+    # ------------------------------------------------------------------
+    # Cross-run persistence — avoids re-extracting unchanged files
+    # ------------------------------------------------------------------
+
+    PERSISTENT_CACHE_FILENAME = "exif_cache.json"
+    # Most recently used entries kept on disk (roughly 150 bytes each)
+    PERSISTENT_CACHE_MAX_ENTRIES = 20000
+
+    @staticmethod
+    def _cache_key(file_path: str, method) -> tuple:
+        """Build the cache key ``(path, size, mtime, method)`` for a file.
+
+        Including the size means a different file that ends up at the same
+        path with the same mtime (e.g. after a rename) still misses.
+        """
+        st = os.stat(file_path)
+        return (file_path, st.st_size, st.st_mtime, method)
+
+    def _lookup_cache(self, cache_key: tuple):
+        """Return a cached (date, camera, lens) tuple or None.
+
+        Falls back to entries loaded from disk, promoting hits into the
+        session cache. Must be called while holding ``_cache_lock``.
+        """
+        if cache_key in self._cache:
+            self._cache.move_to_end(cache_key)  # LRU: mark as recently used
+            return self._cache[cache_key]
+        result = self._persisted.get(cache_key)
+        if result is not None:
+            self._evict_cache_if_needed()
+            self._cache[cache_key] = result
+        return result
+
+    @classmethod
+    def _default_persistent_cache_path(cls) -> str:
+        from .backup_journal import get_app_data_dir
+        return os.path.join(get_app_data_dir(), cls.PERSISTENT_CACHE_FILENAME)
+
+    def load_persistent_cache(self, path: str | None = None) -> int:
+        """Load (date, camera, lens) results saved by a previous run.
+
+        Args:
+            path: Cache file location (defaults to the app-data directory).
+
+        Returns:
+            Number of entries loaded. A missing or unreadable cache file is
+            treated as empty.
+        """
+        path = path or self._default_persistent_cache_path()
+        with self._cache_lock:
+            generation = self._persist_generation
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+            loaded = {
+                (fp, size, mtime, method): (date, camera, lens)
+                for fp, size, mtime, method, date, camera, lens in rows
+            }
+        except (OSError, ValueError, TypeError) as e:
+            log.warning(f"Could not read EXIF cache {path!r} ({e}) - starting fresh")
+            return 0
+        with self._cache_lock:
+            if generation != self._persist_generation:
+                log.debug("Persisted EXIF cache was invalidated while loading")
+                return 0
+            self._persisted = loaded
+        log.debug(f"Loaded {len(loaded)} persisted EXIF cache entries")
+        return len(loaded)
+
+    def load_persistent_cache_async(self, path: str | None = None) -> None:
+        """Run :meth:`load_persistent_cache` on a daemon thread.
+
+        Keeps the JSON parse off the GUI thread at startup; lookups made
+        before it finishes simply miss. :meth:`save_persistent_cache`
+        waits for it, so an early close can't overwrite the file with an
+        empty cache.
+        """
+        self._persist_loader = threading.Thread(
+            target=self.load_persistent_cache, args=(path,),
+            name="exif-cache-load", daemon=True,
+        )
+        self._persist_loader.start()
+
+    def save_persistent_cache_async(self, path: str | None = None) -> None:
+        """Run :meth:`save_persistent_cache` on a background thread.
+
+        Keeps the stat calls and JSON write off the GUI thread when the
+        window closes. The thread is not a daemon, so the interpreter waits
+        for the write to finish before exiting.
+        """
+        self._persist_saver = threading.Thread(
+            target=self.save_persistent_cache, args=(path,),
+            name="exif-cache-save",
+        )
+        self._persist_saver.start()
+
+    def save_persistent_cache(self, path: str | None = None) -> int:
+        """Write the most recently used entries to disk.
+
+        Entries are kept newest first up to ``PERSISTENT_CACHE_MAX_ENTRIES``.
+        Entries used this session are dropped if their file is gone or no
+        longer matches the cached size and mtime. Entries carried over from
+        earlier runs aren't stat'ed (that could mean thousands of calls on
+        a network or removable drive); a stale one simply never matches a
+        lookup key and ages out of the cap. Failed reads (all fields None)
+        are dropped too, so a transient ExifTool error isn't remembered
+        across runs.
+
+        Args:
+            path: Cache file location (defaults to the app-data directory).
+
+        Returns:
+            Number of entries written.
+        """
+        path = path or self._default_persistent_cache_path()
+        loader = self._persist_loader
+        if loader is not None:
+            loader.join()
+        with self._cache_lock:
+            merged = dict(self._persisted)
+            # Session entries last, in LRU order: they're the most recent
+            for key, result in self._cache.items():
+                merged.pop(key, None)
+                merged[key] = result
+            session_keys = set(self._cache)
+
+        rows = []
+        for key, result in reversed(merged.items()):
+            if len(rows) >= self.PERSISTENT_CACHE_MAX_ENTRIES:
+                break
+            fp, size, mtime, method = key
+            if not isinstance(fp, str) or not any(result):
+                continue
+            if key in session_keys:
+                try:
+                    st = os.stat(fp)
+                except OSError:
+                    continue
+                if st.st_size != size or st.st_mtime != mtime:
+                    continue
+            rows.append([fp, size, mtime, method, *result])
+        # Oldest first, so the next save's merge keeps the LRU order
+        rows.reverse()
+
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning(f"Could not persist EXIF cache to {path!r}: {e}")
+            try:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            except OSError:
+                pass
+            return 0
+        return len(rows)
 
     # ------------------------------------------------------------------
     # Batch extraction — reduces N ExifTool IPC calls to ceil(N/chunk)
     # ------------------------------------------------------------------
 
+    # Every tag read from batch results by the parse_* helpers below, the
+    # rename engine's sort key and batch_sync_exif_dates. Asking ExifTool
+    # for just these (instead of everything) keeps Perl-side work and the
+    # JSON payload per file small.
+    BATCH_TAGS = (
+        "DateTimeOriginal", "CreateDate", "CreationDate", "DateTime",
+        "Model", "LensModel", "LensInfo",
+        "FNumber", "ApertureValue", "ISO", "FocalLength", "ExposureTime",
+    )
+    # -fast2: don't read trailers or maker notes, none of BATCH_TAGS live there
+    BATCH_PARAMS = ("-fast2",)
+
+    # Tags read from the detection file to see which shooting settings it
+    # records (FileRenamerApp.extract_camera_info). SonyISO lives in the
+    # maker notes, so these reads don't use BATCH_PARAMS.
+    SHOOTING_SETTING_TAGS = (
+        "ISO", "SonyISO", "FNumber", "Aperture", "ExposureTime", "FocalLength",
+    )
+
     def batch_get_raw_metadata(
-        self, file_paths: list[str], chunk_size: int = 50
+        self, file_paths: list[str], chunk_size: int = 50, max_workers: int = 1
     ) -> dict[str, dict]:
         """Batch-extract raw EXIF metadata for many files at once.
 
         Instead of one ExifTool IPC round-trip per file, this sends
-        *chunk_size* file paths in a single ``get_metadata()`` call.
+        *chunk_size* file paths in a single ``get_tags()`` call.
         For 300 files with chunk_size=50 this is 6 calls instead of 300.
+        Only :attr:`BATCH_TAGS` are requested; use :meth:`extract_raw_exif`
+        when the full tag set is needed.
+
+        Results are memoized per (path, size, mtime), and the parsed
+        (date, camera, lens) tuple is stored in the per-file cache too, so
+        prefetching right after files are loaded lets later preview and
+        rename passes skip ExifTool for unchanged files.
 
         Args:
             file_paths: List of file paths to extract metadata from.
             chunk_size: Files per ExifTool batch call (default 50).
+            max_workers: Number of ExifTool processes to spread chunks over.
+                The default of 1 uses only the shared instance; higher
+                values start extra stay_open processes for the duration of
+                this call (useful on SSDs, can thrash spinning disks).
 
         Returns:
             Dict mapping each input file path to its raw metadata dict.
@@ -88,41 +326,153 @@ class ExifService:
         if not file_paths:
             return results
 
-        # Normalize paths and filter to existing files
+        # Normalize paths, filter to existing files and serve cached entries
         path_pairs: list[tuple[str, str]] = []
-        for fp in file_paths:
-            norm = os.path.normpath(fp)
-            if os.path.exists(norm):
-                path_pairs.append((norm, fp))
-            else:
-                results[fp] = {}
+        keys: dict[str, tuple] = {}
+        with self._cache_lock:
+            for fp in file_paths:
+                norm = os.path.normpath(fp)
+                try:
+                    st = os.stat(norm)
+                except OSError:
+                    results[fp] = {}
+                    continue
+                key = (norm, st.st_size, st.st_mtime)
+                cached = self._batch_cache.get(key)
+                if cached is not None:
+                    results[fp] = cached
+                else:
+                    keys[fp] = key
+                    path_pairs.append((norm, fp))
+
+        chunks = [
+            path_pairs[i : i + chunk_size]
+            for i in range(0, len(path_pairs), chunk_size)
+        ]
+
+        fetched: dict[str, dict] = {}
+        if max_workers > 1 and len(chunks) > 1:
+            fetched = self._batch_chunks_parallel(chunks, max_workers)
+        else:
+            for chunk in chunks:
+                fetched.update(self._batch_chunk_shared(chunk))
 
+        self._store_batch_results(fetched, keys)
+        results.update(fetched)
+        return results
+
+    def _store_batch_results(self, fetched: dict[str, dict], keys: dict[str, tuple]) -> None:
+        """Memoize freshly fetched batch metadata and its parsed fields."""
+        with self._cache_lock:
+            for fp, meta in fetched.items():
+                key = keys.get(fp)
+                if not meta or key is None:
+                    continue
+                self._batch_cache[key] = meta
+                parsed = (
+                    self.parse_date_from_raw(meta),
+                    self.parse_camera_from_raw(meta),
+                    self.parse_lens_from_raw(meta),
+                )
+                self._cache[key + (self.current_method,)] = parsed
+                if fp != key[0]:
+                    # get_cached_exif_data keys on the path as given
+                    self._cache[(fp,) + key[1:] + (self.current_method,)] = parsed
+            while len(self._batch_cache) > self._cache_max_size:
+                self._batch_cache.popitem(last=False)
+            self._evict_cache_if_needed()
+
+    def _batch_chunk_shared(self, chunk: list[tuple[str, str]]) -> dict[str, dict]:
+        """Extract one chunk of ``(normalized, original)`` paths on the shared instance."""
         exiftool_path = self._exiftool_path
+        chunk_norms = [norm for norm, _orig in chunk]
+        results: dict[str, dict] = {}
 
-        for i in range(0, len(path_pairs), chunk_size):
-            chunk = path_pairs[i : i + chunk_size]
-            chunk_norms = [norm for norm, _orig in chunk]
+        try:
+            with self._exiftool_lock:
+                self._ensure_exiftool_running(exiftool_path)
+                batch_meta = self._exiftool_instance.get_tags(
+                    chunk_norms, list(self.BATCH_TAGS), params=list(self.BATCH_PARAMS)
+                )
 
-            try:
-                with self._exiftool_lock:
-                    self._ensure_exiftool_running(exiftool_path)
-                    batch_meta = self._exiftool_instance.get_metadata(chunk_norms)
+            for (norm, orig), meta in zip(chunk, batch_meta):
+                results[orig] = meta
+        except Exception as e:
+            log.warning(f"Batch ExifTool failed for chunk, falling back to per-file: {e}")
+            # Rebuild instance for next attempt
+            with self._exiftool_lock:
+                self._kill_exiftool_instance()
+            results.update(self._per_file_fallback(chunk, results))
+
+        return results
+
+    def _per_file_fallback(
+        self, chunk: list[tuple[str, str]], done: dict[str, dict]
+    ) -> dict[str, dict]:
+        """Extract the files of a failed chunk one by one on the shared instance."""
+        results: dict[str, dict] = {}
+        for norm, orig in chunk:
+            if orig not in done:
+                try:
+                    results[orig] = self._get_exiftool_metadata_shared(norm, self._exiftool_path)
+                except Exception as e2:
+                    log.debug(f"Per-file ExifTool fallback failed for {norm}: {e2}")
+                    results[orig] = {}
+        return results
+
+    def _batch_chunks_parallel(
+        self, chunks: list[list[tuple[str, str]]], max_workers: int
+    ) -> dict[str, dict]:
+        """Spread chunks over *max_workers* short-lived stay_open ExifTool processes.
 
-                for (norm, orig), meta in zip(chunk, batch_meta):
-                    results[orig] = meta
+        ExifTool does the work out-of-process, so plain threads are enough:
+        each worker thread owns its own ``ExifToolHelper`` and only waits on
+        its pipe. All helpers are shut down before returning.
+        """
+        exiftool_path = self._exiftool_path
+        local = threading.local()
+        helpers: list = []
+        helpers_lock = threading.Lock()
+
+        def _helper():
+            et = getattr(local, "et", None)
+            if et is None:
+                if exiftool_path and os.path.exists(exiftool_path):
+                    et = exiftool.ExifToolHelper(executable=exiftool_path)
+                else:
+                    et = exiftool.ExifToolHelper()
+                et.__enter__()
+                local.et = et
+                with helpers_lock:
+                    helpers.append(et)
+            return et
+
+        def _run(chunk: list[tuple[str, str]]) -> dict[str, dict]:
+            try:
+                batch_meta = _helper().get_tags(
+                    [norm for norm, _orig in chunk],
+                    list(self.BATCH_TAGS),
+                    params=list(self.BATCH_PARAMS),
+                )
+                return {orig: meta for (_norm, orig), meta in zip(chunk, batch_meta)}
             except Exception as e:
-                log.warning(f"Batch ExifTool failed for chunk, falling back to per-file: {e}")
-                # Rebuild instance for next attempt
-                with self._exiftool_lock:
-                    self._kill_exiftool_instance()
-                for norm, orig in chunk:
-                    if orig not in results:
-                        try:
-                            results[orig] = self._get_exiftool_metadata_shared(norm, exiftool_path)
-                        except Exception as e2:
-                            log.debug(f"Per-file ExifTool fallback failed for {norm}: {e2}")
-                            results[orig] = {}
+                log.warning(f"Parallel ExifTool chunk failed, falling back to per-file: {e}")
+                return self._per_file_fallback(chunk, {})
 
+        results: dict[str, dict] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+                for chunk_result in pool.map(_run, chunks):
+                    results.update(chunk_result)
+        finally:
+            for et in helpers:
+                try:
+                    et.__exit__(None, None, None)
+                except Exception:
+                    try:
+                        et.terminate()
+                    except Exception:
+                        pass
         return results
 
     # ------------------------------------------------------------------
@@ -138,7 +488,7 @@ class ExifService:
             or meta.get("DateTimeOriginal")
         )
         if date:
-            return date.split(" ")[0].replace(":", "")
+            return _compact_exif_date(date)
         return None
 
     @staticmethod
@@ -146,7 +496,7 @@ class ExifService:
         """Extract camera model from raw EXIF metadata."""
         camera = meta.get("EXIF:Model") or meta.get("Model")
         if camera:
-            return str(camera).replace(" ", "-")
+            return str(camera).translate(_SPACE_TO_DASH)
         return None
 
     @staticmethod
@@ -158,7 +508,7 @@ class ExifService:
             or meta.get("LensInfo")
         )
         if lens:
-            return str(lens).replace(" ", "-")
+            return str(lens).translate(_SPACE_TO_DASH)
         return None
 
     @staticmethod
@@ -222,12 +572,12 @@ class ExifService:
         # Camera
         camera = meta.get("EXIF:Model") or meta.get("Model")
         if camera:
-            metadata["camera"] = str(camera).replace(" ", "-")
+            metadata["camera"] = str(camera).translate(_SPACE_TO_DASH)
 
         # Lens
         lens = meta.get("EXIF:LensModel") or meta.get("LensModel")
         if lens:
-            metadata["lens"] = str(lens).replace(" ", "-")
+            metadata["lens"] = str(lens).translate(_SPACE_TO_DASH)
 
         return metadata
 
@@ -274,15 +624,14 @@ class ExifService:
         exiftool_path = exiftool_path or self._exiftool_path
         
         try:
-            # Create cache key based on file path and modification time
-            mtime = os.path.getmtime(file_path)
-            cache_key = (file_path, mtime, method)
+            # Create cache key based on file path, size and modification time
+            cache_key = self._cache_key(file_path, method)
             
             # Check cache first
             with self._cache_lock:
-                if cache_key in self._cache:
-                    self._cache.move_to_end(cache_key)  # LRU: mark as recently used
-                    return self._cache[cache_key]
+                cached = self._lookup_cache(cache_key)
+            if cached is not None:
+                return cached
             
             # Extract EXIF data (not cached)
             result = self._extract_exif_fields_with_retry(file_path, method, exiftool_path, max_retries=2)
@@ -328,20 +677,19 @@ class ExifService:
                 log.warning(f"File not found: {normalized_path}")
                 return None, None, None
             
-            # Cache key: (path, mtime, method) — no field_signature needed.
+            # Cache key: (path, size, mtime, method) — no field_signature needed.
             # We always extract all 3 fields since ExifTool returns everything.
-            mtime = os.path.getmtime(normalized_path)
-            cache_key = (normalized_path, mtime, method)
+            cache_key = self._cache_key(normalized_path, method)
             
             with self._cache_lock:
-                if cache_key in self._cache:
-                    self._cache.move_to_end(cache_key)
-                    cached_date, cached_camera, cached_lens = self._cache[cache_key]
-                    return (
-                        cached_date if need_date else None,
-                        cached_camera if need_camera else None,
-                        cached_lens if need_lens else None,
-                    )
+                cached = self._lookup_cache(cache_key)
+            if cached is not None:
+                cached_date, cached_camera, cached_lens = cached
+                return (
+                    cached_date if need_date else None,
+                    cached_camera if need_camera else None,
+                    cached_lens if need_lens else None,
+                )
             
             # Extract ALL fields in one call (same IPC cost)
             result = self._extract_selective_exif_fields(
@@ -363,10 +711,13 @@ class ExifService:
             log.debug(f"Error in get_selective_cached_exif_data for {file_path}: {e}")
             return None, None, None
     
-    def _get_exiftool_metadata_shared(self, image_path, exiftool_path=None):
+    def _get_exiftool_metadata_shared(self, image_path, exiftool_path=None, tags=None):
         """
         PERFORMANCE OPTIMIZATION: Use a shared ExifTool instance to avoid
         the overhead of starting/stopping ExifTool for each file.
+
+        If *tags* is given, only those tags are requested so ExifTool does
+        not serialize the full metadata set.
         """
         # CRITICAL FIX: Normalize path to prevent double backslashes
         normalized_path = os.path.normpath(image_path)
@@ -382,6 +733,8 @@ class ExifService:
         try:
             with self._exiftool_lock:
                 self._ensure_exiftool_running(exiftool_path)
+                if tags:
+                    return self._exiftool_instance.get_tags([normalized_path], list(tags))[0]
                 meta = self._exiftool_instance.get_metadata([normalized_path])[0]
                 return meta
             
@@ -392,11 +745,13 @@ class ExifService:
                 self._kill_exiftool_instance()
             try:
                 if exiftool_path and os.path.exists(exiftool_path):
-                    with exiftool.ExifToolHelper(executable=exiftool_path) as et:
-                        return et.get_metadata([normalized_path])[0]
+                    helper = exiftool.ExifToolHelper(executable=exiftool_path)
                 else:
-                    with exiftool.ExifToolHelper() as et:
-                        return et.get_metadata([normalized_path])[0]
+                    helper = exiftool.ExifToolHelper()
+                with helper as et:
+                    if tags:
+                        return et.get_tags([normalized_path], list(tags))[0]
+                    return et.get_metadata([normalized_path])[0]
             except Exception as e2:
                 log.error(f"Temporary ExifTool instance also failed: {e2}")
                 return {}
@@ -450,6 +805,22 @@ class ExifService:
                     pass
             self._exiftool_instance = None
     
+    # Tags read by the per-file (date, camera, lens) extractors
+    FIELD_TAGS = ("DateTimeOriginal", "CreateDate", "Model", "LensModel", "LensInfo")
+
+    def _read_date_camera_lens(self, normalized_path, exiftool_path=None):
+        """Read (date, camera, lens) for one file with a single tag-limited call.
+
+        Both per-file extractors share this so that, whichever accessor runs
+        first, the cached tuple for a file is the same.
+        """
+        meta = self._get_exiftool_metadata_shared(normalized_path, exiftool_path, tags=self.FIELD_TAGS)
+        return (
+            self.parse_date_from_raw(meta),
+            self.parse_camera_from_raw(meta),
+            self.parse_lens_from_raw(meta),
+        )
+
     def _extract_exif_fields_with_retry(self, image_path, method, exiftool_path=None, max_retries=3):
         """
         Extracts EXIF fields with retry mechanism for reliability.
@@ -466,25 +837,7 @@ class ExifService:
         for attempt in range(max_retries):
             try:
                 if method == "exiftool":
-                    # PERFORMANCE OPTIMIZATION: Use shared ExifTool instance instead of creating new process
-                    meta = self._get_exiftool_metadata_shared(normalized_path, exiftool_path)
-                    
-                    # Extract date
-                    date = meta.get('EXIF:DateTimeOriginal')
-                    if date:
-                        date = date.split(' ')[0].replace(':', '')
-                    
-                    # Extract camera model
-                    camera = meta.get('EXIF:Model')
-                    if camera:
-                        camera = str(camera).replace(' ', '-')
-                    
-                    # Extract lens model
-                    lens = meta.get('EXIF:LensModel') or meta.get('LensInfo')
-                    if lens:
-                        lens = str(lens).replace(' ', '-')
-                    
-                    return date, camera, lens
+                    return self._read_date_camera_lens(normalized_path, exiftool_path)
                 else:
                     log.warning(f"Unsupported EXIF method: {method}")
                     return None, None, None
@@ -530,32 +883,12 @@ class ExifService:
         for attempt in range(max_retries):
             try:
                 if method == "exiftool":
-                    # Use shared ExifTool instance for better performance
-                    meta = self._get_exiftool_metadata_shared(normalized_path, exiftool_path)
-                    
-                    # Extract only requested fields
-                    date = None
-                    camera = None
-                    lens = None
-                    
-                    if need_date:
-                        date = meta.get('EXIF:DateTimeOriginal') or meta.get('CreateDate') or meta.get('DateTimeOriginal')
-                        if date:
-                            date = date.split(' ')[0].replace(':', '')
-                    
-                    if need_camera:
-                        # Use the same simple approach as the working old application
-                        camera = meta.get('EXIF:Model') or meta.get('Model')
-                        if camera:
-                            camera = str(camera).replace(' ', '-')
-                    
-                    if need_lens:
-                        # Use the same simple approach as the working old application
-                        lens = meta.get('EXIF:LensModel') or meta.get('LensModel') or meta.get('LensInfo')
-                        if lens:
-                            lens = str(lens).replace(' ', '-')
-                    
-                    return date, camera, lens
+                    date, camera, lens = self._read_date_camera_lens(normalized_path, exiftool_path)
+                    return (
+                        date if need_date else None,
+                        camera if need_camera else None,
+                        lens if need_lens else None,
+                    )
                 else:
                     log.warning(f"Unsupported EXIF method: {method}")
                     return None, None, None
@@ -593,11 +926,39 @@ class ExifService:
             log.error(f"Error extracting metadata from {file_path}: {e}")
             return {}
     
-    def extract_raw_exif(self, file_path):
-        """Extract raw EXIF data dictionary"""
-        if self.current_method == "exiftool":
-            return self._get_exiftool_metadata_shared(file_path, self._exiftool_path)
-        return {}
+    def extract_raw_exif(self, file_path, tags=None):
+        """Extract raw EXIF data dictionary
+
+        Results are memoized per (path, size, mtime), so repeated UI lookups
+        for the same unchanged file don't go back to ExifTool.
+
+        Args:
+            file_path: Path to the media file.
+            tags: Optional iterable of tag names to restrict the lookup to.
+        """
+        if self.current_method != "exiftool":
+            return {}
+        tag_key = tuple(tags) if tags else None
+        try:
+            base_key = self._cache_key(os.path.normpath(file_path), "raw")
+        except OSError:
+            return self._get_exiftool_metadata_shared(file_path, self._exiftool_path, tags=tags)
+
+        with self._cache_lock:
+            # A cached full read also answers any tag-limited request
+            for key in ((base_key, None), (base_key, tag_key)):
+                meta = self._raw_cache.get(key)
+                if meta is not None:
+                    self._raw_cache.move_to_end(key)
+                    return meta
+
+        meta = self._get_exiftool_metadata_shared(file_path, self._exiftool_path, tags=tags)
+        if meta:
+            with self._cache_lock:
+                self._raw_cache[(base_key, tag_key)] = meta
+                while len(self._raw_cache) > self._raw_cache_max_size:
+                    self._raw_cache.popitem(last=False)
+        return meta
     
     def is_exiftool_available(self):
         """Check if ExifTool is available"""
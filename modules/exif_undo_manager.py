@@ -14,6 +14,7 @@ from __future__ import annotations
 import os
 import json
 import subprocess
+from datetime import datetime
 from typing import Optional, Tuple, List
 from .logger_util import get_logger
 
@@ -24,6 +25,20 @@ EXIF_USER_COMMENT_FIELD = "EXIF:UserComment"
 ORIGINAL_NAME_PREFIX = "OriginalName: "
 RENAME_DATE_PREFIX = " | RenameDate: "
 
+# ExifTool executables already seen on disk. The path is resolved once at
+# startup, so the per-file helpers below only stat it the first time.
+_KNOWN_EXIFTOOL_PATHS: set[str] = set()
+
+
+def _exiftool_exists(exiftool_path: str | None) -> bool:
+    """Return True if *exiftool_path* exists, remembering positive results."""
+    if exiftool_path in _KNOWN_EXIFTOOL_PATHS:
+        return True
+    if exiftool_path and os.path.exists(exiftool_path):
+        _KNOWN_EXIFTOOL_PATHS.add(exiftool_path)
+        return True
+    return False
+
 
 def _read_existing_user_comment(
     file_path: str,
@@ -82,7 +97,7 @@ def write_original_filename_to_exif(
         if not os.path.exists(file_path):
             return False, f"File not found: {file_path}"
         
-        if not exiftool_path or not os.path.exists(exiftool_path):
+        if not _exiftool_exists(exiftool_path):
             return False, "ExifTool executable not found"
         
         # Safety check: warn if overwriting non-renamepy UserComment data
@@ -97,7 +112,6 @@ def write_original_filename_to_exif(
         user_comment = f"{ORIGINAL_NAME_PREFIX}{original_filename}"
         
         if add_timestamp:
-            from datetime import datetime
             timestamp = datetime.now().strftime("%Y:%m:%d %H:%M:%S")
             user_comment += f"{RENAME_DATE_PREFIX}{timestamp}"
         
@@ -159,7 +173,7 @@ def get_original_filename_from_exif(
             log.warning(f"File not found: {file_path}")
             return None
         
-        if not exiftool_path or not os.path.exists(exiftool_path):
+        if not _exiftool_exists(exiftool_path):
             log.warning("ExifTool executable not found")
             return None
         
@@ -235,7 +249,7 @@ def batch_write_original_filenames(
     if not files:
         return [], []
     
-    if not exiftool_path or not os.path.exists(exiftool_path):
+    if not _exiftool_exists(exiftool_path):
         return [], [(f, "ExifTool executable not found") for f, _ in files]
     
     successes = []
@@ -247,8 +261,6 @@ def batch_write_original_filenames(
     # We'll use the simpler approach: build args for all files in one invocation
     CHUNK_SIZE = 50  # Process in chunks to avoid command-line length limits
     
-    from datetime import datetime
-    
     for chunk_start in range(0, len(files), CHUNK_SIZE):
         chunk = files[chunk_start:chunk_start + CHUNK_SIZE]
         cmd = [exiftool_path, "-overwrite_original"]
@@ -339,7 +351,7 @@ def batch_get_original_filenames(
     result_map: dict[str, Optional[str]] = {}
     
     try:
-        if not exiftool_path or not os.path.exists(exiftool_path):
+        if not _exiftool_exists(exiftool_path):
             log.warning("ExifTool executable not found")
             return {path: None for path in file_paths}
         
@@ -435,7 +447,7 @@ def clear_original_filename_from_exif(
         if not os.path.exists(file_path):
             return False, f"File not found: {file_path}"
         
-        if not exiftool_path or not os.path.exists(exiftool_path):
+        if not _exiftool_exists(exiftool_path):
             return False, "ExifTool executable not found"
         
         # Build ExifTool command to delete field
@@ -6,22 +6,28 @@ from __future__ import annotations
 
 import os
 import re
+import stat
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import lru_cache
 from .logger_util import get_logger
 log = get_logger()
 from .filename_components import build_ordered_components
 
+_DIGIT_RUNS_RE = re.compile(r'(\d+)')
+
+
 def natural_sort_key(filename: str) -> list:
     """Generate a sort key for natural sorting (handles numbers correctly).
 
     Example:
         DSC00001 comes before DSC00009.
     """
-    def convert(text: str) -> int | str:
-        return int(text) if text.isdigit() else text.lower()
-    
-    return [convert(c) for c in re.split(r'(\d+)', filename)]
+    # re.split puts text at even indices and digit runs at odd ones
+    return [
+        int(part) if i % 2 else part.lower()
+        for i, part in enumerate(_DIGIT_RUNS_RE.split(filename))
+    ]
 
 # remove duplicated get_filename_components_static definition and provide thin wrapper if needed for backward compatibility
 def get_filename_components_static(date_taken, camera_prefix, additional, camera_model, lens_model, use_camera, use_lens, num, custom_order, date_format="YYYY-MM-DD", use_date=True, selected_metadata=None):
@@ -77,38 +83,148 @@ IMAGE_EXTENSIONS = FileConstants.IMAGE_EXTENSIONS
 VIDEO_EXTENSIONS = FileConstants.VIDEO_EXTENSIONS
 MEDIA_EXTENSIONS = FileConstants.MEDIA_EXTENSIONS
 
+# Hash sets for the per-file extension checks below
+_IMAGE_EXT_SET = frozenset(IMAGE_EXTENSIONS)
+_VIDEO_EXT_SET = frozenset(VIDEO_EXTENSIONS)
+_MEDIA_EXT_SET = _IMAGE_EXT_SET | _VIDEO_EXT_SET
+
+# "Select Media Files" dialog filter, built once from the same extension lists
+def _name_patterns(extensions) -> str:
+    return " ".join(f"*{ext}" for ext in extensions)
+
+MEDIA_FILE_DIALOG_FILTER = ";;".join((
+    f"Media Files ({_name_patterns(MEDIA_EXTENSIONS)})",
+    f"Image Files ({_name_patterns(IMAGE_EXTENSIONS)})",
+    f"Video Files ({_name_patterns(VIDEO_EXTENSIONS)})",
+    "All Files (*)",
+))
+
+def _lower_ext(filename: str) -> str:
+    """Return the lowercased extension of *filename* like ``os.path.splitext``.
+
+    Uses ``rfind`` instead of ``splitext`` since this runs once per scanned
+    file. Dots in directory names and leading dots of hidden files are not
+    treated as an extension separator.
+    """
+    i = filename.rfind('.')
+    if i < 0:
+        return ''
+    sep = max(filename.rfind('/'), filename.rfind(os.sep))
+    if i < sep or not filename[sep + 1:i].strip('.'):
+        return ''
+    return filename[i:].lower()
+
+# The same paths are classified again by the stats, camera detection, preview
+# and rename passes; sized so a large drop stays cached across those passes.
+_CLASSIFY_CACHE_SIZE = 16384
+
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
 def is_image_file(filename: str) -> bool:
     """Returns True if the file is an image or RAW file based on its extension."""
-    return os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS
+    return _lower_ext(filename) in _IMAGE_EXT_SET
 
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
 def is_video_file(filename: str) -> bool:
     """Returns True if the file is a video file based on its extension."""
-    return os.path.splitext(filename)[1].lower() in VIDEO_EXTENSIONS
+    return _lower_ext(filename) in _VIDEO_EXT_SET
 
+@lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)
 def is_media_file(filename: str) -> bool:
     """Returns True if the file is a media file (image, RAW, or video) based on its extension."""
-    return os.path.splitext(filename)[1].lower() in MEDIA_EXTENSIONS
+    return _lower_ext(filename) in _MEDIA_EXT_SET
+
+def split_media_files(files) -> tuple[list, list]:
+    """Split *files* into ``(media, non_media)`` lists in one pass, keeping order."""
+    media, non_media = [], []
+    for f in files:
+        (media if is_media_file(f) else non_media).append(f)
+    return media, non_media
+
+# Extensions preferred for the rename preview example
+_PREVIEW_SUFFIXES = ('.jpg', '.jpeg')
+
+def pick_preview_file(files):
+    """Return the file the rename preview is built from, or None.
 
-def scan_directory_recursive(directory):
+    Prefers the first JPEG, then the first media file, then the first file.
+    One pass that stops at the first JPEG; only the short tail of each path
+    is lowercased for the suffix check.
+    """
+    first_media = None
+    for f in files:
+        if f[-5:].lower().endswith(_PREVIEW_SUFFIXES):
+            return f
+        if first_media is None and is_media_file(f):
+            first_media = f
+    if first_media is not None:
+        return first_media
+    return files[0] if files else None
+
+def _scan_dir(path):
+    """List one directory for :func:`scan_directory_recursive`.
+
+    Returns ``(media_paths, subdirectory_paths)``. File/dir checks use the
+    type information already returned by ``os.scandir`` instead of an extra
+    ``stat`` per entry; symlinked directories are not reported, to prevent
+    symlink loops and duplicate counting. Permission errors are logged and
+    yield empty results so one inaccessible folder does not abort the scan.
+    """
+    media, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif is_media_file(entry.name) and entry.is_file():
+                        media.append(entry.path)
+                except OSError as e:
+                    log.debug(f"Cannot inspect {entry.path}: {e}")
+    except OSError as e:
+        log.warning(f"Cannot access directory: {e}")
+    return media, subdirs
+
+# Directory listings are I/O-bound (os.scandir releases the GIL), so deep
+# trees on slow or network drives are listed several folders at a time.
+_SCAN_WORKERS = 8
+
+def _walk_media_files_parallel(directory):
+    """Collect media files below *directory*, listing folders concurrently."""
+    found = []
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        pending = {pool.submit(_scan_dir, directory)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                media, subdirs = future.result()
+                found.extend(media)
+                pending.update(pool.submit(_scan_dir, d) for d in subdirs)
+    return found
+
+def scan_directory_recursive(directory, recursive=True):
     """
     Recursively scan directory for media files (images and videos) in all subdirectories.
-    Uses followlinks=False to prevent symlink loops and duplicate counting.
-    Handles per-directory permission errors gracefully so that inaccessible
-    subdirectories do not abort the entire scan.
+    See :func:`_scan_dir` for the traversal rules; subdirectories are listed
+    concurrently since the result is sorted anyway.
+
+    Args:
+        directory: Directory to scan.
+        recursive: If False, only the top level of *directory* is scanned.
 
     Returns a sorted list of all media file paths found.
     """
-    media_files = []
-    try:
-        for root, dirs, files in os.walk(directory, followlinks=False, onerror=lambda e: log.warning(f"Cannot access directory: {e}")):
-            for file in files:
-                if is_media_file(file):
-                    full_path = os.path.join(root, file)
-                    media_files.append(full_path)
-    except Exception as e:
-        log.warning(f"Error scanning directory {directory}: {e}")
-    
-    return sorted(media_files, key=lambda x: (os.path.dirname(x), natural_sort_key(os.path.basename(x))))
+    if recursive:
+        paths = _walk_media_files_parallel(directory)
+    else:
+        paths = _scan_dir(directory)[0]
+    return sorted(
+        paths,
+        key=lambda x: (os.path.dirname(x), natural_sort_key(os.path.basename(x))),
+    )
+
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*' + ''.join(map(chr, range(32)))})
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+_MULTI_WHITESPACE_RE = re.compile(r'\s+')
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing/replacing invalid characters.
@@ -125,20 +241,16 @@ def sanitize_filename(filename: str) -> str:
     if not filename or filename.isspace():
         return ""
     
-    # Remove/replace invalid characters for Windows/Unix
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    
-    # Remove control characters (ASCII 0-31) and replace with underscore
-    filename = ''.join(char if ord(char) >= 32 else '_' for char in filename)
+    # Replace invalid characters for Windows/Unix and control characters
+    # (ASCII 0-31) with underscores in a single C-level pass
+    filename = filename.translate(_SANITIZE_TABLE)
     
     # Remove trailing and leading dots and spaces (Windows issue)
     filename = filename.strip('. ')
     
     # Remove multiple consecutive underscores and spaces
-    filename = re.sub(r'_+', '_', filename)
-    filename = re.sub(r'\s+', ' ', filename)  # Collapse multiple spaces
+    filename = _MULTI_UNDERSCORE_RE.sub('_', filename)
+    filename = _MULTI_WHITESPACE_RE.sub(' ', filename)  # Collapse multiple spaces
     filename = filename.strip()  # Remove leading/trailing spaces again
     
     # Only use 'unnamed_file' for actual file names, not for components
@@ -230,31 +342,36 @@ def check_file_access(file_path):
     Returns True if accessible, False otherwise.
     """
     try:
-        # Test if file exists and is accessible
-        if not os.path.exists(file_path):
-            return False
-        
-        # Test read access
-        with open(file_path, 'rb') as f:
-            f.read(1)  # Try to read one byte
-        
-        # Test if file is locked by checking if we can open it for writing
-        return True
-    except (PermissionError, OSError, IOError):
+        # A single open/close pair covers existence, permission and
+        # (on Windows) sharing-lock checks without a separate path stat or read
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    except OSError:
         return False
+    try:
+        # O_RDONLY also opens directories on POSIX; only regular files count
+        return stat.S_ISREG(os.fstat(fd).st_mode)
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
 
-def get_safe_target_path(original_path, new_name):
+def build_target_path(original_path, new_name, resolved_dir=None):
     """
-    Generate a safe target path, avoiding conflicts with existing files.
-    Ignores the source file itself to allow same-name "renames".
-    
+    Build the target path for *new_name* next to *original_path*.
+
+    Performs the security checks of :func:`get_safe_target_path` but does not
+    probe the filesystem for conflicts, so callers that already know which
+    names are taken can resolve collisions in memory.
+
     Args:
         original_path: The current file path
         new_name: The desired new filename (basename only)
-        
+        resolved_dir: ``os.path.realpath`` of the source directory, if the
+            caller already has it (saves resolving it again per file)
+
     Returns:
-        A safe target path within the same directory
-        
+        The target path within the same directory
+
     Raises:
         ValueError: If the new name would escape the source directory
     """
@@ -270,13 +387,35 @@ def get_safe_target_path(original_path, new_name):
     new_path = os.path.join(directory, new_name)
     
     # SEC: Verify the resolved path stays within the source directory
-    resolved_dir = os.path.realpath(directory)
+    if resolved_dir is None:
+        resolved_dir = os.path.realpath(directory)
     resolved_target = os.path.realpath(new_path)
     if not resolved_target.startswith(resolved_dir + os.sep) and resolved_target != resolved_dir:
         raise ValueError(
             f"Target path escapes source directory: {new_path!r}"
         )
     
+    return new_path
+
+def get_safe_target_path(original_path, new_name):
+    """
+    Generate a safe target path, avoiding conflicts with existing files.
+    Ignores the source file itself to allow same-name "renames".
+    
+    Args:
+        original_path: The current file path
+        new_name: The desired new filename (basename only)
+        
+    Returns:
+        A safe target path within the same directory
+        
+    Raises:
+        ValueError: If the new name would escape the source directory
+    """
+    new_path = build_target_path(original_path, new_name)
+    directory = os.path.dirname(new_path)
+    new_name = os.path.basename(new_path)
+    
     # If target is the same as source (case-insensitive on Windows), it's safe
     if os.path.normcase(original_path) == os.path.normcase(new_path):
         return new_path
@@ -310,20 +449,7 @@ def scan_directory(directory, include_subdirs=False):
     Returns:
         List of media file paths found
     """
-    if include_subdirs:
-        return scan_directory_recursive(directory)
-    else:
-        media_files = []
-        try:
-            if os.path.exists(directory):
-                for file in os.listdir(directory):
-                    file_path = os.path.join(directory, file)
-                    if os.path.isfile(file_path) and is_media_file(file):
-                        media_files.append(file_path)
-        except Exception as e:
-            log.warning(f"Error scanning directory {directory}: {e}")
-        
-        return sorted(media_files, key=lambda x: (os.path.dirname(x), natural_sort_key(os.path.basename(x))))
+    return scan_directory_recursive(directory, recursive=include_subdirs)
 
 def get_safe_filename(directory, new_name):
     """
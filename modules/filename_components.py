@@ -6,6 +6,7 @@ Provides a single source of truth for assembling ordered filename parts
 """
 from __future__ import annotations
 import re
+import time
 from typing import List, Dict, Optional
 
 # Public API
@@ -13,24 +14,42 @@ __all__ = ["build_ordered_components"]
 
 FORBIDDEN_CHARS_PATTERN = re.compile(r'[<>:"/\\|?*]')
 WHITESPACE_PATTERN = re.compile(r'\s+')
+# YYYYMMDD embedded in camera/phone file names (e.g. 20250725_DSC0001.MP4).
+# Month/day ranges keep counters like DSC20251399 from reading as a date.
+FILENAME_DATE_PATTERN = re.compile(r'(20\d\d)(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])')
+FOCAL_LENGTH_PATTERN = re.compile(r'(\d+)mm')
+
+# str.format templates for the date format combo box, filled with y/m/d
+DATE_FORMAT_TEMPLATES = {
+    "YYYY-MM-DD": "{y}-{m}-{d}",
+    "YYYY_MM_DD": "{y}_{m}_{d}",
+    "DD-MM-YYYY": "{d}-{m}-{y}",
+    "DD_MM_YYYY": "{d}_{m}_{y}",
+    "YYYYMMDD": "{y}{m}{d}",
+    "MM-DD-YYYY": "{m}-{d}-{y}",
+    "MM_DD_YYYY": "{m}_{d}_{y}",
+}
+DEFAULT_DATE_TEMPLATE = DATE_FORMAT_TEMPLATES["YYYY-MM-DD"]
 
 # Metadata keys that can appear as boolean flags meaning: value must be resolved later
 BOOLEAN_META_KEYS = {"iso", "aperture", "focal_length", "shutter", "shutter_speed", "resolution"}
 
 
+def timestamp_to_date_str(timestamp: float) -> str:
+    """Return the local date of a POSIX *timestamp* as ``YYYYMMDD``.
+
+    Used for mtime fallbacks; cheaper than building a datetime just to
+    strftime it.
+    """
+    tm = time.localtime(timestamp)
+    return f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}"
+
+
 def _format_date(raw: Optional[str], fmt: str) -> Optional[str]:
     if not raw or len(raw) < 8:
         return None
-    y, m, d = raw[:4], raw[4:6], raw[6:8]
-    return {
-        "YYYY-MM-DD": f"{y}-{m}-{d}",
-        "YYYY_MM_DD": f"{y}_{m}_{d}",
-        "DD-MM-YYYY": f"{d}-{m}-{y}",
-        "DD_MM_YYYY": f"{d}_{m}_{y}",
-        "YYYYMMDD": f"{y}{m}{d}",
-        "MM-DD-YYYY": f"{m}-{d}-{y}",
-        "MM_DD_YYYY": f"{m}_{d}_{y}",
-    }.get(fmt, f"{y}-{m}-{d}")
+    template = DATE_FORMAT_TEMPLATES.get(fmt, DEFAULT_DATE_TEMPLATE)
+    return template.format(y=raw[:4], m=raw[4:6], d=raw[6:8])
 
 
 def _sanitize_component(value: str) -> str:
@@ -64,7 +83,7 @@ def _format_metadata(key: str, value) -> Optional[str]:
         if s.endswith('ss') and not s.endswith('sss'):
             s = s[:-1]
     elif key == 'focal_length':
-        m = re.search(r'(\d+)mm', s)
+        m = FOCAL_LENGTH_PATTERN.search(s)
         if m:
             s = f"{m.group(1)}mm"
         s = s.replace(' ', '-')
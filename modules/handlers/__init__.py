@@ -8,6 +8,7 @@ from .info_dialogs import (
     show_camera_prefix_info,
     show_additional_info,
     show_separator_info,
+    show_preview_info,
     show_exif_sync_info,
 )
 from .undo_handler import UndoHandler
@@ -17,6 +18,7 @@ __all__ = [
     'show_camera_prefix_info',
     'show_additional_info',
     'show_separator_info',
+    'show_preview_info',
     'show_exif_sync_info',
     'UndoHandler',
 ]
@@ -8,6 +8,35 @@ from ..logger_util import get_logger
 log = get_logger()
 
 
+# Fields holding an image number/shutter count, in priority order
+IMAGE_NUMBER_FIELDS = (
+    'EXIF:ShutterCount',
+    'Canon:ShutterCount', 
+    'Nikon:ShutterCount',
+    'Sony:ShutterCount',
+    'Olympus:ShutterCount',
+    'Panasonic:ShutterCount',
+    'Fujifilm:ShutterCount',
+    'EXIF:ImageNumber',
+    'Canon:ImageNumber',
+    'Nikon:ImageNumber', 
+    'Sony:ImageNumber',
+    'MakerNotes:ShutterCount',
+    'MakerNotes:ImageNumber',
+    'File:FileNumber',
+)
+
+# Sequential numbering fields, used if none of the above is present
+SEQUENCE_FIELDS = (
+    'EXIF:SequenceNumber',
+    'Canon:SequenceNumber',
+    'File:SequenceNumber',
+)
+
+# Bare tag names requested from ExifTool, so it only serializes these
+IMAGE_NUMBER_TAGS = ('ShutterCount', 'ImageNumber', 'FileNumber', 'SequenceNumber')
+
+
 def extract_image_number(image_path, exif_method, exiftool_path, exif_service=None):
     """Extract image number/shutter count from image file.
     
@@ -24,7 +53,7 @@ def extract_image_number(image_path, exif_method, exiftool_path, exif_service=No
         # Get raw EXIF data using shared instance for performance
         if exif_method == "exiftool" and exiftool_path:
             if exif_service:
-                exif_data = exif_service.extract_raw_exif(image_path)
+                exif_data = exif_service.extract_raw_exif(image_path, tags=IMAGE_NUMBER_TAGS)
             else:
                 # Fallback: import delegate for backward compatibility
                 from ..exif_processor import get_exiftool_metadata_shared
@@ -35,43 +64,9 @@ def extract_image_number(image_path, exif_method, exiftool_path, exif_service=No
         if not exif_data:
             return None
         
-        # List of possible fields for image/shutter count in priority order
-        image_number_fields = [
-            'EXIF:ShutterCount',
-            'Canon:ShutterCount', 
-            'Nikon:ShutterCount',
-            'Sony:ShutterCount',
-            'Olympus:ShutterCount',
-            'Panasonic:ShutterCount',
-            'Fujifilm:ShutterCount',
-            'EXIF:ImageNumber',
-            'Canon:ImageNumber',
-            'Nikon:ImageNumber', 
-            'Sony:ImageNumber',
-            'MakerNotes:ShutterCount',
-            'MakerNotes:ImageNumber',
-            'File:FileNumber'
-        ]
-        
-        # Try each field to find image number
-        for field in image_number_fields:
-            if field in exif_data:
-                value = exif_data[field]
-                if value and str(value).isdigit():
-                    return str(value)
-                elif value and isinstance(value, (int, float)):
-                    return str(int(value))
-        
-        # If no specific image number field found, try sequential numbering fields
-        sequence_fields = [
-            'EXIF:SequenceNumber',
-            'Canon:SequenceNumber',
-            'File:SequenceNumber'
-        ]
-        
-        for field in sequence_fields:
-            if field in exif_data:
-                value = exif_data[field]
+        for fields in (IMAGE_NUMBER_FIELDS, SEQUENCE_FIELDS):
+            for field in fields:
+                value = exif_data.get(field)
                 if value and str(value).isdigit():
                     return str(value)
                 elif value and isinstance(value, (int, float)):
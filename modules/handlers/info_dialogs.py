@@ -4,24 +4,18 @@ Info dialog functions for the file renamer application.
 
 Provides help dialogs explaining various filename components and features.
 Extracted from main_application.py to reduce the God Object size.
-"""
 
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QWidget
+The dialogs never change, so each one is built on first use and kept as a
+child of its parent window; later clicks just run it again.
+"""
 
+from __future__ import annotations
 
-def show_camera_prefix_info(parent: QWidget) -> None:
-    """Show camera prefix help dialog.
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QWidget
 
-    Args:
-        parent: Parent widget for the dialog.
-    """
-    dialog = QDialog(parent)
-    dialog.setWindowTitle("Camera Prefix Help")
-    dialog.setModal(True)
-    dialog.resize(400, 300)
-    layout = QVBoxLayout(dialog)
 
-    info_text = QLabel("""
+_CAMERA_PREFIX_HELP_TEXT = """
 Camera Prefix allows you to add a custom identifier for your camera:
 
 Examples:
@@ -31,29 +25,9 @@ Examples:
 
 This appears in your filename like:
 2025-04-20-A7R3-vacation-001.jpg
-    """)
-    info_text.setWordWrap(True)
-    layout.addWidget(info_text)
-
-    close_btn = QPushButton("Close")
-    close_btn.clicked.connect(dialog.accept)
-    layout.addWidget(close_btn)
-    dialog.exec()
-
-
-def show_additional_info(parent: QWidget) -> None:
-    """Show additional field help dialog.
-
-    Args:
-        parent: Parent widget for the dialog.
     """
-    dialog = QDialog(parent)
-    dialog.setWindowTitle("Additional Field Help")
-    dialog.setModal(True)
-    dialog.resize(400, 300)
-    layout = QVBoxLayout(dialog)
 
-    info_text = QLabel("""
+_ADDITIONAL_HELP_TEXT = """
 Additional field for custom text in your filename:
 
 Examples:
@@ -64,63 +38,31 @@ Examples:
 
 This appears in your filename like:
 2025-04-20-A7R3-vacation-001.jpg
-    """)
-    info_text.setWordWrap(True)
-    layout.addWidget(info_text)
-
-    close_btn = QPushButton("Close")
-    close_btn.clicked.connect(dialog.accept)
-    layout.addWidget(close_btn)
-    dialog.exec()
-
-
-def show_separator_info(parent: QWidget) -> None:
-    """Show separator help dialog.
-
-    Args:
-        parent: Parent widget for the dialog.
     """
-    dialog = QDialog(parent)
-    dialog.setWindowTitle("Separator Help")
-    dialog.setModal(True)
-    dialog.resize(400, 300)
-    layout = QVBoxLayout(dialog)
 
-    info_text = QLabel("""
+_SEPARATOR_HELP_TEXT = """
 Choose how to separate filename components:
 
 Options:
 • - (dash): 2025-04-20-A7R3-vacation-001.jpg
 • _ (underscore): 2025_04_20_A7R3_vacation_001.jpg
 • (none): 20250420A7R3vacation001.jpg
-    """)
-    info_text.setWordWrap(True)
-    layout.addWidget(info_text)
+    """
 
-    close_btn = QPushButton("Close")
-    close_btn.clicked.connect(dialog.accept)
-    layout.addWidget(close_btn)
-    dialog.exec()
+_PREVIEW_HELP_TEXT = """
+Interactive Preview shows how your filenames will look.
 
+You can:
+• Drag and drop components to reorder them
+• See real-time preview of your filename format
+• Components are separated by your chosen separator
 
-def show_exif_sync_info(parent: QWidget) -> None:
-    """Show EXIF date synchronization help dialog.
+The number (001) is always at the end and auto-increments.
+        """
 
-    Args:
-        parent: Parent widget for the dialog.
-    """
-    dialog = QDialog(parent)
-    dialog.setWindowTitle("⚠️ EXIF Date Synchronization")
-    dialog.setModal(True)
-    dialog.resize(500, 400)
-    layout = QVBoxLayout(dialog)
-
-    # Warning header
-    warning_label = QLabel("⚠️ WARNING: This feature modifies file metadata!")
-    warning_label.setStyleSheet("color: #ff6b35; font-weight: bold; font-size: 14px;")
-    layout.addWidget(warning_label)
-
-    info_text = QLabel("""
+_EXIF_SYNC_WARNING = "⚠️ WARNING: This feature modifies file metadata!"
+
+_EXIF_SYNC_HELP_TEXT = """
 <b>What this feature does:</b>
 • Extracts DateTimeOriginal from EXIF metadata
 • Sets it as the file's creation and modification date
@@ -143,11 +85,97 @@ timeline display.
 
 <b>Supported formats:</b>
 JPG, TIFF, RAW files (CR2, NEF, ARW, etc.)
-    """)
-    info_text.setWordWrap(True)
-    layout.addWidget(info_text)
+    """
+
+
+def _show_help_dialog(
+    parent: QWidget,
+    title: str,
+    text: str,
+    size: tuple[int, int] = (400, 300),
+    button_text: str = "Close",
+    warning: str | None = None,
+) -> None:
+    """Run the help dialog *title*, building it on first use.
 
-    close_btn = QPushButton("I Understand")
-    close_btn.clicked.connect(dialog.accept)
-    layout.addWidget(close_btn)
+    The dialog is cached as a child of *parent*, looked up by object name.
+
+    Args:
+        parent: Parent widget for the dialog.
+        title: Window title; also identifies the cached dialog.
+        text: Help text shown in the dialog.
+        size: Initial (width, height) of the dialog.
+        button_text: Label of the button that closes the dialog.
+        warning: Optional highlighted line shown above the text.
+    """
+    name = f"help_dialog:{title}"
+    dialog = parent.findChild(QDialog, name, Qt.FindChildOption.FindDirectChildrenOnly)
+    if dialog is None:
+        dialog = QDialog(parent)
+        dialog.setObjectName(name)
+        dialog.setWindowTitle(title)
+        dialog.setModal(True)
+        dialog.resize(*size)
+        layout = QVBoxLayout(dialog)
+
+        if warning:
+            warning_label = QLabel(warning)
+            warning_label.setStyleSheet("color: #ff6b35; font-weight: bold; font-size: 14px;")
+            layout.addWidget(warning_label)
+
+        info_text = QLabel(text)
+        info_text.setWordWrap(True)
+        layout.addWidget(info_text)
+
+        close_btn = QPushButton(button_text)
+        close_btn.clicked.connect(dialog.accept)
+        layout.addWidget(close_btn)
     dialog.exec()
+
+
+def show_camera_prefix_info(parent: QWidget) -> None:
+    """Show camera prefix help dialog.
+
+    Args:
+        parent: Parent widget for the dialog.
+    """
+    _show_help_dialog(parent, "Camera Prefix Help", _CAMERA_PREFIX_HELP_TEXT)
+
+
+def show_additional_info(parent: QWidget) -> None:
+    """Show additional field help dialog.
+
+    Args:
+        parent: Parent widget for the dialog.
+    """
+    _show_help_dialog(parent, "Additional Field Help", _ADDITIONAL_HELP_TEXT)
+
+
+def show_separator_info(parent: QWidget) -> None:
+    """Show separator help dialog.
+
+    Args:
+        parent: Parent widget for the dialog.
+    """
+    _show_help_dialog(parent, "Separator Help", _SEPARATOR_HELP_TEXT)
+
+
+def show_preview_info(parent: QWidget) -> None:
+    """Show interactive preview help dialog.
+
+    Args:
+        parent: Parent widget for the dialog.
+    """
+    _show_help_dialog(parent, "Interactive Preview Help", _PREVIEW_HELP_TEXT)
+
+
+def show_exif_sync_info(parent: QWidget) -> None:
+    """Show EXIF date synchronization help dialog.
+
+    Args:
+        parent: Parent widget for the dialog.
+    """
+    _show_help_dialog(
+        parent, "⚠️ EXIF Date Synchronization", _EXIF_SYNC_HELP_TEXT,
+        size=(500, 400), button_text="I Understand", warning=_EXIF_SYNC_WARNING,
+    )
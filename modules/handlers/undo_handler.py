@@ -10,20 +10,176 @@ main_application.py to reduce the God Object size.
 from __future__ import annotations
 
 import os
-import shutil
+import unicodedata
+from collections import Counter
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtWidgets import (
     QDialog, QLabel, QMessageBox, QPlainTextEdit, QPushButton, QVBoxLayout,
 )
 
 from ..exif_processor import batch_restore_timestamps
 from ..backup_journal import clear_backup as _clear_journal_backup
+from ..ui.main_window_ui import UNDO_BUTTON_BUSY_TEXT, UNDO_BUTTON_TEXT
+from ..logger_util import get_logger
 
 if TYPE_CHECKING:
     from ..main_application import FileRenamerApp
 
+log = get_logger()
+
+# Per-file restore loops report progress every this many files
+_PROGRESS_EVERY = 50
+
+
+def _name_key(name: str) -> str:
+    """Case- and Unicode-normalization-insensitive key for a file name."""
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+class _DirectoryListings:
+    """Answer ``os.path.exists`` for many files with one scandir per folder.
+
+    Undo restores whole batches that usually live in a handful of folders,
+    so listing each folder once replaces two ``stat`` calls per file. Names
+    are only trusted when they match exactly; a case or normalization
+    variant (which may or may not be the same file, depending on the
+    filesystem) is re-checked with ``os.path.exists``, as is any folder
+    that can't be listed.
+    """
+
+    def __init__(self) -> None:
+        # folder -> (exact names, name key -> number of names with that key)
+        self._dirs: dict[str, tuple[set[str], Counter[str]] | None] = {}
+
+    def _listing(self, directory: str) -> tuple[set[str], Counter[str]] | None:
+        if directory not in self._dirs:
+            try:
+                with os.scandir(directory or ".") as it:
+                    names = {entry.name for entry in it}
+                self._dirs[directory] = (names, Counter(map(_name_key, names)))
+            except OSError:
+                self._dirs[directory] = None
+        return self._dirs[directory]
+
+    def exists(self, path: str) -> bool:
+        directory, name = os.path.split(path)
+        listing = self._listing(directory)
+        if listing is None:
+            return os.path.exists(path)
+        names, keys = listing
+        if name in names:
+            return True
+        if not keys[_name_key(name)]:
+            return False
+        return os.path.exists(path)
+
+    def moved(self, source: str, target: str) -> None:
+        """Record a rename of *source* to *target* within one folder."""
+        listing = self._listing(os.path.dirname(source))
+        if listing is not None:
+            names, keys = listing
+            source_name = os.path.basename(source)
+            if source_name in names:
+                names.remove(source_name)
+                keys[_name_key(source_name)] -= 1
+            target_name = os.path.basename(target)
+            if target_name not in names:
+                names.add(target_name)
+                keys[_name_key(target_name)] += 1
+
+
+def _restore_filenames_on_disk(
+    files_to_undo: list[tuple[str, str]], progress_callback=None
+) -> tuple[list[str], list[str], dict[str, str]]:
+    """Rename files back to their original names, within their folders.
+
+    Touches only the filesystem, so it can run on a worker thread.
+
+    Args:
+        files_to_undo: List of (current_file, original_filename) tuples.
+        progress_callback: Optional callable receiving a status message
+            every :data:`_PROGRESS_EVERY` files.
+
+    Returns:
+        Tuple of (restored_files, errors, path_mapping) where path_mapping
+        maps each normalized old path to its restored path.
+    """
+    restored_files: list[str] = []
+    errors: list[str] = []
+
+    # Create a mapping of old paths to new paths for batch update
+    path_mapping: dict[str, str] = {}
+    listings = _DirectoryListings()
+
+    total = len(files_to_undo)
+    for i, (current_file, original_filename) in enumerate(files_to_undo):
+        if progress_callback and i % _PROGRESS_EVERY == 0:
+            progress_callback(f"Restoring {i + 1}/{total}")
+        try:
+            if listings.exists(current_file):
+                # Only restore filename, never move between directories
+                current_directory = os.path.dirname(current_file)
+                target_path = os.path.join(current_directory, original_filename)
+
+                # Check if target already exists
+                if listings.exists(target_path) and os.path.normpath(
+                    target_path
+                ) != os.path.normpath(current_file):
+                    errors.append(
+                        f"Cannot restore {os.path.basename(current_file)}: "
+                        "Target name already exists"
+                    )
+                    continue
+
+                # Perform the rename. The target stays in the same folder, so
+                # a plain rename suffices; os.rename (not os.replace) keeps
+                # Windows refusing to clobber a file created since the
+                # listing above was taken.
+                os.rename(current_file, target_path)
+                listings.moved(current_file, target_path)
+                restored_files.append(target_path)
+                path_mapping[os.path.normpath(current_file)] = target_path
+
+            else:
+                errors.append(
+                    f"File not found: {os.path.basename(current_file)}"
+                )
+        except Exception as e:
+            errors.append(
+                f"Failed to restore {os.path.basename(current_file)}: {e}"
+            )
+
+    return restored_files, errors, path_mapping
+
+
+class UndoWorkerThread(QThread):
+    """Worker thread that renames files back to their original names.
+
+    Keeps slow disks from freezing the window during large restores. Only
+    the filesystem is touched here; the app's state is updated from
+    ``finished`` on the GUI thread.
+
+    Args:
+        files_to_undo: List of (current_file, original_filename) tuples.
+        parent: Optional parent QObject.
+    """
+
+    progress_update = pyqtSignal(str)
+    finished = pyqtSignal(list, list, dict)  # restored_files, errors, path_mapping
+
+    def __init__(self, files_to_undo: list[tuple[str, str]], parent=None) -> None:
+        super().__init__(parent)
+        self.files_to_undo = list(files_to_undo)
+
+    def run(self) -> None:
+        """Restore the files and emit ``finished`` with the results."""
+        restored_files, errors, path_mapping = _restore_filenames_on_disk(
+            self.files_to_undo, self.progress_update.emit
+        )
+        self.finished.emit(restored_files, errors, path_mapping)
+
 
 class UndoHandler:
     """Handles all undo/restore operations for the file renamer.
@@ -34,6 +190,7 @@ class UndoHandler:
 
     def __init__(self, app: FileRenamerApp) -> None:
         self.app = app
+        self._undo_worker: UndoWorkerThread | None = None
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -47,6 +204,11 @@ class UndoHandler:
         """
         app = self.app
 
+        # Guard: never start a second restore, or one during a rename
+        if self.is_running() or getattr(app, '_busy', False):
+            log.warning("Rename or restore in progress — ignoring undo request")
+            return
+
         # Check what can be undone
         files_to_undo, timestamp_backup_exists, exif_backup_exists = (
             self._check_undo_availability()
@@ -119,8 +281,28 @@ class UndoHandler:
         # Disable UI during processing
         self._set_ui_enabled(False)
 
-        # Restore filenames
-        restored_files, errors = self._restore_filenames(files_to_undo)
+        # Rename on a worker thread so slow disks don't freeze the window
+        self._undo_worker = UndoWorkerThread(files_to_undo, app)
+        self._undo_worker.progress_update.connect(app.update_status)
+        self._undo_worker.finished.connect(self._on_undo_finished)
+        self._undo_worker.start()
+
+    def _on_undo_finished(
+        self,
+        restored_files: list[str],
+        errors: list[str],
+        path_mapping: dict[str, str],
+    ) -> None:
+        """Finish an undo once :class:`UndoWorkerThread` is done renaming.
+
+        Args:
+            restored_files: Paths of the restored files.
+            errors: Error messages from the filename restore.
+            path_mapping: Dict of {normalized old path: restored path}.
+        """
+        app = self.app
+        self._undo_worker = None
+        self._apply_path_mapping(path_mapping)
 
         # Restore timestamps
         timestamp_errors = self._restore_all_timestamps()
@@ -153,22 +335,20 @@ class UndoHandler:
     # Private helpers
     # ------------------------------------------------------------------
 
+    def is_running(self) -> bool:
+        """Return True while an :class:`UndoWorkerThread` is renaming files."""
+        return self._undo_worker is not None and self._undo_worker.isRunning()
+
     def _set_ui_enabled(self, enabled: bool) -> None:
-        """Enable or disable UI controls during undo processing."""
+        """Enable or disable UI controls during undo processing.
+
+        Marks the app busy like a rename does, so the rename guard,
+        drag-and-drop, closeEvent and late ``_update_buttons`` calls all
+        respect the running restore.
+        """
         app = self.app
-        if enabled:
-            app.undo_button.setText("↶ Restore Original Names")
-            app.rename_button.setEnabled(True)
-            app.select_files_menu_button.setEnabled(True)
-            app.select_folder_menu_button.setEnabled(True)
-            app.clear_files_menu_button.setEnabled(True)
-        else:
-            app.undo_button.setEnabled(False)
-            app.undo_button.setText("⏳ Restoring...")
-            app.rename_button.setEnabled(False)
-            app.select_files_menu_button.setEnabled(False)
-            app.select_folder_menu_button.setEnabled(False)
-            app.clear_files_menu_button.setEnabled(False)
+        app._ui_set_busy(not enabled)
+        app.undo_button.setText(UNDO_BUTTON_TEXT if enabled else UNDO_BUTTON_BUSY_TEXT)
 
     def _check_undo_availability(
         self,
@@ -196,9 +376,10 @@ class UndoHandler:
 
         # Check in-memory tracking (current session — fast)
         if app.original_filenames:
+            loaded_files = set(app.files)
             for current_file, original_filename in app.original_filenames.items():
                 current_filename = os.path.basename(current_file)
-                if current_filename != original_filename and current_file in app.files:
+                if current_filename != original_filename and current_file in loaded_files:
                     files_to_undo.append((current_file, original_filename))
 
         # Check cached EXIF undo results (populated by _start_async_exif_undo_check)
@@ -266,7 +447,7 @@ class UndoHandler:
                     app.log(
                         f"✅ Restored EXIF timestamps for {len(exif_success)} files"
                     )
-                    app.exif_service.clear_cache()
+                    app.exif_service.clear_cache(include_persistent=True)
                 if exif_errors:
                     for file_path, err in exif_errors:
                         errors.append(
@@ -287,51 +468,26 @@ class UndoHandler:
     ) -> tuple[list[str], list[str]]:
         """Restore files to their original filenames.
 
+        Synchronous counterpart of :class:`UndoWorkerThread` followed by
+        :meth:`_apply_path_mapping`.
+
         Args:
             files_to_undo: List of (current_file, original_filename) tuples.
 
         Returns:
             Tuple of (restored_files, errors).
         """
-        app = self.app
-        restored_files: list[str] = []
-        errors: list[str] = []
-
-        # Create a mapping of old paths to new paths for batch update
-        path_mapping: dict[str, str] = {}
-
-        for current_file, original_filename in files_to_undo:
-            try:
-                if os.path.exists(current_file):
-                    # Only restore filename, never move between directories
-                    current_directory = os.path.dirname(current_file)
-                    target_path = os.path.join(current_directory, original_filename)
-
-                    # Check if target already exists
-                    if os.path.exists(target_path) and os.path.normpath(
-                        target_path
-                    ) != os.path.normpath(current_file):
-                        errors.append(
-                            f"Cannot restore {os.path.basename(current_file)}: "
-                            "Target name already exists"
-                        )
-                        continue
+        restored_files, errors, path_mapping = _restore_filenames_on_disk(files_to_undo)
+        self._apply_path_mapping(path_mapping)
+        return restored_files, errors
 
-                    # Perform the rename
-                    shutil.move(current_file, target_path)
-                    restored_files.append(target_path)
-                    path_mapping[os.path.normpath(current_file)] = target_path
+    def _apply_path_mapping(self, path_mapping: dict[str, str]) -> None:
+        """Point the app's file list and list items at the restored paths.
 
-                else:
-                    errors.append(
-                        f"File not found: {os.path.basename(current_file)}"
-                    )
-            except Exception as e:
-                errors.append(
-                    f"Failed to restore {os.path.basename(current_file)}: {e}"
-                )
-
-        # Update all file references in self.files and UI
+        Args:
+            path_mapping: Dict of {normalized old path: restored path}.
+        """
+        app = self.app
         if path_mapping:
             # Update app.files list
             for i, file_path in enumerate(app.files):
@@ -339,19 +495,22 @@ class UndoHandler:
                 if normalized_path in path_mapping:
                     app.files[i] = path_mapping[normalized_path]
 
-            # Update UI list
-            for i in range(app.file_list.count()):
-                item = app.file_list.item(i)
-                if item:
-                    item_path = item.data(Qt.ItemDataRole.UserRole)
-                    if item_path:
-                        normalized_path = os.path.normpath(item_path)
-                        if normalized_path in path_mapping:
-                            new_path = path_mapping[normalized_path]
-                            item.setText(os.path.basename(new_path))
-                            item.setData(Qt.ItemDataRole.UserRole, new_path)
-
-        return restored_files, errors
+            # Update UI list, repainting it once
+            file_list = app.file_list
+            file_list.setUpdatesEnabled(False)
+            try:
+                for i in range(file_list.count()):
+                    item = file_list.item(i)
+                    if item:
+                        item_path = item.data(Qt.ItemDataRole.UserRole)
+                        if item_path:
+                            normalized_path = os.path.normpath(item_path)
+                            if normalized_path in path_mapping:
+                                new_path = path_mapping[normalized_path]
+                                item.setText(os.path.basename(new_path))
+                                item.setData(Qt.ItemDataRole.UserRole, new_path)
+            finally:
+                file_list.setUpdatesEnabled(True)
 
     def _restore_all_timestamps(self) -> list[str]:
         """Restore file and EXIF timestamps after filename restore.
@@ -404,7 +563,7 @@ class UndoHandler:
                     app.log(
                         f"✅ Restored EXIF timestamps for {len(exif_successes)} files"
                     )
-                    app.exif_service.clear_cache()
+                    app.exif_service.clear_cache(include_persistent=True)
                 if exif_errors:
                     app.log(
                         f"❌ Failed to restore EXIF timestamps for {len(exif_errors)} files"
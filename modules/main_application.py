@@ -5,7 +5,6 @@ Complete original UI implementation with all features from RenameFiles.py
 
 import os
 import sys
-import re
 import datetime
 import time
 import shutil
@@ -16,15 +15,15 @@ log = get_logger()
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QLineEdit, QCheckBox, QComboBox, QListWidget,
-    QFileDialog, QStatusBar, QListWidgetItem, QMessageBox, QDialog,
+    QFileDialog, QStatusBar, QMessageBox, QDialog,
     QStyle, QPlainTextEdit, QScrollArea
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QDragEnterEvent, QDropEvent, QDragMoveEvent
 
 # Import the modular components
 from .file_utilities import (
-    is_media_file, scan_directory_recursive,
+    is_media_file, split_media_files, pick_preview_file, scan_directory_recursive,
     rename_files, FileConstants, MEDIA_EXTENSIONS, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS,
     is_image_file, is_video_file
 )
@@ -35,7 +34,10 @@ from .exif_processor import (
 from .rename_engine import RenameWorkerThread
 from .ui_components import InteractivePreviewWidget
 from .theme_manager import ThemeManager
-from .filename_components import build_ordered_components
+from .filename_components import (
+    build_ordered_components, DATE_FORMAT_TEMPLATES, DEFAULT_DATE_TEMPLATE, FILENAME_DATE_PATTERN,
+    timestamp_to_date_str,
+)
 from .timestamp_options_dialog import TimestampSyncOptionsDialog
 from .dialogs import ExifToolWarningDialog
 from .handlers import extract_image_number, UndoHandler
@@ -50,13 +52,38 @@ from .performance_benchmark import (
 )
 from .exif_undo_manager import get_original_filename_from_exif, get_rename_info
 from .ui import FileListManager, PreviewGenerator, MainWindowUI, MetadataDialogManager
+from .ui.main_window_ui import RENAME_BUTTON_BUSY_TEXT, RENAME_BUTTON_TEXT, UNDO_BUTTON_TEXT
 from .state_model import RenamerState
 from .settings_manager import SettingsManager
 from .backup_journal import load_journal as _load_undo_journal
 
+# Detection label styles: found / not found / nothing to detect from
+_LABEL_OK = "color: green; font-style: italic;"
+_LABEL_WARN = "color: orange; font-style: italic;"
+_LABEL_IDLE = "color: gray; font-style: italic;"
+
+# First line of the dialog shown when the rename worker fails
+_RENAME_ERROR_PREFIX = "Unexpected error during renaming:\n"
+
+
+def _set_label(label, text, style=None):
+    """Set a detection label's text and style, skipping unchanged values.
+
+    These labels are refreshed on every file selection and usually keep
+    their state; setStyleSheet re-parses the QSS even when it's identical.
+    """
+    if label.text() != text:
+        label.setText(text)
+    if style is not None and label.styleSheet() != style:
+        label.setStyleSheet(style)
+
 
 class FileRenamerApp(QMainWindow):
     DEBUG_VERBOSE = False
+    # Quiet period after the last keystroke before the preview is rebuilt
+    PREVIEW_DEBOUNCE_MS = 150
+    # Window in which repeated update_preview() calls collapse into one rebuild
+    PREVIEW_COALESCE_MS = 50
 
     # --- State Model Delegation Properties ---
     @property
@@ -104,9 +131,11 @@ class FileRenamerApp(QMainWindow):
         super().__init__()
         # Ensure log method exists early
         if not hasattr(self, 'log'):
-            def _early_log(msg: str):
+            def _early_log(msg: str, *args):
+                # Like logging, *args are %-formatted only if the message is
+                # emitted, so hot paths can pass values instead of f-strings
                 if getattr(self, 'DEBUG_VERBOSE', False):
-                    log.debug(msg)  # Use module-level logger to avoid infinite recursion
+                    log.debug(msg, *args)  # Use module-level logger to avoid infinite recursion
             self.log = _early_log  # type: ignore
         # Busy state flag
         self._busy = False
@@ -135,6 +164,9 @@ class FileRenamerApp(QMainWindow):
         self.exif_service = ExifService(self.exiftool_path)
         # Register with exif_processor so legacy delegate functions work
         set_default_exif_service(self.exif_service)
+        # Reuse date/camera/lens results from previous runs for unchanged
+        # files; parsed in the background so a large cache can't delay startup
+        self.exif_service.load_persistent_cache_async()
         
         if EXIFTOOL_AVAILABLE and self.exiftool_path:
             self.exif_method = "exiftool"
@@ -147,6 +179,15 @@ class FileRenamerApp(QMainWindow):
         # Initialize UI managers
         self.file_list_manager = FileListManager(self)
         self.preview_generator = PreviewGenerator(self)
+        # Coalesces bursts of text edits into a single preview rebuild
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self.preview_generator.validate_and_update_preview)
+        self._preview_refresh_timer = QTimer(self)
+        self._preview_refresh_timer.setSingleShot(True)
+        self._preview_refresh_timer.setInterval(self.PREVIEW_COALESCE_MS)
+        self._preview_refresh_timer.timeout.connect(self.preview_generator.update_preview)
         self.undo_handler = UndoHandler(self)
         self.metadata_dialog_manager = MetadataDialogManager(self)
         
@@ -169,7 +210,7 @@ class FileRenamerApp(QMainWindow):
         self._preview_exif_file = None  # Track which file the preview cache belongs to
         
         # Initialize performance benchmark manager
-        self.benchmark_manager = PerformanceBenchmark(self.exiftool_path)
+        self.benchmark_manager = PerformanceBenchmark(self.exiftool_path, exif_service=self.exif_service)
         self.benchmark_thread = None
 
     # ------------------------------------------------------------------
@@ -206,18 +247,19 @@ class FileRenamerApp(QMainWindow):
         
         if self._busy:
             self.rename_button.setEnabled(False)
-            self.select_files_menu_button.setEnabled(False)
-            self.select_folder_menu_button.setEnabled(False)
-            self.clear_files_menu_button.setEnabled(False)
+            self._set_file_buttons_enabled(False)
             self.undo_button.setEnabled(False)
         else:
             self.rename_button.setEnabled(has_files)
             # Undo only if there is something to restore
             self.undo_button.setEnabled(can_undo)
             # File selection buttons always active when not busy
-            self.select_files_menu_button.setEnabled(True)
-            self.select_folder_menu_button.setEnabled(True)
-            self.clear_files_menu_button.setEnabled(True)
+            self._set_file_buttons_enabled(True)
+
+    def _set_file_buttons_enabled(self, enabled: bool):
+        """Enable or disable all file selection buttons at once."""
+        for button in self._file_buttons:
+            button.setEnabled(enabled)
 
     def _start_async_exif_undo_check(self):
         """Run the EXIF undo-availability check off the GUI thread.
@@ -232,8 +274,6 @@ class FileRenamerApp(QMainWindow):
             return
         self._exif_undo_check_running = True
 
-        from PyQt6.QtCore import QThread, pyqtSignal
-
         files_to_check = list(self.files[:3])
         exiftool_path = self.exiftool_path
 
@@ -264,7 +304,7 @@ class FileRenamerApp(QMainWindow):
         """Toggle busy state and update button states/labels."""
         self._busy = busy
         if hasattr(self, 'rename_button'):
-            self.rename_button.setText('⏳ Processing...' if busy else '🚀 Rename Files')
+            _set_label(self.rename_button, RENAME_BUTTON_BUSY_TEXT if busy else RENAME_BUTTON_TEXT)
         self._update_buttons()
 
     def has_restore_data(self):
@@ -302,8 +342,9 @@ class FileRenamerApp(QMainWindow):
             self.undo_button.setText(f"↶ Restore {' & '.join(pending)}")
         else:
             self.undo_button.setEnabled(False)
-            self.undo_button.setText("↶ Restore Original Names")
+            self.undo_button.setText(UNDO_BUTTON_TEXT)
         self._preview_exif_file = None
+        self.preview_generator.invalidate_exif_cache()
 
     def _recover_pending_backups(self):
         """Load any undo backup left on disk by a previous session.
@@ -361,6 +402,13 @@ class FileRenamerApp(QMainWindow):
         # Connect callbacks after UI is created
         self._connect_ui_callbacks()
         
+        # File selection buttons, locked together while a rename or undo runs
+        self._file_buttons = (
+            self.select_files_menu_button,
+            self.select_folder_menu_button,
+            self.clear_files_menu_button,
+        )
+        
         # Initialize placeholder and stats (since they are called in setup_ui but methods are on self)
         self.update_file_list_placeholder()
         self.update_file_statistics()
@@ -375,9 +423,9 @@ class FileRenamerApp(QMainWindow):
         # Ensure rename button starts disabled
         self.rename_button.setEnabled(False)
         
-        # Show ExifTool warning if needed
-        QApplication.processEvents()
-        self.check_exiftool_warning()
+        # Show ExifTool warning if needed, once the event loop is running
+        # and the main window has been shown and painted
+        QTimer.singleShot(0, self.check_exiftool_warning)
     
     def _connect_ui_callbacks(self):
         """Connect UI widget callbacks to application logic"""
@@ -389,14 +437,7 @@ class FileRenamerApp(QMainWindow):
     def check_exiftool_warning(self):
         """Check if ExifTool warning should be shown"""
         if not (EXIFTOOL_AVAILABLE and self.exiftool_path):
-            show_warning = self.settings_manager.get_show_exiftool_warning()
-            
-            if show_warning:
-                dialog = ExifToolWarningDialog(self)
-                dialog.exec()
-                
-                if not dialog.should_show_again():
-                    self.settings_manager.set_show_exiftool_warning(False)
+            ExifToolWarningDialog.show_if_needed(self, self.settings_manager)
     
     def get_exiftool_path(self):
         """Simple ExifTool path detection for the modular version"""
@@ -482,6 +523,21 @@ class FileRenamerApp(QMainWindow):
         """Toggle between essential and full metadata view"""
         self.metadata_dialog_manager.toggle_full_metadata(dialog, layout, full_info, essential_widget)
 
+    def detection_file(self):
+        """Return the file used for camera/lens detection, or None.
+        
+        Prefers the first image, then the first video. One pass that stops
+        at the first image; media extensions are exactly images plus
+        videos, so no separate "any media file" scan is needed.
+        """
+        first_video = None
+        for f in self.files:
+            if is_image_file(f):
+                return f
+            if first_video is None and is_video_file(f):
+                first_video = f
+        return first_video
+
     def extract_camera_info(self):
         """Extract camera and lens info from first media file (copied from original)"""
         if not self.files:
@@ -489,13 +545,7 @@ class FileRenamerApp(QMainWindow):
             self.update_shooting_settings_labels()
             return
         
-        # Use first media file for detection (prioritize images, then videos)
-        first_media = next((f for f in self.files if is_image_file(f)), None)
-        if not first_media:
-            first_media = next((f for f in self.files if is_video_file(f)), None)
-        if not first_media:
-            first_media = next((f for f in self.files if is_media_file(f)), None)
-        
+        first_media = self.detection_file()
         if not first_media:
             self.update_camera_lens_labels()
             self.update_shooting_settings_labels()
@@ -520,7 +570,9 @@ class FileRenamerApp(QMainWindow):
         # or a camera that doesn't record focal length).
         self.detected_shooting_settings = {}
         try:
-            raw_exif = self.exif_service.extract_raw_exif(first_media) or {}
+            raw_exif = self.exif_service.extract_raw_exif(
+                first_media, tags=ExifService.SHOOTING_SETTING_TAGS
+            ) or {}
             iso = raw_exif.get('EXIF:ISO') or raw_exif.get('MakerNotes:SonyISO')
             aperture = raw_exif.get('EXIF:FNumber') or raw_exif.get('Composite:Aperture')
             shutter = raw_exif.get('EXIF:ExposureTime')
@@ -541,24 +593,20 @@ class FileRenamerApp(QMainWindow):
     def update_camera_lens_labels(self):
         """Update the camera and lens model labels (copied from original)"""
         if not self.files or not self.exif_method:
-            self.camera_model_label.setText("(no files selected)")
-            self.lens_model_label.setText("(no files selected)")
+            _set_label(self.camera_model_label, "(no files selected)")
+            _set_label(self.lens_model_label, "(no files selected)")
             return
         
         # Use stored detection results
         if hasattr(self, 'detected_camera') and self.detected_camera:
-            self.camera_model_label.setText(f"({self.detected_camera})")
-            self.camera_model_label.setStyleSheet("color: green; font-style: italic;")
+            _set_label(self.camera_model_label, f"({self.detected_camera})", _LABEL_OK)
         else:
-            self.camera_model_label.setText("(not detected)")
-            self.camera_model_label.setStyleSheet("color: orange; font-style: italic;")
+            _set_label(self.camera_model_label, "(not detected)", _LABEL_WARN)
         
         if hasattr(self, 'detected_lens') and self.detected_lens:
-            self.lens_model_label.setText(f"({self.detected_lens})")
-            self.lens_model_label.setStyleSheet("color: green; font-style: italic;")
+            _set_label(self.lens_model_label, f"({self.detected_lens})", _LABEL_OK)
         else:
-            self.lens_model_label.setText("(not detected)")
-            self.lens_model_label.setStyleSheet("color: orange; font-style: italic;")
+            _set_label(self.lens_model_label, "(not detected)", _LABEL_WARN)
 
     def update_shooting_settings_labels(self):
         """Update the ISO/Aperture/Shutter/Focal Length labels, and enable
@@ -574,17 +622,14 @@ class FileRenamerApp(QMainWindow):
             value = detected.get(key)
             
             if not self.files or not self.exif_method:
-                label.setText("(no files selected)")
-                label.setStyleSheet("color: gray; font-style: italic;")
+                _set_label(label, "(no files selected)", _LABEL_IDLE)
                 available = False
             elif value:
                 display = self._format_shooting_setting_display(key, value)
-                label.setText(f"({display})")
-                label.setStyleSheet("color: green; font-style: italic;")
+                _set_label(label, f"({display})", _LABEL_OK)
                 available = True
             else:
-                label.setText("(not available)")
-                label.setStyleSheet("color: orange; font-style: italic;")
+                _set_label(label, "(not available)", _LABEL_WARN)
                 available = False
             
             checkbox.setEnabled(available)
@@ -622,8 +667,13 @@ class FileRenamerApp(QMainWindow):
         return str(value)
     
     def update_preview(self):
-        """Update the interactive preview widget with current settings - delegates to PreviewGenerator"""
-        self.preview_generator.update_preview()
+        """Schedule a rebuild of the interactive preview.
+
+        Checkbox, combo box and file-list changes often arrive in bursts
+        (e.g. loading files refreshes several widgets); restarting a short
+        single-shot timer collapses them into one PreviewGenerator rebuild.
+        """
+        self._preview_refresh_timer.start()
     
     def format_metadata_for_filename(self, metadata_key, metadata_value):
         """Format metadata values for use in filenames - delegates to PreviewGenerator"""
@@ -648,15 +698,11 @@ class FileRenamerApp(QMainWindow):
         if additional:
             value_to_component[additional] = "Additional"
             
+        # Same preview file as update_preview() uses
+        preview_file = pick_preview_file(self.files)
+        
         # Map date component - CRITICAL FIX: Use the same date logic as update_preview()
         if use_date:
-            # Get the same preview file as used in update_preview
-            preview_file = next((f for f in self.files if os.path.splitext(f)[1].lower() in [".jpg", ".jpeg"]), None)
-            if not preview_file:
-                preview_file = next((f for f in self.files if is_media_file(f)), None)
-            if not preview_file and self.files:
-                preview_file = self.files[0]
-            
             # Extract date using the same logic as update_preview()
             date_taken = None
             if hasattr(self, 'preview_generator'):
@@ -665,44 +711,25 @@ class FileRenamerApp(QMainWindow):
             # Fallback date extraction (same as update_preview)
             if not date_taken:
                 if preview_file:
-                    m = re.search(r'(20\d{2})(\d{2})(\d{2})', os.path.basename(preview_file))
+                    m = FILENAME_DATE_PATTERN.search(os.path.basename(preview_file))
                     if m:
-                        date_taken = f"{m.group(1)}{m.group(2)}{m.group(3)}"
+                        date_taken = "".join(m.groups())
             
             if not date_taken:
                 if preview_file and os.path.exists(preview_file):
-                    mtime = os.path.getmtime(preview_file)
-                    dt = datetime.datetime.fromtimestamp(mtime)
-                    date_taken = dt.strftime('%Y%m%d')
+                    date_taken = timestamp_to_date_str(os.path.getmtime(preview_file))
                 else:
                     date_taken = datetime.datetime.now().strftime('%Y%m%d')  # Use current date as fallback
             
             # Format date using the same logic as update_preview()
             if date_taken:
-                year = date_taken[:4]
-                month = date_taken[4:6]
-                day = date_taken[6:8]
-                
-                date_format = self.date_format_combo.currentText()
-                if date_format == "YYYY-MM-DD":
-                    formatted_date = f"{year}-{month}-{day}"
-                elif date_format == "YYYY_MM_DD":
-                    formatted_date = f"{year}_{month}_{day}"
-                elif date_format == "DD-MM-YYYY":
-                    formatted_date = f"{day}-{month}-{year}"
-                elif date_format == "DD_MM_YYYY":
-                    formatted_date = f"{day}_{month}_{year}"
-                elif date_format == "YYYYMMDD":
-                    formatted_date = f"{year}{month}{day}"
-                elif date_format == "MM-DD-YYYY":
-                    formatted_date = f"{month}-{day}-{year}"
-                elif date_format == "MM_DD_YYYY":
-                    formatted_date = f"{month}_{day}_{year}"
-                else:
-                    formatted_date = f"{year}-{month}-{day}"  # Default fallback
+                template = DATE_FORMAT_TEMPLATES.get(
+                    self.date_format_combo.currentText(), DEFAULT_DATE_TEMPLATE
+                )
+                formatted_date = template.format(y=date_taken[:4], m=date_taken[4:6], d=date_taken[6:8])
                 
                 value_to_component[formatted_date] = "Date"
-                self.log(f"🔄 Debug: Mapped Date '{formatted_date}' -> 'Date'")
+                self.log("🔄 Debug: Mapped Date '%s' -> 'Date'", formatted_date)
             
         # Map camera and lens components
         if use_camera:
@@ -729,13 +756,6 @@ class FileRenamerApp(QMainWindow):
             # We need to get the same preview metadata that update_preview() creates
             # This ensures we're mapping the same values that are actually displayed
             
-            # Get the preview file (same logic as in update_preview)
-            preview_file = next((f for f in self.files if os.path.splitext(f)[1].lower() in [".jpg", ".jpeg"]), None)
-            if not preview_file:
-                preview_file = next((f for f in self.files if is_media_file(f)), None)
-            if not preview_file and self.files:
-                preview_file = self.files[0]
-            
             # Get preview metadata (same logic as in update_preview)
             preview_metadata = self.selected_metadata.copy()
             if self.exif_method and preview_file and os.path.exists(preview_file):
@@ -757,7 +777,7 @@ class FileRenamerApp(QMainWindow):
                                 
                                 if exif_key in real_metadata:
                                     preview_metadata[key] = real_metadata[exif_key]
-                                    self.log(f"🔄 Debug: Mapped preview {key} True -> {real_metadata[exif_key]}")
+                                    self.log("🔄 Debug: Mapped preview %s True -> %s", key, real_metadata[exif_key])
                     except Exception as e:
                         self.log(f"❌ Warning: Could not extract real metadata for preview mapping: {e}")
             
@@ -773,15 +793,16 @@ class FileRenamerApp(QMainWindow):
                 if display_value:
                     meta_component_name = f"Meta_{metadata_key}"
                     value_to_component[display_value] = meta_component_name
-                    self.log(f"🔄 Debug: Mapped EXIF '{display_value}' -> '{meta_component_name}'")
+                    self.log("🔄 Debug: Mapped EXIF '%s' -> '%s'", display_value, meta_component_name)
         
         # Convert display order to internal order
         new_internal_order = []
+        seen = set()
         for display_value in new_order:
-            if display_value in value_to_component:
-                component_name = value_to_component[display_value]
-                if component_name not in new_internal_order:  # Prevent duplicates
-                    new_internal_order.append(component_name)
+            component_name = value_to_component.get(display_value)
+            if component_name and component_name not in seen:  # Prevent duplicates
+                seen.add(component_name)
+                new_internal_order.append(component_name)
         
         # Update custom order - respect EXACT order from preview (no auto-insertion)
         # This ensures "What You See Is What You Get"
@@ -799,8 +820,12 @@ class FileRenamerApp(QMainWindow):
         self.update_preview()
     
     def validate_and_update_preview(self):
-        """Validate input and update preview - delegates to PreviewGenerator"""
-        self.preview_generator.validate_and_update_preview()
+        """Validate input and update preview once typing pauses.
+
+        Restarts the debounce timer; the actual rebuild is delegated to
+        PreviewGenerator when the timer fires.
+        """
+        self._preview_timer.start()
     
     def on_theme_changed(self, theme_name):
         """Handle theme changes using ThemeManager"""
@@ -867,7 +892,7 @@ class FileRenamerApp(QMainWindow):
         continuous_counter = self.checkbox_continuous_counter.isChecked()
         date_format = self.date_format_combo.currentText()
         separator = self.separator_combo.currentText()
-        non_media = [f for f in self.files if not is_media_file(f)]
+        media_files, non_media = split_media_files(self.files)
         if non_media:
             reply = QMessageBox.question(
                 self,
@@ -877,13 +902,13 @@ class FileRenamerApp(QMainWindow):
             )
             if reply == QMessageBox.StandardButton.No:
                 return
-        media_files = [f for f in self.files if is_media_file(f)]
         if not media_files:
             QMessageBox.warning(self, "Warning", "No media files found for renaming.")
             return
         
         # Disable UI during processing
         self._ui_set_busy(True)
+        self.rename_error_label.hide()
         
         # Get EXIF date sync setting
         sync_exif_date = getattr(self, 'checkbox_sync_exif_date', None) and self.checkbox_sync_exif_date.isChecked()
@@ -1099,8 +1124,9 @@ class FileRenamerApp(QMainWindow):
                 self.undo_button.setEnabled(True)
                 self.undo_button.setText("↶ Restore Original EXIF & Names")
             
-            # Clear EXIF cache to reload updated data
-            self.exif_service.clear_cache()
+            # Clear EXIF cache to reload updated data (the shift rewrites
+            # EXIF in place, so persisted entries may be stale too)
+            self.exif_service.clear_cache(include_persistent=True)
             
             # Update preview with new times
             self.update_preview()
@@ -1123,24 +1149,16 @@ class FileRenamerApp(QMainWindow):
         Returns:
             dict: Mapping of {current_path: original_basename} for undo.
         """
-        if not hasattr(self, 'original_filenames') or not self.original_filenames:
-            # First rename — build fresh mapping
-            new_mapping = {}
-            for new_path, old_path in rename_mapping.items():
-                original_basename = os.path.basename(old_path)
-                new_mapping[new_path] = original_basename
-                self.log(f"Mapping: {os.path.basename(new_path)} -> {original_basename}")
-            return new_mapping
-        else:
-            # Subsequent rename — preserve the chain back to the *original* name
-            updated = {}
-            for new_path, old_path in rename_mapping.items():
-                # Look up the original name from the previous round
-                if old_path in self.original_filenames:
-                    updated[new_path] = self.original_filenames[old_path]
-                else:
-                    updated[new_path] = os.path.basename(old_path)
-            return updated
+        # On a subsequent rename, chain back to the *original* name recorded
+        # by the previous round; otherwise the old basename is the original.
+        previous = getattr(self, 'original_filenames', None) or {}
+        basename = os.path.basename
+        mapping = {
+            new_path: previous[old_path] if old_path in previous else basename(old_path)
+            for new_path, old_path in rename_mapping.items()
+        }
+        self.log("Undo mapping built for %d renamed files", len(mapping))
+        return mapping
     
     def _create_filename_mapping_fallback(self, old_media_files, renamed_files, timestamp_backup):
         """
@@ -1179,26 +1197,14 @@ class FileRenamerApp(QMainWindow):
         self.file_list.clear()
         
         # CASE 1: Normal rename operation - use renamed files
-        if renamed_files:
-            for renamed_file in renamed_files:
-                self.files.append(renamed_file)
-                item = QListWidgetItem(os.path.basename(renamed_file))
-                item.setData(Qt.ItemDataRole.UserRole, renamed_file)
-                self.file_list.addItem(item)
-        else:
-            # CASE 2: EXIF-only sync - keep original files
-            for media_file in old_media_files:
-                self.files.append(media_file)
-                item = QListWidgetItem(os.path.basename(media_file))
-                item.setData(Qt.ItemDataRole.UserRole, media_file)
-                self.file_list.addItem(item)
+        # CASE 2: EXIF-only sync - keep original files
+        self.files.extend(renamed_files if renamed_files else old_media_files)
         
         # Add back non-media files
+        self.files.extend(original_non_media)
+        self.file_list_manager.append_file_items(self.files)
+        
         for non_media in original_non_media:
-            self.files.append(non_media)
-            item = QListWidgetItem(os.path.basename(non_media))
-            item.setData(Qt.ItemDataRole.UserRole, non_media)
-            self.file_list.addItem(item)
             # Preserve original tracking for non-media files
             if non_media not in self.original_filenames:
                 self.original_filenames[non_media] = os.path.basename(non_media)
@@ -1287,8 +1293,7 @@ class FileRenamerApp(QMainWindow):
             self.timestamp_backup = timestamp_backup
         
         # Get file lists
-        original_non_media = [f for f in self.files if not is_media_file(f)]
-        old_media_files = [f for f in self.files if is_media_file(f)]
+        old_media_files, original_non_media = split_media_files(self.files)
         
         # Build undo mapping from the authoritative rename_mapping
         if rename_mapping:
@@ -1329,9 +1334,23 @@ class FileRenamerApp(QMainWindow):
         self._ui_set_busy(False)
     
     def on_rename_error(self, error_message):
+        """Report a failed rename without blocking inside the worker's signal.
+
+        The error shows in a status bar label right away, and the message
+        box is opened window-modal with open() rather than exec(), so no
+        nested event loop runs.
+        """
         self._ui_set_busy(False)
-        QMessageBox.critical(self, "Critical Error", f"Unexpected error during renaming:\n{error_message}")
-        self.status.showMessage("Rename operation failed", 3000)
+        # A label repaints asynchronously; showMessage repaints on the spot
+        self.rename_error_label.setText(f"⚠ Rename operation failed: {error_message}")
+        self.rename_error_label.show()
+        box = QMessageBox(
+            QMessageBox.Icon.Critical, "Critical Error",
+            _RENAME_ERROR_PREFIX + error_message,
+            QMessageBox.StandardButton.Ok, self,
+        )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
     
     # ------------------------------------------------------------------
     # Undo operations — delegated to modules.handlers.undo_handler
@@ -1392,7 +1411,11 @@ class FileRenamerApp(QMainWindow):
         # Restore theme
         theme = self.settings_manager.get_theme()
         if theme:
+            # Apply once: without blocking, a non-default theme would also be
+            # applied (and every stylesheet re-parsed) via on_theme_changed
+            self.theme_combo.blockSignals(True)
             self.theme_combo.setCurrentText(theme)
+            self.theme_combo.blockSignals(False)
             self.theme_manager.apply_theme(theme, self)
             
         # Restore last directory
@@ -1404,9 +1427,17 @@ class FileRenamerApp(QMainWindow):
     def closeEvent(self, event):
         """Handle application close event.
         
-        Cleans up the ExifService to prevent subprocess leaks.
+        Persists the EXIF cache and cleans up the ExifService to prevent
+        subprocess leaks. Closing is refused while a rename or restore is
+        running, since its worker thread is owned by this window.
         """
+        if self._busy:
+            event.ignore()
+            self.status.showMessage("Please wait until the current operation finishes", 4000)
+            return
+        
         if hasattr(self, 'exif_service') and self.exif_service:
+            self.exif_service.save_persistent_cache_async()
             self.exif_service.cleanup()
         
         # Save window geometry and state
@@ -1429,16 +1460,22 @@ class FileRenamerApp(QMainWindow):
         self.file_list_manager.handle_drop(event)
     
     def eventFilter(self, obj, event):
-        """Event filter for tooltips and other events"""
-        if obj == self.file_list and event.type() == event.Type.ToolTip:
-            item = self.file_list.itemAt(event.pos())
-            if item:
-                file_path = item.data(Qt.ItemDataRole.UserRole)
-                if file_path and is_media_file(file_path):
-                    # Show file info as tooltip
-                    file_info = f"File: {os.path.basename(file_path)}\nPath: {file_path}"
-                    item.setToolTip(file_info)
-        return super().eventFilter(obj, event)
+        """Event filter for file list tooltips.
+
+        Only the file list is filtered (see MainWindowUI._setup_file_list),
+        but it sees every mouse move, so anything other than a tooltip
+        event returns straight away.
+        """
+        if event.type() != QEvent.Type.ToolTip or obj is not self.file_list:
+            return False
+        item = self.file_list.itemAt(event.pos())
+        if item:
+            file_path = item.data(Qt.ItemDataRole.UserRole)
+            if file_path and is_media_file(file_path):
+                # Show file info as tooltip
+                file_info = f"File: {os.path.basename(file_path)}\nPath: {file_path}"
+                item.setToolTip(file_info)
+        return False
 
 
 def analyze_file_statistics(files):
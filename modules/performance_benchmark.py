@@ -101,14 +101,18 @@ class BenchmarkResult:
 class PerformanceBenchmark:
     """Manages performance benchmarking for rename operations."""
     
-    def __init__(self, exiftool_path: Optional[str] = None):
+    def __init__(self, exiftool_path: Optional[str] = None, exif_service=None):
         """
         Initialize the benchmark manager.
         
         Args:
             exiftool_path: Path to ExifTool executable
+            exif_service: Optional shared ExifService. When given, scenarios
+                reuse its ExifTool process instead of starting their own,
+                which also matches how the real rename reads EXIF.
         """
         self.exiftool_path = exiftool_path
+        self.exif_service = exif_service
         self.benchmark_results: dict[str, BenchmarkResult] = {}
         self._benchmark_complete = False
         self.safety_factor = self._load_safety_factor()
@@ -238,18 +242,25 @@ class PerformanceBenchmark:
             # Simulate rename with pattern complexity - using REAL ExifTool calls
             start_time = time.perf_counter()
             
-            # Create ONE ExifService per scenario (not per file!)
+            # Reuse the shared ExifService, or create ONE per scenario (not per file!)
             bench_svc = None
+            owns_svc = False
             if exif_field_count > 0 and self.exiftool_path:
-                from .exif_service_new import ExifService
-                bench_svc = ExifService(self.exiftool_path)
+                bench_svc = self.exif_service
+                if bench_svc is None:
+                    from .exif_service_new import ExifService
+                    bench_svc = ExifService(self.exiftool_path)
+                    owns_svc = True
             
             renamed_files = []
             for test_file in test_files:
                 # REAL EXIF extraction (not cached!) - this is what takes time
                 if bench_svc is not None:
-                    # This is the expensive operation - actual ExifTool call
-                    exif_data = bench_svc.extract_raw_exif(test_file)
+                    # This is the expensive operation - actual ExifTool call.
+                    # Bypass extract_raw_exif's memo: every scenario reuses
+                    # the same temp paths, sizes and mtimes, so it would time
+                    # cache hits and fill the app's cache with temp files.
+                    exif_data = bench_svc._get_exiftool_metadata_shared(test_file)
                     if exif_data and isinstance(exif_data, dict):
                         # Access different EXIF fields (already extracted)
                         _ = exif_data.get('EXIF:DateTimeOriginal')
@@ -282,8 +293,8 @@ class PerformanceBenchmark:
             elapsed_time = time.perf_counter() - start_time
             per_file_time = elapsed_time / len(renamed_files)
             
-            # Clean up the benchmark ExifService instance
-            if bench_svc is not None:
+            # Clean up the benchmark ExifService instance (never the shared one)
+            if owns_svc:
                 bench_svc.cleanup()
             
             return BenchmarkResult(
@@ -494,7 +505,8 @@ class BenchmarkThread(QThread):
         self,
         sample_files: list[str],
         exiftool_path: Optional[str] = None,
-        max_samples: int = 10
+        max_samples: int = 10,
+        exif_service=None,
     ):
         """
         Initialize benchmark thread.
@@ -503,11 +515,13 @@ class BenchmarkThread(QThread):
             sample_files: Files to use for benchmarking
             exiftool_path: Path to ExifTool executable
             max_samples: Maximum number of samples to test
+            exif_service: Optional shared ExifService to reuse
         """
         super().__init__()
         self.sample_files = sample_files
         self.exiftool_path = exiftool_path
         self.max_samples = max_samples
+        self.exif_service = exif_service
     
     def run(self) -> None:
         """Run benchmark in background thread."""
@@ -515,7 +529,7 @@ class BenchmarkThread(QThread):
             logger.info("BenchmarkThread: Starting background benchmark")
             self.progress_update.emit("Initializing benchmark...", 0)
             
-            benchmark = PerformanceBenchmark(self.exiftool_path)
+            benchmark = PerformanceBenchmark(self.exiftool_path, exif_service=self.exif_service)
             
             # Calculate total scenarios
             total_scenarios = 6
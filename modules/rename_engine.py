@@ -9,8 +9,9 @@ with EXIF metadata extraction and optional timestamp synchronization.
 import os
 import re
 import datetime
-import shutil
-from collections import defaultdict
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
 from typing import List, Tuple, Dict, Optional, Any, Callable
 from PyQt6.QtCore import QThread, pyqtSignal
 
@@ -18,18 +19,30 @@ from .logger_util import get_logger
 log = get_logger()
 
 # Import unified utilities from file_utilities module
-from .file_utilities import is_media_file, sanitize_final_filename, get_safe_target_path, validate_path_length
+from .file_utilities import is_media_file, sanitize_final_filename, build_target_path, validate_path_length
 
 # Import timestamp operations from exif_processor (the only remaining use)
 from .exif_processor import batch_sync_exif_dates
-from .filename_components import build_ordered_components
+from .exif_service_new import ExifService
+from .filename_components import build_ordered_components, FILENAME_DATE_PATTERN, timestamp_to_date_str
 from .exif_undo_manager import write_original_filename_to_exif, batch_write_original_filenames
 
+_DIGITS_RE = re.compile(r'(\d+)')
+
+
 class RenameWorkerThread(QThread):
     """Worker thread for file renaming & optional EXIF timestamp sync."""
     progress_update = pyqtSignal(str)
     finished = pyqtSignal(list, list, dict, dict)  # renamed_files, errors, timestamp_backup, rename_mapping
     error = pyqtSignal(str)
+    # Per-item loops report progress every this many items; each emit is a
+    # queued cross-thread signal plus a status-bar repaint.
+    PROGRESS_EVERY = 50
+    # Large batches spread EXIF reads over a few extra ExifTool processes.
+    # Each one costs a Perl start-up, so smaller batches stay on the shared
+    # instance.
+    EXIF_WORKERS = min(4, os.cpu_count() or 1)
+    PARALLEL_EXIF_MIN_FILES = 400
 
     def __init__(
         self,
@@ -61,6 +74,7 @@ class RenameWorkerThread(QThread):
             self.use_lens = use_lens
             self.exif_method = exif_method
             self.separator = separator
+            self._sep = '' if separator == 'None' else separator
             self.exiftool_path = exiftool_path
             self.custom_order = custom_order or []
             self.date_format = date_format
@@ -73,6 +87,8 @@ class RenameWorkerThread(QThread):
             self.save_original_to_exif = save_original_to_exif  # NEW: Persistent undo feature
             self.timestamp_options = kwargs.get('timestamp_options') or kwargs.get('TIMESTAMP_OPTIONS')
             self.leave_names = kwargs.get('leave_names', False)
+            # directory -> (realpath, normcase-d names on disk), resolved once per batch
+            self._dir_info: Dict[str, Tuple[str, set[str]]] = {}
             # (Dry-run feature removed)
 
     def _debug(self, msg: str) -> None:
@@ -130,16 +146,22 @@ class RenameWorkerThread(QThread):
         Returns:
             List of file groups, where each group is a list of related file paths
         """
-        basename_groups = defaultdict(list)
-        for path in self.files:
-            if is_media_file(path):
-                directory = os.path.dirname(path)
-                stem = os.path.splitext(os.path.basename(path))[0]
-                basename_groups[f"{directory}#{stem}"].append(path)
+        # Sort by (directory, stem) so siblings are adjacent, then group
+        # with a single linear sweep. The sort is stable, so members keep
+        # their input order within a group.
+        keyed = sorted(
+            (
+                (os.path.dirname(path), os.path.splitext(os.path.basename(path))[0], path)
+                for path in self.files
+                if is_media_file(path)
+            ),
+            key=itemgetter(0, 1),
+        )
         
         file_groups = []
         orphans = []
-        for _k, group in basename_groups.items():
+        for _k, members in groupby(keyed, key=itemgetter(0, 1)):
+            group = [path for _dir, _stem, path in members]
             if len(group) > 1:
                 file_groups.append(group)
             else:
@@ -150,6 +172,10 @@ class RenameWorkerThread(QThread):
         
         return file_groups
     
+    def _exif_workers(self, file_count: int) -> int:
+        """Number of ExifTool processes to use for a batch of *file_count* files."""
+        return self.EXIF_WORKERS if file_count >= self.PARALLEL_EXIF_MIN_FILES else 1
+
     def _pre_extract_exif_cache(self, file_groups: List[List[str]]) -> Dict[str, Optional[Dict[str, Any]]]:
         """
         Pre-extract EXIF data for all files in one batch call (performance optimization).
@@ -174,33 +200,41 @@ class RenameWorkerThread(QThread):
         
         self.progress_update.emit("Pre-extracting EXIF data for all files...")
 
-        # Collect unique first-files from each group
-        first_files = []
+        # Collect the files to extract: the first file of each group, plus
+        # the siblings when date/camera/lens are read per file - otherwise
+        # _plan_file_group falls back to one ExifTool call per sibling.
+        per_file = self.use_date or self.use_camera or self.use_lens
+        batch_files = []
+        seen = set()
         for group in file_groups:
-            if group[0] not in exif_cache:
-                first_files.append(group[0])
+            for fp in (group if per_file else group[:1]):
+                if fp not in seen:
+                    seen.add(fp)
+                    batch_files.append(fp)
 
         # ------------------------------------------------------------------
         # FAST PATH: Batch extraction via ExifService (single IPC per chunk)
         # Reuse raw metadata from _create_continuous_counter_map if available
         # ------------------------------------------------------------------
-        if self.exif_service and first_files:
+        if self.exif_service and batch_files:
             # PERF 1: Reuse raw batch from continuous counter map to avoid
             # a second full ExifTool round-trip for the same files.
             reused_raw: dict[str, dict] = getattr(self, '_continuous_raw_cache', {})
-            remaining_files = [fp for fp in first_files if fp not in reused_raw]
+            remaining_files = [fp for fp in batch_files if fp not in reused_raw]
             
             if remaining_files:
                 self.progress_update.emit(f"Batch-extracting EXIF for {len(remaining_files)} files...")
-                fresh_raw = self.exif_service.batch_get_raw_metadata(remaining_files, chunk_size=50)
+                fresh_raw = self.exif_service.batch_get_raw_metadata(
+                    remaining_files, chunk_size=50,
+                    max_workers=self._exif_workers(len(remaining_files)),
+                )
                 reused_raw = {**reused_raw, **fresh_raw}
             else:
-                self.progress_update.emit(f"Reusing EXIF cache for {len(first_files)} files (no extra extraction needed)")
+                self.progress_update.emit(f"Reusing EXIF cache for {len(batch_files)} files (no extra extraction needed)")
             
-            for fp in first_files:
+            for fp in batch_files:
                 meta = reused_raw.get(fp, {})
                 if meta:
-                    from .exif_service_new import ExifService
                     exif_cache[fp] = {
                         'date_str': ExifService.parse_date_from_raw(meta),
                         'camera': ExifService.parse_camera_from_raw(meta),
@@ -218,7 +252,7 @@ class RenameWorkerThread(QThread):
         # SLOW FALLBACK: Per-file extraction via ExifService
         # ------------------------------------------------------------------
         for idx, group in enumerate(file_groups):
-            if idx % 50 == 0:
+            if idx % self.PROGRESS_EVERY == 0:
                 self.progress_update.emit(f"Extracting EXIF: {idx+1}/{len(file_groups)} groups")
             
             first_file = group[0]
@@ -228,7 +262,9 @@ class RenameWorkerThread(QThread):
                         first_file, self.exif_method, self.exiftool_path,
                         need_date=True, need_camera=True, need_lens=True
                     ) if self.exif_service else (None, None, None)
-                    raw_meta = self.exif_service.extract_raw_exif(first_file) if self.exif_service else {}
+                    raw_meta = self.exif_service.extract_raw_exif(
+                        first_file, tags=ExifService.BATCH_TAGS
+                    ) if self.exif_service else {}
                     
                     exif_cache[first_file] = {
                         'date_str': date_str,
@@ -278,10 +314,14 @@ class RenameWorkerThread(QThread):
                     if field in raw_meta:
                         dt_str = raw_meta[field]
                         try:
-                            import datetime as dt_module
                             if ':' in dt_str:
-                                dt_str_clean = dt_str.replace(':', '-', 2)
-                                exif_datetime = dt_module.datetime.strptime(dt_str_clean, "%Y-%m-%d %H:%M:%S")
+                                # Fixed-width "YYYY:MM:DD HH:MM:SS" - slice
+                                # directly instead of paying for strptime's
+                                # format-string parsing on every group.
+                                exif_datetime = datetime.datetime(
+                                    int(dt_str[0:4]), int(dt_str[5:7]), int(dt_str[8:10]),
+                                    int(dt_str[11:13]), int(dt_str[14:16]), int(dt_str[17:19]),
+                                )
                                 break
                         except Exception as e:
                             log.debug(f"Could not parse EXIF datetime from {field}: {e}")
@@ -289,22 +329,39 @@ class RenameWorkerThread(QThread):
         # Fallback to file modification time
         if not exif_datetime:
             try:
-                import datetime as dt_module
                 mtime = os.path.getmtime(first_file)
-                exif_datetime = dt_module.datetime.fromtimestamp(mtime)
+                exif_datetime = datetime.datetime.fromtimestamp(mtime)
             except Exception:
-                import datetime as dt_module
-                exif_datetime = dt_module.datetime(1970, 1, 1)
+                exif_datetime = datetime.datetime(1970, 1, 1)
         
         # Extract LAST number from filename as tiebreaker
         # Use the last number to get the actual sequence number (e.g., '003')
         # instead of the first number which is often the year (e.g., '2025')
         basename = os.path.basename(first_file)
-        all_numbers = re.findall(r'(\d+)', basename)
+        all_numbers = _DIGITS_RE.findall(basename)
         file_number = int(all_numbers[-1]) if all_numbers else 0
         
         return (exif_datetime, file_number, first_file)
     
+    def _directory_info(self, directory: str) -> Tuple[str, set[str]]:
+        """Return the resolved path and entry names of *directory*, once per batch.
+
+        Args:
+            directory: Directory whose entries are needed.
+
+        Returns:
+            Tuple of ``os.path.realpath(directory)`` and the set of
+            ``os.path.normcase``-d names on disk (empty if unreadable).
+        """
+        info = self._dir_info.get(directory)
+        if info is None:
+            try:
+                names = {os.path.normcase(n) for n in os.listdir(directory)}
+            except OSError:
+                names = set()
+            info = self._dir_info[directory] = (os.path.realpath(directory), names)
+        return info
+
     def _resolve_safe_target(
         self,
         original_path: str,
@@ -313,9 +370,10 @@ class RenameWorkerThread(QThread):
     ) -> str:
         """Resolve a safe target path considering both filesystem and reserved paths.
 
-        Wraps :func:`get_safe_target_path` (which performs security checks) and
-        additionally checks against *reserved_targets* — paths that have been
-        planned for rename in Phase 1 but not yet executed.
+        Uses :func:`build_target_path` for the security checks, then resolves
+        conflicts in memory against a one-time listing of the directory and
+        *reserved_targets* — paths that have been planned for rename in
+        Phase 1 but not yet executed.
 
         Args:
             original_path: Current file path on disk.
@@ -326,64 +384,54 @@ class RenameWorkerThread(QThread):
         Returns:
             A safe, conflict-free target path.
         """
-        target = get_safe_target_path(original_path, new_name)
+        directory = os.path.dirname(original_path)
+        resolved_dir, on_disk = self._directory_info(directory)
+        target = build_target_path(original_path, new_name, resolved_dir)
+        new_name = os.path.basename(target)
 
         # If target is the source file itself, no conflict is possible
         if os.path.normcase(target) == os.path.normcase(original_path):
             return target
 
-        # If not reserved by another planned rename, we're good
-        if os.path.normcase(target) not in reserved_targets:
+        def is_taken(path: str, name: str) -> bool:
+            return (os.path.normcase(name) in on_disk
+                    or os.path.normcase(path) in reserved_targets)
+
+        if not is_taken(target, new_name):
             return target
 
-        # Conflict with a reserved (but not yet on-disk) target — find alternative
-        directory = os.path.dirname(target)
-        base_name = os.path.basename(target)
-        name, ext = os.path.splitext(base_name)
-        attempt = 1
-        while attempt <= 999:
-            alt_name = f"{name}({attempt}){ext}"
+        # Conflict with an existing file or reserved target — find alternative
+        stem, ext = os.path.splitext(new_name)
+        for attempt in range(1, 1000):
+            alt_name = f"{stem}({attempt}){ext}"
             alt_path = os.path.join(directory, alt_name)
-            if not os.path.exists(alt_path) and os.path.normcase(alt_path) not in reserved_targets:
+            if not is_taken(alt_path, alt_name):
                 return alt_path
-            attempt += 1
         raise RuntimeError(f"Cannot generate unique filename for {new_name}")
 
-    def _plan_file_group(
+    def _resolve_group_metadata(
         self,
-        group: List[str],
-        date_counter: Dict[str, int],
+        group_existing: List[str],
         exif_cache: Dict[str, Optional[Dict[str, Any]]],
-        reserved_targets: set[str],
-    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
-        Phase 1: Compute rename plan for a single file group **without** moving files.
+        Resolve the shared date/camera/lens for a file group.
 
-        Extracts metadata, builds new filenames, and validates target paths.
-        Conflict resolution accounts for both on-disk files and already-reserved
-        targets from earlier groups.
+        Uses the pre-extracted EXIF cache (first file, then siblings), falls
+        back to ExifService, then to the filename date / mtime and the
+        ``Unknown-*`` placeholders.
 
         Args:
-            group: List of file paths in this group (RAW+JPEG siblings)
-            date_counter: Counter dictionary for per-date numbering {date: count}
+            group_existing: Group members that exist on disk (non-empty)
             exif_cache: Pre-extracted EXIF cache from _pre_extract_exif_cache
-            reserved_targets: Mutable set of normcase-d paths already claimed
-            
+
         Returns:
-            Tuple of:
-                - plan_entries: List of (source_path, target_path) tuples
-                - errors_list: List of (file_path, error_message) tuples
+            Tuple of (date_taken, camera_model, lens_model); fields that are
+            not needed for the current settings are None.
         """
-        plan_entries: List[Tuple[str, str]] = []
-        errors = []
-        
         need_date = self.use_date
         need_camera = self.use_camera
         need_lens = self.use_lens
-        
-        group_existing = [p for p in group if os.path.exists(p)]
-        if not group_existing:
-            return plan_entries, errors
 
         date_taken = None
         camera_model = None
@@ -423,14 +471,13 @@ class RenameWorkerThread(QThread):
         # Fallbacks
         if need_date and not date_taken:
             for p in group_existing:
-                m = re.search(r'(20\d{2})(\d{2})(\d{2})', os.path.basename(p))
+                m = FILENAME_DATE_PATTERN.search(os.path.basename(p))
                 if m:
-                    date_taken = f"{m.group(1)}{m.group(2)}{m.group(3)}"
+                    date_taken = "".join(m.groups())
                     break
             if not date_taken:
                 try:
-                    dt = datetime.datetime.fromtimestamp(os.path.getmtime(first_file))
-                    date_taken = dt.strftime('%Y%m%d')
+                    date_taken = timestamp_to_date_str(os.path.getmtime(first_file))
                 except Exception:
                     date_taken = '19700101'
         if need_camera and not camera_model:
@@ -438,22 +485,82 @@ class RenameWorkerThread(QThread):
         if need_lens and not lens_model:
             lens_model = 'Unknown-Lens'
 
-        # Counter logic
-        if self.use_date and not self.continuous_counter:
-            key = date_taken or 'unknown'
-            date_counter[key] = date_counter.get(key, 0) + 1
-            group_number = date_counter[key]
-        elif not self.use_date:
-            key = 'all_files'
-            date_counter[key] = date_counter.get(key, 0) + 1
-            group_number = date_counter[key]
-        else:  # self.use_date and continuous_counter
-            if hasattr(self, '_continuous_counter_map'):
-                group_number = self._continuous_counter_map.get(first_file, 1)
-            else:
-                key = 'all_files'
-                date_counter[key] = date_counter.get(key, 0) + 1
-                group_number = date_counter[key]
+        return date_taken, camera_model, lens_model
+
+    def _plan_file_group(
+        self,
+        group: List[str],
+        date_counter: Dict[str, int],
+        exif_cache: Dict[str, Optional[Dict[str, Any]]],
+        reserved_targets: set[str],
+        group_metadata: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None,
+    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """
+        Phase 1: Compute rename plan for a single file group **without** moving files.
+
+        Extracts metadata, builds new filenames, and validates target paths.
+        Conflict resolution accounts for both on-disk files and already-reserved
+        targets from earlier groups.
+
+        Args:
+            group: List of file paths in this group (RAW+JPEG siblings)
+            date_counter: Counter dictionary for per-date numbering {date: count}
+            exif_cache: Pre-extracted EXIF cache from _pre_extract_exif_cache
+            reserved_targets: Mutable set of normcase-d paths already claimed
+            group_metadata: Optional (date, camera, lens) already resolved by
+                _resolve_group_metadata. When given, *group* is assumed to
+                contain only existing files.
+            
+        Returns:
+            Tuple of:
+                - plan_entries: List of (source_path, target_path) tuples
+                - errors_list: List of (file_path, error_message) tuples
+        """
+        plan_entries: List[Tuple[str, str]] = []
+        errors = []
+        
+        need_date = self.use_date
+        need_camera = self.use_camera
+        need_lens = self.use_lens
+        sep = self._sep
+        # Whether any per-file shooting metadata (aperture, ISO, ...) is needed
+        wants_extra = bool(self.selected_metadata and self.exif_method) and any(
+            self.selected_metadata.get(k) is True
+            for k in ('aperture', 'iso', 'focal_length', 'shutter', 'shutter_speed', 'exposure_bias')
+        )
+        # Bind the settings that are fixed for the whole batch once, so the
+        # per-file loop below only passes what varies per file.
+        build_parts = partial(
+            build_ordered_components,
+            camera_prefix=self.camera_prefix,
+            additional=self.additional,
+            use_camera=need_camera,
+            use_lens=need_lens,
+            custom_order=self.custom_order,
+            date_format=self.date_format,
+            use_date=need_date,
+        )
+        
+        if group_metadata is None:
+            group_existing = [p for p in group if os.path.exists(p)]
+            if not group_existing:
+                return plan_entries, errors
+            group_metadata = self._resolve_group_metadata(group_existing, exif_cache)
+        else:
+            group_existing = group
+            if not group_existing:
+                return plan_entries, errors
+
+        date_taken, camera_model, lens_model = group_metadata
+        first_file = group_existing[0]
+
+        # Counter logic: continuous numbering comes from the precomputed map;
+        # otherwise count per date (or across all files when dates are off).
+        if self.use_date and self.continuous_counter and hasattr(self, '_continuous_counter_map'):
+            group_number = self._continuous_counter_map.get(first_file, 1)
+        else:
+            key = (date_taken or 'unknown') if self.use_date and not self.continuous_counter else 'all_files'
+            group_number = date_counter[key] = date_counter.get(key, 0) + 1
 
         # Process each file in group
         for path in group_existing:
@@ -493,49 +600,38 @@ class RenameWorkerThread(QThread):
 
                 # Individual selected metadata (aperture, iso, etc.)
                 individual_metadata = self.selected_metadata.copy() if self.selected_metadata else {}
-                if self.selected_metadata and self.exif_method:
-                    wants_extra = any(individual_metadata.get(k) is True for k in ['aperture','iso','focal_length','shutter','shutter_speed','exposure_bias'])
-                    if wants_extra:
-                        # Try the pre-built cache first (no ExifTool call)
-                        cache_entry = exif_cache.get(first_file) or exif_cache.get(path)
-                        cached_meta = (cache_entry or {}).get('all_metadata') if cache_entry else None
-                        if not cached_meta and cache_entry and cache_entry.get('raw_meta'):
-                            # Parse from raw_meta on the fly (still no IPC)
-                            from .exif_service_new import ExifService
-                            cached_meta = ExifService.parse_all_metadata_from_raw(cache_entry['raw_meta'])
-                        if cached_meta:
-                            meta = cached_meta
-                        else:
-                            # Ultimate fallback: per-file ExifTool call
-                            try:
-                                if self.exif_service:
-                                    meta = self.exif_service.get_all_metadata(path, self.exif_method, self.exiftool_path) or {}
-                                else:
-                                    meta = {}
-                            except Exception:
+                if wants_extra:
+                    # Try the pre-built cache first (no ExifTool call)
+                    cache_entry = exif_cache.get(first_file) or exif_cache.get(path)
+                    cached_meta = (cache_entry or {}).get('all_metadata') if cache_entry else None
+                    if not cached_meta and cache_entry and cache_entry.get('raw_meta'):
+                        # Parse from raw_meta on the fly (still no IPC)
+                        cached_meta = ExifService.parse_all_metadata_from_raw(cache_entry['raw_meta'])
+                    if cached_meta:
+                        meta = cached_meta
+                    else:
+                        # Ultimate fallback: per-file ExifTool call
+                        try:
+                            if self.exif_service:
+                                meta = self.exif_service.get_all_metadata(path, self.exif_method, self.exiftool_path) or {}
+                            else:
                                 meta = {}
-                        if meta:
-                            if 'shutter' in individual_metadata and 'shutter_speed' in meta:
-                                individual_metadata['shutter'] = meta.get('shutter_speed')
-                            for k in ['aperture','iso','focal_length','shutter_speed','exposure_bias']:
-                                if individual_metadata.get(k) is True and k in meta:
-                                    individual_metadata[k] = meta[k]
-
-                parts = build_ordered_components(
+                        except Exception:
+                            meta = {}
+                    if meta:
+                        if 'shutter' in individual_metadata and 'shutter_speed' in meta:
+                            individual_metadata['shutter'] = meta.get('shutter_speed')
+                        for k in ['aperture','iso','focal_length','shutter_speed','exposure_bias']:
+                            if individual_metadata.get(k) is True and k in meta:
+                                individual_metadata[k] = meta[k]
+
+                parts = build_parts(
                     date_taken=file_date,
-                    camera_prefix=self.camera_prefix,
-                    additional=self.additional,
                     camera_model=file_cam,
                     lens_model=file_lens,
-                    use_camera=self.use_camera,
-                    use_lens=self.use_lens,
                     number=group_number,
-                    custom_order=self.custom_order,
-                    date_format=self.date_format,
-                    use_date=self.use_date,
                     selected_metadata=individual_metadata,
                 )
-                sep = '' if self.separator == 'None' else self.separator
                 new_name = sanitize_final_filename(sep.join(parts) + os.path.splitext(path)[1])
 
                 # Two-phase: resolve target considering already-reserved paths
@@ -598,29 +694,9 @@ class RenameWorkerThread(QThread):
         
         self.progress_update.emit("Creating continuous counter map...")
         
-        # Step 1: Group files by basename AND directory (CRITICAL FIX for identical filenames in different folders)
-        basename_groups = defaultdict(list)
-        for file in self.files:
-            if is_media_file(file):
-                # CRITICAL FIX: Include directory path to prevent grouping identical filenames from different folders
-                directory = os.path.dirname(file)
-                base = os.path.splitext(os.path.basename(file))[0]
-                # Create unique key combining directory and basename
-                unique_key = f"{directory}#{base}"
-                basename_groups[unique_key].append(file)
-        
-        # Step 2: Create file groups (same logic as main processing)
-        file_groups = []
-        orphaned_files = []
-        for base, file_list in basename_groups.items():
-            if len(file_list) > 1:
-                file_groups.append(file_list)  # JPG+RAW pairs
-            else:
-                orphaned_files.extend(file_list)  # Single files
-        
-        # Add orphans as individual groups
-        for file in orphaned_files:
-            file_groups.append([file])
+        # Step 1-2: Group RAW/JPEG siblings by (directory, basename) with the
+        # same sort-and-groupby sweep as the main processing
+        file_groups = self._create_file_groups()
         
         # Step 3: Get date for each group and create (date, group) pairs
         # ------------------------------------------------------------------
@@ -631,12 +707,14 @@ class RenameWorkerThread(QThread):
 
         date_by_file: Dict[str, Optional[str]] = {}
         if self.exif_service and self.exif_method and first_files:
-            raw_batch = self.exif_service.batch_get_raw_metadata(first_files, chunk_size=50)
-            from .exif_service_new import ExifService as _ES
+            raw_batch = self.exif_service.batch_get_raw_metadata(
+                first_files, chunk_size=50,
+                max_workers=self._exif_workers(len(first_files)),
+            )
             # Save raw metadata for reuse by _pre_extract_exif_cache
             self._continuous_raw_cache = raw_batch
             for fp, meta in raw_batch.items():
-                date_by_file[fp] = _ES.parse_date_from_raw(meta) if meta else None
+                date_by_file[fp] = ExifService.parse_date_from_raw(meta) if meta else None
 
         for group in file_groups:
             first_file = group[0]
@@ -656,24 +734,20 @@ class RenameWorkerThread(QThread):
                 
                 # Fallback to filename pattern
                 if not file_date:
-                    m = re.search(r'(20\d{2})(\d{2})(\d{2})', os.path.basename(first_file))
+                    m = FILENAME_DATE_PATTERN.search(os.path.basename(first_file))
                     if m:
-                        file_date = f"{m.group(1)}{m.group(2)}{m.group(3)}"
+                        file_date = "".join(m.groups())
                 
                 # Fallback to file date
                 if not file_date:
-                    mtime = os.path.getmtime(first_file)
-                    dt = datetime.datetime.fromtimestamp(mtime)
-                    file_date = dt.strftime('%Y%m%d')
+                    file_date = timestamp_to_date_str(os.path.getmtime(first_file))
                 if file_date:
                     date_group_pairs.append((file_date, group))
             except Exception as e:
                 log.debug(f"Date extraction failed for {first_file}: {e}")
                 # Ultimate fallback
                 try:
-                    mtime = os.path.getmtime(first_file)
-                    dt = datetime.datetime.fromtimestamp(mtime)
-                    file_date = dt.strftime('%Y%m%d')
+                    file_date = timestamp_to_date_str(os.path.getmtime(first_file))
                     date_group_pairs.append((file_date, group))
                 except Exception as e2:
                     log.debug(f"Ultimate date fallback failed for {first_file}: {e2}")
@@ -683,7 +757,7 @@ class RenameWorkerThread(QThread):
             first_file = group[0]
             try:
                 basename = os.path.basename(first_file)
-                all_numbers = re.findall(r'(\d+)', basename)
+                all_numbers = _DIGITS_RE.findall(basename)
                 if all_numbers:
                     # Use the last number as tiebreaker (actual sequence number)
                     # instead of the first (often the year)
@@ -768,7 +842,11 @@ class RenameWorkerThread(QThread):
 
         # Step 4: Sort files chronologically
         self.progress_update.emit("Sorting files by capture time...")
-        file_groups.sort(key=lambda g: self._get_exif_sort_key(g, exif_cache))
+        # Decorate-sort-undecorate: compute each group's key exactly once
+        # up front so sorting never touches the EXIF cache or filesystem.
+        keyed_groups = [(self._get_exif_sort_key(g, exif_cache), g) for g in file_groups]
+        keyed_groups.sort(key=lambda kg: kg[0])
+        file_groups = [g for _, g in keyed_groups]
         self.progress_update.emit("Files sorted chronologically")
 
         # Step 5: Two-phase rename (EDGE 1 — crash-safe batch rename)
@@ -783,13 +861,26 @@ class RenameWorkerThread(QThread):
         rename_mapping: Dict[str, str] = {}
         date_counter: Dict[str, int] = {}
         reserved_targets: set[str] = set()
+        self._dir_info = {}
         all_plan_entries: List[Tuple[str, str]] = []
 
         # --- Phase 1: Plan ---
-        for idx, group in enumerate(file_groups):
-            self.progress_update.emit(f"Planning group {idx+1}/{len(file_groups)}")
+        # Run each stage over all groups before the next, keeping the
+        # per-group results in parallel lists: existence filter, then
+        # metadata resolution, then counter assignment + naming.
+        existing_groups = [[p for p in g if os.path.exists(p)] for g in file_groups]
+        group_metadata = [
+            self._resolve_group_metadata(g, exif_cache) if g else None
+            for g in existing_groups
+        ]
+        for idx, (group, metadata) in enumerate(zip(existing_groups, group_metadata)):
+            if metadata is None:
+                continue
+            if idx % self.PROGRESS_EVERY == 0:
+                self.progress_update.emit(f"Planning group {idx+1}/{len(file_groups)}")
             group_plan, group_errors = self._plan_file_group(
                 group, date_counter, exif_cache, reserved_targets,
+                group_metadata=metadata,
             )
             all_plan_entries.extend(group_plan)
             errors.extend(group_errors)
@@ -800,13 +891,17 @@ class RenameWorkerThread(QThread):
 
         # --- Phase 2: Execute ---
         for idx, (source, target) in enumerate(all_plan_entries):
-            if idx % 50 == 0:
+            if idx % self.PROGRESS_EVERY == 0:
                 self.progress_update.emit(
                     f"Renaming {idx+1}/{len(all_plan_entries)}"
                 )
             try:
                 if os.path.normpath(source) != os.path.normpath(target):
-                    shutil.move(source, target)
+                    # Targets are always in the source directory, so a plain
+                    # rename suffices; shutil.move would add isdir/samefile
+                    # stat probes per file.  os.rename (not os.replace) keeps
+                    # Windows refusing to clobber a file created since planning.
+                    os.rename(source, target)
                     renamed_files.append(target)
                     rename_mapping[target] = source
                 else:
@@ -6,18 +6,50 @@ Separates the UI construction from the main application logic.
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QLineEdit, QCheckBox, QComboBox, QListWidget, QStyle
+    QLineEdit, QCheckBox, QComboBox, QListWidget, QListView, QStyle
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon, QAction
 
-from ..ui_components import InteractivePreviewWidget, CollapsibleSection
+from ..ui_components import InteractivePreviewWidget, CollapsibleSection, ClickableLabel
+
+# Idle and busy labels of the action buttons
+RENAME_BUTTON_TEXT = "🚀 Rename Files"
+RENAME_BUTTON_BUSY_TEXT = "⏳ Processing..."
+UNDO_BUTTON_TEXT = "↶ Restore Original Names"
+UNDO_BUTTON_BUSY_TEXT = "⏳ Restoring..."
 
 class MainWindowUI:
     """
     Handles the setup of the Main Window UI.
     """
     
+    def __init__(self):
+        # 16px renderings of the style's standard icons, shared by all info
+        # icons. Per instance so no QPixmap outlives the QApplication.
+        self._icon_pixmaps = {}
+    
+    def _info_icon(self, window, tooltip, on_click,
+                   icon=QStyle.StandardPixmap.SP_MessageBoxInformation):
+        """Build a clickable 16px help icon.
+        
+        Args:
+            window: The FileRenamerApp instance (provides the style).
+            tooltip: Tooltip text for the icon.
+            on_click: Slot called when the icon is clicked.
+            icon: Standard pixmap to show.
+        """
+        pixmap = self._icon_pixmaps.get(icon)
+        if pixmap is None:
+            pixmap = window.style().standardIcon(icon).pixmap(16, 16)
+            self._icon_pixmaps[icon] = pixmap
+        label = ClickableLabel()
+        label.setPixmap(pixmap)
+        label.setToolTip(tooltip)
+        label.setCursor(Qt.CursorShape.PointingHandCursor)
+        label.clicked.connect(on_click)
+        return label
+    
     def setup_ui(self, window):
         """
         Constructs the UI for the given window.
@@ -116,6 +148,11 @@ class MainWindowUI:
         window.status = window.statusBar()
         window.exif_status_label = QLabel()
         window.status.addPermanentWidget(window.exif_status_label)
+        # Last rename failure; kept until the next rename starts
+        window.rename_error_label = QLabel()
+        window.rename_error_label.setStyleSheet("color: #d32f2f;")
+        window.rename_error_label.hide()
+        window.status.addPermanentWidget(window.rename_error_label)
 
     def _setup_menu_bar(self, window):
         if not hasattr(window, 'menuBar'):
@@ -271,11 +308,7 @@ class MainWindowUI:
         # Camera Prefix
         camera_row = QHBoxLayout()
         camera_label = QLabel("Camera Prefix:")
-        camera_info = QLabel()
-        camera_info.setPixmap(window.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation).pixmap(16, 16))
-        camera_info.setToolTip("Click for detailed info about camera prefix")
-        camera_info.setCursor(Qt.CursorShape.PointingHandCursor)
-        camera_info.mousePressEvent = lambda event: window.show_camera_prefix_info()
+        camera_info = self._info_icon(window, "Click for detailed info about camera prefix", window.show_camera_prefix_info)
         camera_row.addWidget(camera_label)
         camera_row.addWidget(camera_info)
         camera_row.addStretch()
@@ -289,11 +322,7 @@ class MainWindowUI:
         # Additional
         additional_row = QHBoxLayout()
         additional_label = QLabel("Additional:")
-        additional_info = QLabel()
-        additional_info.setPixmap(window.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation).pixmap(16, 16))
-        additional_info.setToolTip("Click for detailed info about additional field")
-        additional_info.setCursor(Qt.CursorShape.PointingHandCursor)
-        additional_info.mousePressEvent = lambda event: window.show_additional_info()
+        additional_info = self._info_icon(window, "Click for detailed info about additional field", window.show_additional_info)
         additional_row.addWidget(additional_label)
         additional_row.addWidget(additional_info)
         additional_row.addStretch()
@@ -307,11 +336,7 @@ class MainWindowUI:
         # Separator
         separator_row = QHBoxLayout()
         separator_label = QLabel("Separator:")
-        separator_info = QLabel()
-        separator_info.setPixmap(window.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation).pixmap(16, 16))
-        separator_info.setToolTip("Click for detailed info about separators")
-        separator_info.setCursor(Qt.CursorShape.PointingHandCursor)
-        separator_info.mousePressEvent = lambda event: window.show_separator_info()
+        separator_info = self._info_icon(window, "Click for detailed info about separators", window.show_separator_info)
         separator_row.addWidget(separator_label)
         separator_row.addWidget(separator_info)
         separator_row.addStretch()
@@ -321,17 +346,12 @@ class MainWindowUI:
         window.separator_combo.addItems(["-", "_", ""])
         window.separator_combo.setCurrentText("-")
         window.right_layout.addWidget(window.separator_combo)
-        window.separator_combo.currentIndexChanged.connect(window.update_preview)
         window.separator_combo.currentIndexChanged.connect(window.on_separator_changed)
 
     def _setup_preview(self, window):
         preview_row = QHBoxLayout()
         preview_label = QLabel("Interactive Preview:")
-        preview_info = QLabel()
-        preview_info.setPixmap(window.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation).pixmap(16, 16))
-        preview_info.setToolTip("Click for detailed info about interactive preview")
-        preview_info.setCursor(Qt.CursorShape.PointingHandCursor)
-        preview_info.mousePressEvent = lambda event: window.show_preview_info()
+        preview_info = self._info_icon(window, "Click for detailed info about interactive preview", window.show_preview_info)
         preview_row.addWidget(preview_label)
         preview_row.addWidget(preview_info)
         preview_row.addStretch()
@@ -417,11 +437,10 @@ class MainWindowUI:
         )
         sync_date_layout.addWidget(window.checkbox_sync_exif_date)
         
-        sync_info_icon = QLabel()
-        sync_info_icon.setPixmap(window.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxWarning).pixmap(16, 16))
-        sync_info_icon.setToolTip("Click for detailed info about EXIF date synchronization")
-        sync_info_icon.setCursor(Qt.CursorShape.PointingHandCursor)
-        sync_info_icon.mousePressEvent = lambda event: window.show_exif_sync_info()
+        sync_info_icon = self._info_icon(
+            window, "Click for detailed info about EXIF date synchronization", window.show_exif_sync_info,
+            icon=QStyle.StandardPixmap.SP_MessageBoxWarning,
+        )
         sync_date_layout.addWidget(sync_info_icon)
         
         window.checkbox_leave_names = QCheckBox("Leave file names as-is")
@@ -463,6 +482,11 @@ class MainWindowUI:
 
     def _setup_file_list(self, window):
         window.file_list = QListWidget()
+        # Every row is a single-line file name, so Qt can size one row and
+        # reuse it; batched layout keeps large drops from stalling the UI.
+        window.file_list.setUniformItemSizes(True)
+        window.file_list.setLayoutMode(QListView.LayoutMode.Batched)
+        window.file_list.setBatchSize(200)
         window.file_list.setStyleSheet("""
             QListWidget {
                 border: 2px dashed #cccccc;
@@ -516,8 +540,9 @@ class MainWindowUI:
         window.left_layout.addWidget(window.file_stats_label)
         
         # Info Label
-        file_list_info = QLabel("💡Single click = Media info in status bar | Double click = Essential metadata dialog")
-        file_list_info.setStyleSheet("""
+        # Kept on the window so ThemeManager can restyle it directly
+        window.file_list_info = QLabel("💡Single click = Media info in status bar | Double click = Essential metadata dialog")
+        window.file_list_info.setStyleSheet("""
             QLabel {
                 border: 1px solid palette(mid);
                 border-radius: 4px;
@@ -528,9 +553,9 @@ class MainWindowUI:
                 font-weight: normal;
             }
         """)
-        file_list_info.setWordWrap(True)
-        file_list_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        window.left_layout.addWidget(file_list_info)
+        window.file_list_info.setWordWrap(True)
+        window.file_list_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        window.left_layout.addWidget(window.file_list_info)
         
         window.file_list.setToolTip("Single click: Media info | Double click: Essential metadata")
         window.file_list.installEventFilter(window)
@@ -538,7 +563,7 @@ class MainWindowUI:
 
     def _setup_action_buttons(self, window):
         # Rename Button
-        window.rename_button = QPushButton("🚀 Rename Files")
+        window.rename_button = QPushButton(RENAME_BUTTON_TEXT)
         window.rename_button.setStyleSheet("""
             QPushButton {
                 background-color: #28a745;
@@ -566,7 +591,7 @@ class MainWindowUI:
         window.bottom_layout.addWidget(window.rename_button)
         
         # Undo Button
-        window.undo_button = QPushButton("↶ Restore Original Names")
+        window.undo_button = QPushButton(UNDO_BUTTON_TEXT)
         window.undo_button.setStyleSheet("""
             QPushButton {
                 background-color: #6c757d;
@@ -122,7 +122,10 @@ class MetadataDialogManager:
                     self.parent.status.showMessage("Video files require ExifTool for metadata extraction", 3000)
             else:
                 # For images, extract image number
-                image_number = extract_image_number(file_path, self.parent.exif_method, self.parent.exiftool_path)
+                image_number = extract_image_number(
+                    file_path, self.parent.exif_method, self.parent.exiftool_path,
+                    exif_service=self.parent.exif_service,
+                )
                 
                 if image_number:
                     self.parent.status.showMessage(f"Image Number/Shutter Count: {image_number}", 5000)
@@ -7,10 +7,13 @@ filename previews based on current settings.
 """
 
 import os
-import re
-import datetime
 import threading
-from ..file_utilities import is_media_file, is_video_file
+from ..file_utilities import is_video_file, pick_preview_file
+from ..handlers.info_dialogs import show_preview_info
+from ..filename_components import (
+    DATE_FORMAT_TEMPLATES, DEFAULT_DATE_TEMPLATE, FILENAME_DATE_PATTERN, FOCAL_LENGTH_PATTERN,
+    timestamp_to_date_str,
+)
 
 
 class PreviewGenerator:
@@ -34,6 +37,8 @@ class PreviewGenerator:
         self._preview_exif_lock = threading.Lock()
         self._preview_exif_cache: dict[str, str | None] = {}
         self._preview_exif_file = None
+        # Inputs of the last rendered preview; identical calls are skipped
+        self._last_preview_key = None
 
     def get_cached_exif(self, key: str) -> str | None:
         """Thread-safe accessor for a single preview EXIF cache value.
@@ -47,6 +52,12 @@ class PreviewGenerator:
         with self._preview_exif_lock:
             return self._preview_exif_cache.get(key)
 
+    def invalidate_exif_cache(self) -> None:
+        """Force the next preview to re-read EXIF for its preview file."""
+        with self._preview_exif_lock:
+            self._preview_exif_file = None
+        self._last_preview_key = None
+
     def update_preview(self):
         """Update the interactive preview widget with current settings"""
         # Get current settings
@@ -79,33 +90,51 @@ class PreviewGenerator:
                 active_components.append(f"Meta_{meta_key}")
         
         # Update custom_order: Add missing active components before "Number"
+        # (``ordered`` mirrors custom_order's members for O(1) lookups)
+        custom_order = self.parent.custom_order
+        ordered = set(custom_order)
         for component in active_components:
-            if component not in self.parent.custom_order:
+            if component not in ordered:
                 # Insert before Number for logical ordering
-                if "Number" in self.parent.custom_order:
-                    idx = self.parent.custom_order.index("Number")
-                    self.parent.custom_order.insert(idx, component)
+                if "Number" in ordered:
+                    custom_order.insert(custom_order.index("Number"), component)
                 else:
-                    self.parent.custom_order.append(component)
+                    custom_order.append(component)
+                ordered.add(component)
         
         # Remove inactive components from custom_order
+        active = set(active_components)
         self.parent.custom_order = [
             c for c in self.parent.custom_order 
-            if c in active_components
+            if c in active
         ]
         
         # Choose first JPG file, else first media file, else dummy
-        preview_file = next((f for f in self.parent.files if os.path.splitext(f)[1].lower() in [".jpg", ".jpeg"]), None)
-        if not preview_file:
-            preview_file = next((f for f in self.parent.files if is_media_file(f)), None)
-        if not preview_file and self.parent.files:
-            preview_file = self.parent.files[0]
+        preview_file = pick_preview_file(self.parent.files)
         if not preview_file:
             # Default example with video extension to show video support
             preview_file = "20250725_DSC0001.MP4"
 
+        # One stat per refresh: the mtime keys the EXIF cache, dates the
+        # filename fallback and doubles as the existence check (None = missing)
+        mtime = self._get_mtime(preview_file) if self.parent.exif_method else None
+
+        # Many slots re-emit an unchanged state (focus changes, the prefetch
+        # finishing, repeated toggles); the rendered preview depends only on
+        # these inputs, so skip the rebuild when none of them changed.
+        selected_metadata = getattr(self.parent, 'selected_metadata', None) or {}
+        preview_key = (
+            camera_prefix, additional, use_camera, use_lens, use_date, date_format,
+            separator, tuple(self.parent.custom_order), preview_file, mtime,
+            self.parent.exif_method, self.parent.exiftool_path,
+            tuple(selected_metadata.items()),
+        )
+        if preview_key == self._last_preview_key:
+            return
+        self._last_preview_key = preview_key
+
         date_taken, camera_model, lens_model = self._extract_preview_metadata(
-            preview_file, use_date, use_camera, use_lens
+            preview_file, mtime, use_date, use_camera, use_lens
         )
         
         # Format date for display
@@ -127,7 +156,7 @@ class PreviewGenerator:
         
         # Add selected metadata from metadata dialog
         if hasattr(self.parent, 'selected_metadata') and self.parent.selected_metadata:
-            preview_metadata = self._get_preview_metadata(preview_file)
+            preview_metadata = self._get_preview_metadata(preview_file, mtime)
             
             for metadata_key, metadata_value in preview_metadata.items():
                 # Skip if this metadata conflicts with main checkboxes
@@ -144,11 +173,19 @@ class PreviewGenerator:
         display_components = self._build_display_components(component_mapping)
         
         # Update the interactive preview
-        self.parent.log(f"🖼️ Debug: Setting preview components: {display_components}")
+        self.parent.log("🖼️ Debug: Setting preview components: %s", display_components)
         self.parent.interactive_preview.set_separator(separator)
         self.parent.interactive_preview.set_components(display_components, "001")
     
-    def _extract_preview_metadata(self, preview_file, use_date, use_camera, use_lens):
+    @staticmethod
+    def _get_mtime(path):
+        """Return the modification time of *path*, or None if it can't be read"""
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def _extract_preview_metadata(self, preview_file, mtime, use_date, use_camera, use_lens):
         """Extract metadata for preview file with caching"""
         date_taken = None
         camera_model = None
@@ -160,9 +197,9 @@ class PreviewGenerator:
             camera_model = "Camera" if use_camera else None
             lens_model = "Lens" if use_lens else None
         else:
-            # EXIF cache: only extract if file changed
-            cache_key = (preview_file, self.parent.exif_method, self.parent.exiftool_path)
-            if os.path.exists(preview_file):
+            # EXIF cache: only extract if the file (or its mtime) changed
+            cache_key = (preview_file, mtime, self.parent.exif_method, self.parent.exiftool_path)
+            if mtime is not None:
                 if not hasattr(self, '_preview_exif_file') or self._preview_exif_file != cache_key:
                     try:
                         date_taken, camera_model, lens_model = self.parent.exif_service.get_selective_cached_exif_data(
@@ -179,6 +216,8 @@ class PreviewGenerator:
                     except Exception as e:
                         with self._preview_exif_lock:
                             self._preview_exif_cache = {'date': None, 'camera': None, 'lens': None}
+                        # Don't let a failed read suppress the next refresh
+                        self._last_preview_key = None
                 else:
                     # Use cached values
                     with self._preview_exif_lock:
@@ -188,7 +227,7 @@ class PreviewGenerator:
             
             # Fallback date extraction
             if not date_taken:
-                date_taken = self._extract_fallback_date(preview_file)
+                date_taken = self._extract_fallback_date(preview_file, mtime)
             
             # Use fallback values for preview if not detected AND checkbox is enabled
             if use_camera and not camera_model:
@@ -204,16 +243,14 @@ class PreviewGenerator:
         
         return date_taken, camera_model, lens_model
     
-    def _extract_fallback_date(self, preview_file):
+    def _extract_fallback_date(self, preview_file, mtime):
         """Extract date from filename or file modification time"""
-        m = re.search(r'(20\d{2})(\d{2})(\d{2})', os.path.basename(preview_file))
+        m = FILENAME_DATE_PATTERN.search(os.path.basename(preview_file))
         if m:
-            return f"{m.group(1)}{m.group(2)}{m.group(3)}"
+            return "".join(m.groups())
         
-        if os.path.exists(preview_file):
-            mtime = os.path.getmtime(preview_file)
-            dt = datetime.datetime.fromtimestamp(mtime)
-            return dt.strftime('%Y%m%d')
+        if mtime is not None:
+            return timestamp_to_date_str(mtime)
         
         return "20250725"
     
@@ -222,34 +259,21 @@ class PreviewGenerator:
         if not date_taken:
             return None
         
-        year = date_taken[:4]
-        month = date_taken[4:6]
-        day = date_taken[6:8]
-        
-        format_map = {
-            "YYYY-MM-DD": f"{year}-{month}-{day}",
-            "YYYY_MM_DD": f"{year}_{month}_{day}",
-            "DD-MM-YYYY": f"{day}-{month}-{year}",
-            "DD_MM_YYYY": f"{day}_{month}_{year}",
-            "YYYYMMDD": f"{year}{month}{day}",
-            "MM-DD-YYYY": f"{month}-{day}-{year}",
-            "MM_DD_YYYY": f"{month}_{day}_{year}",
-        }
-        
-        return format_map.get(date_format, f"{year}-{month}-{day}")
+        template = DATE_FORMAT_TEMPLATES.get(date_format, DEFAULT_DATE_TEMPLATE)
+        return template.format(y=date_taken[:4], m=date_taken[4:6], d=date_taken[6:8])
     
-    def _get_preview_metadata(self, preview_file):
+    def _get_preview_metadata(self, preview_file, mtime):
         """Get metadata for preview file, extracting real values if needed"""
         preview_metadata = self.parent.selected_metadata.copy()
         
-        if self.parent.exif_method and preview_file and os.path.exists(preview_file):
+        if self.parent.exif_method and preview_file and mtime is not None:
             needs_real_metadata = any(
                 value is True for value in self.parent.selected_metadata.values()
             )
             
             if needs_real_metadata:
                 try:
-                    self.parent.log(f"🔍 Preview: Extracting real metadata from {os.path.basename(preview_file)}")
+                    self.parent.log("🔍 Preview: Extracting real metadata from %s", preview_file)
                     real_metadata = self.parent.exif_service.get_all_metadata(preview_file, self.parent.exif_method, self.parent.exiftool_path)
                     
                     # Replace Boolean flags with real values for preview
@@ -289,21 +313,9 @@ class PreviewGenerator:
             return None
         
         # Clean and format different metadata types
-        formatters = {
-            'camera': lambda v: v.replace(' ', '-').replace('/', '-'),
-            'lens': lambda v: v.replace(' ', '-').replace('/', '-'),
-            'date': lambda v: v.split(' ')[0].replace(':', '-') if ' ' in v else v.replace(':', '-'),
-            'iso': lambda v: f"ISO{v}" if str(v).isdigit() else str(v).replace(' ', ''),
-            'aperture': self._format_aperture,
-            'shutter': self._format_shutter,
-            'shutter_speed': self._format_shutter,
-            'focal_length': self._format_focal_length,
-            'resolution': self._format_resolution,
-        }
-        
-        formatter = formatters.get(metadata_key)
+        formatter = self._METADATA_FORMATTERS.get(metadata_key)
         if formatter:
-            return formatter(metadata_value)
+            return formatter(self, metadata_value)
         
         # General cleanup for other metadata
         return str(metadata_value).replace(' ', '-').replace('/', '-').replace(':', '-')
@@ -330,7 +342,7 @@ class PreviewGenerator:
     def _format_focal_length(self, value):
         """Format focal length value"""
         value = str(value)
-        match = re.search(r'(\d+)mm', value)
+        match = FOCAL_LENGTH_PATTERN.search(value)
         if match:
             return f"{match.group(1)}mm"
         return value.replace(' ', '-')
@@ -343,34 +355,24 @@ class PreviewGenerator:
             return mp_part.replace(' ', '').replace('.', '-')
         return value.replace(' ', '-').replace('x', 'x')
     
+    # Per-key formatters for format_metadata_for_filename, built once with
+    # the class rather than on every call; each takes (self, value)
+    _METADATA_FORMATTERS = {
+        'camera': lambda self, v: v.replace(' ', '-').replace('/', '-'),
+        'lens': lambda self, v: v.replace(' ', '-').replace('/', '-'),
+        'date': lambda self, v: v.split(' ')[0].replace(':', '-') if ' ' in v else v.replace(':', '-'),
+        'iso': lambda self, v: f"ISO{v}" if str(v).isdigit() else str(v).replace(' ', ''),
+        'aperture': _format_aperture,
+        'shutter': _format_shutter,
+        'shutter_speed': _format_shutter,
+        'focal_length': _format_focal_length,
+        'resolution': _format_resolution,
+    }
+    
     def validate_and_update_preview(self):
         """Validate input and update preview"""
         self.update_preview()
     
     def show_preview_info(self):
         """Show interactive preview help dialog"""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton
-        
-        dialog = QDialog(self.parent)
-        dialog.setWindowTitle("Interactive Preview Help")
-        dialog.setModal(True)
-        dialog.resize(400, 300)
-        layout = QVBoxLayout(dialog)
-        
-        info_text = QLabel("""
-Interactive Preview shows how your filenames will look.
-
-You can:
-• Drag and drop components to reorder them
-• See real-time preview of your filename format
-• Components are separated by your chosen separator
-
-The number (001) is always at the end and auto-increments.
-        """)
-        info_text.setWordWrap(True)
-        layout.addWidget(info_text)
-        
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(dialog.accept)
-        layout.addWidget(close_btn)
-        dialog.exec()
+        show_preview_info(self.parent)
@@ -7,6 +7,7 @@ and EXIF data display components.
 """
 
 import os
+import threading
 import webbrowser
 from PyQt6.QtWidgets import (
     QListWidget, QDialog, QVBoxLayout, QLabel, QPushButton, QPlainTextEdit,
@@ -90,9 +91,6 @@ class InteractivePreviewWidget(QListWidget):
         
         # Add drag & drop visual feedback
         self.setAcceptDrops(True)
-        self.setDragDropMode(QListWidget.DragDropMode.InternalMove)
-        self.setDefaultDropAction(Qt.DropAction.MoveAction)
-        self.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         
         # Connect signals
         self.itemChanged.connect(self._on_item_changed)
@@ -104,13 +102,31 @@ class InteractivePreviewWidget(QListWidget):
         self.components = []
         self.fixed_number = "001"
         
+        # Component font and its metrics are constant (same as in CSS), so
+        # build them once instead of on every update_display() redraw
+        self._item_font = QFont("Arial", 8)
+        self._item_font.setBold(True)
+        self._metrics = QFontMetrics(self._item_font)
+        
+        # Render the empty state now; set_components() skips unchanged lists
+        self.update_display()
+        
     def set_separator(self, separator):
-        """Set the separator character"""
-        self.separator = "" if separator == "None" else separator
+        """Set the separator character (no redraw if it is unchanged)"""
+        separator = "" if separator == "None" else separator
+        if separator == self.separator:
+            return
+        self.separator = separator
         self.update_display()
     
     def set_components(self, components, number="001"):
-        """Set the filename components to display"""
+        """Set the filename components to display (no redraw if unchanged).
+
+        ``self.components`` always mirrors the displayed items - drops
+        update it in place - so an equal list means nothing to rebuild.
+        """
+        if components == self.components and number == self.fixed_number:
+            return
         self.components = components.copy()
         self.fixed_number = number  # Keep for backward compatibility but not used anymore
         self.update_display()
@@ -133,32 +149,10 @@ class InteractivePreviewWidget(QListWidget):
         # Add components and separators in the correct order
         for i, component in enumerate(self.components):
             # Add the component
-            item = QListWidgetItem(component)
+            item = QListWidgetItem()
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled)
             item.setData(Qt.ItemDataRole.UserRole, "component")
-            
-            # FLEXIBLE: Highlight number component but make it draggable
-            if component == "001" or component.isdigit():
-                item.setBackground(Qt.GlobalColor.yellow)
-                item.setToolTip("Sequential number (draggable)")
-            else:
-                item.setToolTip("Drag to swap position with another component")
-            
-            # Calculate optimal size for the component based on text
-            # Use QFont to measure the text size
-            font = QFont("Arial", 8)  # Same font as in CSS
-            font.setBold(True)
-            metrics = QFontMetrics(font)
-            text_width = metrics.horizontalAdvance(component)
-            text_height = metrics.height()
-            
-            # Add 10% padding around the text (3px horizontal, 1px vertical padding from CSS)
-            optimal_width = text_width + 17  # 3px padding on each side
-            optimal_height = text_height   # 1px padding top and bottom
-            
-            # Set the size hint to fit the text perfectly
-            item.setSizeHint(QSize(optimal_width, optimal_height))
-            item.setFont(font)  # Ensure consistent font
+            self._set_component_item(item, component)
             
             self.addItem(item)
             
@@ -173,6 +167,48 @@ class InteractivePreviewWidget(QListWidget):
                 
         # FLEXIBLE: No more fixed number - it's now part of components
     
+    def _set_component_item(self, item, component):
+        """Apply text, highlight, tooltip and size hint for a component item"""
+        item.setText(component)
+        
+        # FLEXIBLE: Highlight number component but make it draggable
+        if component == "001" or component.isdigit():
+            item.setBackground(Qt.GlobalColor.yellow)
+            item.setToolTip("Sequential number (draggable)")
+        else:
+            item.setData(Qt.ItemDataRole.BackgroundRole, None)
+            item.setToolTip("Drag to swap position with another component")
+        
+        # Calculate optimal size for the component based on text
+        text_width = self._metrics.horizontalAdvance(component)
+        text_height = self._metrics.height()
+        
+        # Add 10% padding around the text (3px horizontal, 1px vertical padding from CSS)
+        optimal_width = text_width + 17  # 3px padding on each side
+        optimal_height = text_height   # 1px padding top and bottom
+        
+        # Set the size hint to fit the text perfectly
+        item.setSizeHint(QSize(optimal_width, optimal_height))
+        item.setFont(self._item_font)  # Ensure consistent font
+    
+    def _swap_component_items(self, index_a, index_b):
+        """Swap two displayed components in place without rebuilding the list.
+        
+        Returns False if the displayed items no longer line up with
+        self.components, in which case the caller should do a full rebuild.
+        """
+        component_items = [
+            self.item(row) for row in range(self.count())
+            if self.item(row).data(Qt.ItemDataRole.UserRole) == "component"
+        ]
+        if len(component_items) != len(self.components):
+            return False
+        
+        self._set_component_item(component_items[index_a], self.components[index_a])
+        self._set_component_item(component_items[index_b], self.components[index_b])
+        self.viewport().update()
+        return True
+    
     def get_component_order(self):
         """Get the current order of components (excluding separators and number)"""
         order = []
@@ -254,8 +290,10 @@ class InteractivePreviewWidget(QListWidget):
             # Swap positions
             self.components[dragged_index], self.components[drop_index] = self.components[drop_index], self.components[dragged_index]
             
-            # Update display and emit signal
-            self.update_display()
+            # A pure swap only changes two items - update them in place and
+            # fall back to a full rebuild only if the display is out of sync
+            if not self._swap_component_items(dragged_index, drop_index):
+                self.update_display()
             self.order_changed.emit(self.get_component_order())
         
         event.accept()
@@ -315,7 +353,10 @@ with EXIF metadata integration and customizable naming patterns.
         button_layout = QHBoxLayout()
         
         github_button = QPushButton("🌐 View on GitHub")
-        github_button.clicked.connect(lambda: webbrowser.open("https://github.com/YahyaShubbak/renamepy"))
+        # webbrowser.open can block while launching a browser - keep it off the UI thread
+        github_button.clicked.connect(lambda: threading.Thread(
+            target=webbrowser.open, args=("https://github.com/YahyaShubbak/renamepy",), daemon=True
+        ).start())
         github_button.setStyleSheet("QPushButton { padding: 8px 16px; background-color: #0066cc; color: white; border: none; border-radius: 4px; }")
         
         close_button = QPushButton("Close")
@@ -442,6 +483,21 @@ The interactive preview shows you exactly how your files will be renamed, with a
         layout.addLayout(button_layout)
 
 
+class ClickableLabel(QLabel):
+    """QLabel that emits ``clicked`` on a left mouse press.
+
+    Used for the small info icons next to the option labels, so the click
+    is an ordinary signal connection rather than a replaced event handler.
+    """
+
+    clicked = pyqtSignal()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+
+
 class CollapsibleSection(QWidget):
     """A collapsible section with a toggle-button header.
 